@@ -0,0 +1,116 @@
+"""
+Argon2 cost calibration for the current machine.
+
+For every memory cost and parallelism combination, raises the time cost until the
+p95 verify latency exceeds ``--target-ms``, and keeps the strongest setting that
+still meets it. The recommendation is the candidate with the most memory-hard
+work (memory cost x time cost) within the target, printed as settings::
+
+    PYTHONPATH=src python -m benchmarks.argon2_calibration --target-ms 50 --samples 20
+
+Run it on every instance type the service is deployed to and pick the weakest
+recommendation, or set the values per deployment. Keep in mind that
+``HASHER__MAX_CONCURRENCY`` hashes run at once, each holding ``memory_cost`` KiB.
+"""
+
+import argparse
+import os
+import time
+from dataclasses import dataclass
+
+from benchmarks.utils import percentile
+from infrastructure.security.hasher import Argon2Hasher
+
+PASSWORD = "correct horse battery staple"
+
+MIN_MEMORY_COST = 19456
+MIN_TIME_COST = 2
+"""Lowest cost worth recommending (OWASP: 19 MiB, 2 iterations)."""
+
+
+@dataclass(frozen=True)
+class Candidate:
+    time_cost: int
+    memory_cost: int
+    parallelism: int
+    p50: float
+    p95: float
+
+    @property
+    def strength(self) -> int:
+        return self.time_cost * self.memory_cost
+
+
+def measure(time_cost: int, memory_cost: int, parallelism: int, samples: int) -> Candidate:
+    hasher = Argon2Hasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+    hashed_password = hasher.hash(PASSWORD)
+    latencies = []
+    for _ in range(samples):
+        started_at = time.perf_counter()
+        hasher.verify(PASSWORD, hashed_password)
+        latencies.append(time.perf_counter() - started_at)
+    return Candidate(
+        time_cost=time_cost,
+        memory_cost=memory_cost,
+        parallelism=parallelism,
+        p50=percentile(latencies, 50),
+        p95=percentile(latencies, 95),
+    )
+
+
+def calibrate(
+    target: float, samples: int, memory_costs: list[int], parallelisms: list[int], max_time_cost: int
+) -> list[Candidate]:
+    """Return the strongest candidate within ``target`` seconds at p95 for every (memory, parallelism) pair."""
+    candidates = []
+    for memory_cost in memory_costs:
+        for parallelism in parallelisms:
+            best = None
+            for time_cost in range(1, max_time_cost + 1):
+                candidate = measure(time_cost, memory_cost, parallelism, samples)
+                print(
+                    f"m={memory_cost:<7} t={time_cost:<3} p={parallelism:<3} "
+                    f"p50={candidate.p50 * 1000:8.2f}ms p95={candidate.p95 * 1000:8.2f}ms"
+                )
+                if candidate.p95 > target:
+                    break
+                best = candidate
+            if best is not None:
+                candidates.append(best)
+    return candidates
+
+
+def recommend(candidates: list[Candidate]) -> Candidate | None:
+    acceptable = [
+        candidate
+        for candidate in candidates
+        if candidate.memory_cost >= MIN_MEMORY_COST and candidate.time_cost >= MIN_TIME_COST
+    ]
+    if not acceptable:
+        return None
+    # Prefer the most work; among equals, fewer lanes leave more cores to concurrent logins.
+    return max(acceptable, key=lambda candidate: (candidate.strength, -candidate.parallelism))
+
+
+def main(target_ms: float, samples: int, memory_costs: list[int], parallelisms: list[int], max_time_cost: int) -> None:
+    print(f"cpu cores: {os.cpu_count()}, target p95: {target_ms}ms")
+    candidates = calibrate(target_ms / 1000, samples, memory_costs, parallelisms, max_time_cost)
+    recommendation = recommend(candidates)
+    if recommendation is None:
+        print(f"No setting of at least m={MIN_MEMORY_COST}, t={MIN_TIME_COST} meets {target_ms}ms at p95.")
+        return
+    print(f"\nRecommended (p95={recommendation.p95 * 1000:.2f}ms):")
+    print(f"HASHER__TIME_COST={recommendation.time_cost}")
+    print(f"HASHER__MEMORY_COST={recommendation.memory_cost}")
+    print(f"HASHER__PARALLELISM={recommendation.parallelism}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target-ms", type=float, default=50.0, help="p95 verify latency to stay within")
+    parser.add_argument("--samples", type=int, default=20, help="verifications measured per setting")
+    parser.add_argument("--memory-costs", type=int, nargs="+", default=[19456, 47104, 65536, 131072])
+    parser.add_argument("--parallelisms", type=int, nargs="+", default=sorted({1, 2, min(4, os.cpu_count() or 1)}))
+    parser.add_argument("--max-time-cost", type=int, default=10)
+    args = parser.parse_args()
+    main(args.target_ms, args.samples, args.memory_costs, args.parallelisms, args.max_time_cost)
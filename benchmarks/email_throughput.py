@@ -0,0 +1,156 @@
+"""
+Email delivery throughput against a local SMTP stand-in.
+
+Starts :class:`benchmarks.smtp_server.BenchmarkSMTPServer` in a background thread
+with its own event loop and drives ``SMTPEmailSender`` and ``ConsoleEmailSender``
+(writing to ``/dev/null``) in two ways:
+
+- batch: one ``deliver`` call with ``--messages`` messages, as the outbox
+  worker sends them;
+- single: ``--messages`` one-message ``deliver`` calls, ``--concurrency`` at a
+  time, as request handlers sending directly would.
+
+Prints messages/sec, delivery outcomes and, for single calls, latency
+percentiles. Compare pool sizes, or inject latency and failures::
+
+    PYTHONPATH=src python -m benchmarks.email_throughput --messages 10000 --pool-sizes 1 4 8 --latency-ms 5
+
+The server waits ``--latency-ms`` (1 ms by default) before every reply, standing
+in for the network round trip. Pooled connections only pay off by overlapping
+those waits: with no latency the client and the server are both CPU bound on one
+interpreter, so every pool size measures the same throughput.
+"""
+
+import argparse
+import asyncio
+import collections
+import os
+import time
+from typing import Sequence
+
+from application.dto.email_message import DeliveryResultDTO, EmailMessageContent, EmailMessageDTO
+from application.ports.email_sender import EmailSender
+from benchmarks.smtp_server import BenchmarkSMTPServer, serve_in_thread
+from benchmarks.utils import format_latency, percentile
+from infrastructure.email.console import ConsoleEmailSender
+from infrastructure.email.smtp import SMTPEmailSender
+
+
+def build_messages(count: int) -> list[EmailMessageDTO]:
+    return [
+        EmailMessageDTO(
+            to_email=f"user{i}@example.com",
+            subject="Confirm your email",
+            content=EmailMessageContent(type="text/plain", body=f"Your confirmation code is {i:06d}."),
+            alternative_contents=(
+                EmailMessageContent(type="text/html", body=f"<p>Your confirmation code is <b>{i:06d}</b>.</p>"),
+            ),
+        )
+        for i in range(count)
+    ]
+
+
+def report(name: str, results: Sequence[DeliveryResultDTO], elapsed: float, latencies: Sequence[float] = ()) -> None:
+    outcomes = collections.Counter(result.status for result in results)
+    retried = sum(result.attempts > 1 for result in results)
+    print(
+        f"{name:<28} messages/s={len(results) / elapsed:9.1f} "
+        f"sent={outcomes['sent']} failed={outcomes['failed']} rejected={outcomes['rejected']} retried={retried}"
+    )
+    if latencies:
+        print(format_latency("  latency", latencies) + f" p95={percentile(latencies, 95) * 1000:8.3f}ms")
+
+
+async def measure_batch(name: str, sender: EmailSender, messages: list[EmailMessageDTO]) -> None:
+    started_at = time.perf_counter()
+    results = await sender.deliver(*messages)
+    elapsed = time.perf_counter() - started_at
+    report(f"{name} batch", results, elapsed)
+
+
+async def measure_single(name: str, sender: EmailSender, messages: list[EmailMessageDTO], concurrency: int) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def send(message: EmailMessageDTO) -> DeliveryResultDTO:
+        async with semaphore:
+            started_at = time.perf_counter()
+            (result,) = await sender.deliver(message)
+            latencies.append(time.perf_counter() - started_at)
+            return result
+
+    started_at = time.perf_counter()
+    results = await asyncio.gather(*(send(message) for message in messages))
+    elapsed = time.perf_counter() - started_at
+    report(f"{name} single", results, elapsed, latencies)
+
+
+async def main(
+    count: int,
+    pool_sizes: list[int],
+    max_messages_per_connection: int,
+    concurrency: int,
+    server: BenchmarkSMTPServer,
+) -> None:
+    messages = build_messages(count)
+    with open(os.devnull, "w") as devnull:
+        console = ConsoleEmailSender(stream=devnull)
+        await measure_batch("console", console, messages)
+        await measure_single("console", console, messages, concurrency)
+
+    with serve_in_thread(server):
+        for pool_size in pool_sizes:
+            sender = SMTPEmailSender(
+                host=server.host,
+                port=server.port,
+                username="benchmark",
+                password="benchmark",
+                use_tls=False,
+                use_ssl=False,
+                from_email="noreply@example.com",
+                pool_size=pool_size,
+                max_messages_per_connection=max_messages_per_connection,
+                retry_base_delay=0.01,
+                retry_max_delay=0.1,
+            )
+            name = f"smtp pool={pool_size}"
+            try:
+                await measure_batch(name, sender, messages)
+                await measure_single(name, sender, messages, concurrency)
+            finally:
+                await sender.close()
+    print(
+        f"server: connections={server.connections} accepted={server.accepted} "
+        f"refused={server.refused} disconnected={server.disconnected}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=10_000)
+    parser.add_argument("--pool-sizes", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--max-messages-per-connection", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=32, help="concurrent single-message calls")
+    parser.add_argument("--latency-ms", type=float, default=1.0, help="server delay before every reply")
+    parser.add_argument("--data-latency-ms", type=float, default=0.0, help="server delay before accepting a message")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="share of recipients refused")
+    parser.add_argument("--failure-code", type=int, default=451)
+    parser.add_argument("--disconnect-rate", type=float, default=0.0, help="share of messages dropping the connection")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    asyncio.run(
+        main(
+            args.messages,
+            args.pool_sizes,
+            args.max_messages_per_connection,
+            args.concurrency,
+            BenchmarkSMTPServer(
+                reply_latency=args.latency_ms / 1000,
+                data_latency=args.data_latency_ms / 1000,
+                failure_rate=args.failure_rate,
+                failure_code=args.failure_code,
+                disconnect_rate=args.disconnect_rate,
+                seed=args.seed,
+            ),
+        )
+    )
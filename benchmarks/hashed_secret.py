@@ -0,0 +1,97 @@
+"""
+Construction and field access cost of the ``HashedSecret`` value object.
+
+Constructs (and so validates) hashes and reads every MCF field ``--reads`` times,
+the way bulk imports (one read) and rehash checks (several reads) do. A reference
+class that splits the string on every property access is measured next to it.
+Prints hashes/sec and the memory held per instance::
+
+    PYTHONPATH=src python -m benchmarks.hashed_secret --hashes 1000000 --reads 1 --repeat 3
+"""
+
+import argparse
+import base64
+import gc
+import os
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from domain.value_objects.hashed_secret import HashedSecret
+
+
+@dataclass(frozen=True)
+class SplittingHashedSecret:
+    """The previous implementation: every property splits the string again."""
+
+    value: str
+
+    def __post_init__(self) -> None:
+        parts = self.value.split("$")
+        if len(parts) < 5 or not parts[1] or not parts[-2] or not parts[-1]:
+            raise ValueError("Invalid MCF format")
+
+    @property
+    def algorithm(self) -> str:
+        return self.value.split("$")[1]
+
+    @property
+    def options(self) -> str:
+        return "$".join(self.value.split("$")[2:-2])
+
+    @property
+    def salt(self) -> str:
+        return self.value.split("$")[-2]
+
+    @property
+    def hash(self) -> str:
+        return self.value.split("$")[-1]
+
+
+def construct_and_access(factory: Callable[[str], Any], values: list[str], reads: int) -> None:
+    for value in values:
+        hashed_secret = factory(value)
+        for _ in range(reads):
+            hashed_secret.algorithm, hashed_secret.options, hashed_secret.salt, hashed_secret.hash  # noqa: B018
+
+
+def measure(name: str, factory: Callable[[str], Any], values: list[str], reads: int, repeat: int) -> None:
+    timings = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        construct_and_access(factory, values, reads)
+        timings.append(time.perf_counter() - started_at)
+    best = min(timings)
+
+    gc.collect()
+    tracemalloc.start()
+    instances = [factory(value) for value in values[:10_000]]
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    per_instance = held / len(instances)
+    print(
+        f"{name:<24} hashes={len(values):<9} best={best * 1000:9.1f}ms "
+        f"rate={len(values) / best:11.0f} hashes/s memory={per_instance:6.0f}B/instance"
+    )
+
+
+def main(count: int, reads: int, repeat: int) -> None:
+    values = [
+        "$argon2id$v=19$m=65536,t=3,p=4$"
+        + base64.b64encode(os.urandom(16)).decode().rstrip("=")
+        + "$"
+        + base64.b64encode(os.urandom(32)).decode().rstrip("=")
+        for _ in range(count)
+    ]
+    measure("HashedSecret", HashedSecret, values, reads, repeat)
+    measure("split on every access", SplittingHashedSecret, values, reads, repeat)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hashes", type=int, default=1_000_000)
+    parser.add_argument("--reads", type=int, default=1, help="times every field is read per hash")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    main(args.hashes, args.reads, args.repeat)
@@ -0,0 +1,90 @@
+"""
+Concurrent login throughput of password verification.
+
+Runs ``--logins`` concurrent ``verify`` calls the way a request handler would:
+inline on the event loop, and through ``ExecutorHasher`` on thread and process
+pools. Prints logins/sec, logins/sec per core used, per-login latency and the
+worst event loop stall observed by a ticker task while the logins were running::
+
+    PYTHONPATH=src python -m benchmarks.hasher_concurrency --logins 200 --workers 1 2 4
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from typing import Awaitable, Callable
+
+from benchmarks.utils import format_latency
+from core.config import HasherSettings
+from domain.value_objects.hashed_secret import HashedSecret
+from infrastructure.security.hasher import ExecutorHasher, PasswordHasher, create_hasher_executor
+
+PASSWORD = "correct horse battery staple"
+
+
+async def watch_event_loop(stalls: list[float], interval: float = 0.005) -> None:
+    while True:
+        started_at = time.perf_counter()
+        await asyncio.sleep(interval)
+        stalls.append(time.perf_counter() - started_at - interval)
+
+
+async def measure(name: str, verify: Callable[[], Awaitable[bool]], logins: int, cores: int) -> None:
+    latencies: list[float] = []
+    stalls: list[float] = [0.0]
+
+    async def login() -> None:
+        started_at = time.perf_counter()
+        assert await verify()
+        latencies.append(time.perf_counter() - started_at)
+
+    watcher = asyncio.create_task(watch_event_loop(stalls))
+    started_at = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - started_at
+    # Give the watcher a chance to record the stall of the last tick before stopping it.
+    await asyncio.sleep(0.01)
+    watcher.cancel()
+
+    rate = logins / elapsed
+    print(f"{name:<28} logins/s={rate:8.1f} per core={rate / cores:8.1f} max loop stall={max(stalls) * 1000:8.1f}ms")
+    print(format_latency("  login latency", latencies))
+
+
+async def main(logins: int, workers: list[int]) -> None:
+    password_hasher = PasswordHasher()
+    hashed_password: HashedSecret = password_hasher.hash(PASSWORD)
+    cpu_count = os.cpu_count() or 1
+    print(f"cpu cores: {cpu_count}")
+
+    async def verify_inline() -> bool:
+        return password_hasher.verify(PASSWORD, hashed_password)
+
+    await measure("inline", verify_inline, logins, 1)
+
+    for executor in ("thread", "process"):
+        for max_workers in workers:
+            hasher = ExecutorHasher(
+                hasher=password_hasher,
+                executor=create_hasher_executor(HasherSettings(executor=executor, max_workers=max_workers)),
+            )
+            try:
+                # Warm the pool up so process start-up is not measured.
+                await asyncio.gather(*(hasher.verify(PASSWORD, hashed_password) for _ in range(max_workers)))
+                await measure(
+                    f"{executor} pool x{max_workers}",
+                    lambda: hasher.verify(PASSWORD, hashed_password),
+                    logins,
+                    min(max_workers, cpu_count),
+                )
+            finally:
+                hasher.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, sorted(set(args.workers))))
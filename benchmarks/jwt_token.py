@@ -0,0 +1,64 @@
+"""
+Parsing throughput of the ``JwtToken`` value object.
+
+Constructs (and so validates) tokens and reads their header and payload the way
+a request handler does, next to PyJWT's unverified decode as a reference, and
+prints tokens/sec::
+
+    PYTHONPATH=src python -m benchmarks.jwt_token --tokens 10000 --repeat 5
+"""
+
+import argparse
+import time
+import uuid
+from typing import Any, Callable
+
+import jwt
+
+from domain.value_objects.jwt_token import JwtToken
+
+SECRET = "benchmark-secret-of-at-least-32-bytes"
+
+
+def parse_value_object(token: str) -> Any:
+    jwt_token = JwtToken(token)
+    return jwt_token.header_obj["alg"], jwt_token.payload_obj["sub"], jwt_token.payload_obj["exp"]
+
+
+def parse_pyjwt(token: str) -> Any:
+    header = jwt.get_unverified_header(token)
+    payload = jwt.decode(token, options={"verify_signature": False})
+    return header["alg"], payload["sub"], payload["exp"]
+
+
+def measure(name: str, parse: Callable[[str], Any], tokens: list[str], repeat: int) -> None:
+    timings = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        for token in tokens:
+            parse(token)
+        timings.append(time.perf_counter() - started_at)
+    best = min(timings)
+    print(f"{name:<24} tokens={len(tokens):<8} best={best * 1000:9.3f}ms rate={len(tokens) / best:12.0f} tokens/s")
+
+
+def main(count: int, repeat: int) -> None:
+    tokens = [
+        jwt.encode(
+            {"sub": str(uuid.uuid4()), "exp": 2_000_000_000, "scope": "user"},
+            SECRET,
+            algorithm="HS256",
+            headers={"typ": "JWT"},
+        )
+        for _ in range(count)
+    ]
+    measure("JwtToken", parse_value_object, tokens, repeat)
+    measure("pyjwt (unverified)", parse_pyjwt, tokens, repeat)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tokens", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.tokens, args.repeat)
@@ -0,0 +1,72 @@
+"""
+Row mapping throughput of ``EntityMapper`` for ``UserModel`` <-> ``User``.
+
+Measures loading ORM rows into entities and dumping entities into column values,
+next to a hand-written conversion as the lower bound, and prints rows/sec::
+
+    PYTHONPATH=src python -m benchmarks.mapper --rows 10000 --repeat 5
+"""
+
+import argparse
+import time
+import uuid
+from typing import Any, Callable, Sequence
+
+from domain.entities.user import User
+from domain.value_objects.email import Email
+from domain.value_objects.hashed_secret import HashedSecret
+from infrastructure.database.mapper import get_mapper
+from infrastructure.database.models import UserModel
+
+HASHED_PASSWORD = "$argon2id$v=19$m=65536,t=3,p=4$c2FsdGJhc2Ux$ZGF0YWhhc2gx"
+
+
+def load_by_hand(model: UserModel) -> User:
+    return User(
+        id=model.id,
+        email=Email(model.email),
+        hashed_password=HashedSecret(model.hashed_password),
+        is_active=model.is_active,
+    )
+
+
+def dump_by_hand(user: User) -> dict[str, Any]:
+    return {
+        "id": user.id,
+        "email": user.email.value,
+        "hashed_password": user.hashed_password.value,
+        "is_active": user.is_active,
+    }
+
+
+def measure(name: str, convert: Callable[[Any], Any], items: Sequence[Any], repeat: int) -> None:
+    timings = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        for item in items:
+            convert(item)
+        timings.append(time.perf_counter() - started_at)
+    best = min(timings)
+    print(f"{name:<20} rows={len(items):<8} best={best * 1000:9.3f}ms rate={len(items) / best:12.0f} rows/s")
+
+
+def main(rows: int, repeat: int) -> None:
+    mapper = get_mapper()
+    models = [
+        UserModel(id=uuid.uuid4(), email=f"user-{index}@example.com", hashed_password=HASHED_PASSWORD, is_active=True)
+        for index in range(rows)
+    ]
+    users = [mapper.load(model, User) for model in models]
+
+    measure("load (mapper)", lambda model: mapper.load(model, User), models, repeat)
+    measure("load (by hand)", load_by_hand, models, repeat)
+    measure("dump (mapper)", mapper.dump, users, repeat)
+    measure("dump (by hand)", dump_by_hand, users, repeat)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.rows, args.repeat)
@@ -0,0 +1,94 @@
+"""
+Bulk insert throughput for the ``users`` table.
+
+Compares the per-row path (``session.add_all`` + ``commit`` + ``refresh`` for every
+row) with ``UserRepository.add_many``, which sends a single ``INSERT ... RETURNING``
+statement, and prints rows/sec for each batch size. Both paths start from ``User``
+entities, so mapping entities to column values is part of the timing.
+
+Requires a migrated PostgreSQL database configured through the usual settings::
+
+    PYTHONPATH=src python -m benchmarks.repository_add_many --rows 1000 100000
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from typing import Awaitable, Callable
+
+from sqlalchemy import delete
+
+from core.config import get_settings
+from domain.entities.user import User
+from domain.value_objects.email import Email
+from domain.value_objects.hashed_secret import HashedSecret
+from infrastructure.database.engine import create_engine_from_settings
+from infrastructure.database.mapper import get_mapper
+from infrastructure.database.models import UserModel
+from infrastructure.database.repository.user import UserRepository
+from infrastructure.database.session import get_async_session_factory
+
+HASHED_PASSWORD = "$argon2id$v=19$m=65536,t=3,p=4$c2FsdGJhc2Ux$ZGF0YWhhc2gx"
+
+
+def build_users(count: int, prefix: str) -> list[User]:
+    hashed_password = HashedSecret(HASHED_PASSWORD)
+    return [
+        User(
+            id=uuid.uuid4(),
+            email=Email(f"{prefix}-{index}@bench.local"),
+            hashed_password=hashed_password,
+            is_active=False,
+        )
+        for index in range(count)
+    ]
+
+
+async def insert_per_row(repository: UserRepository, users: list[User]) -> None:
+    models = [UserModel(**repository.mapper.dump(user)) for user in users]
+    async with repository.session_factory() as session:
+        session.add_all(models)
+        await session.commit()
+        for model in models:
+            await session.refresh(model)
+
+
+async def insert_add_many(repository: UserRepository, users: list[User]) -> None:
+    await repository.add_many(users)
+
+
+async def measure(
+    name: str,
+    method: Callable[[UserRepository, list[User]], Awaitable[None]],
+    repository: UserRepository,
+    count: int,
+) -> None:
+    prefix = f"bench-{uuid.uuid4().hex[:8]}"
+    users = build_users(count, prefix)
+    started_at = time.perf_counter()
+    await method(repository, users)
+    elapsed = time.perf_counter() - started_at
+    print(f"{name:<18} rows={count:<8} time={elapsed:8.3f}s rate={count / elapsed:12.0f} rows/s")
+
+    async with repository.session_factory() as session:
+        await session.execute(delete(UserModel).where(UserModel.email.like(f"{prefix}-%")))
+        await session.commit()
+
+
+async def main(row_counts: list[int]) -> None:
+    engine = create_engine_from_settings(get_settings())
+    repository = UserRepository(get_async_session_factory(engine), UserModel, User, get_mapper())
+    try:
+        for count in row_counts:
+            await measure("add_all+refresh", insert_per_row, repository, count)
+            await measure("add_many", insert_add_many, repository, count)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 100_000])
+    args = parser.parse_args()
+    asyncio.run(main(args.rows))
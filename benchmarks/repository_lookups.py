@@ -0,0 +1,99 @@
+"""
+Latency of the hot user lookups (by id and by email).
+
+Runs each lookup with a statement rebuilt on every call and with the cached
+statement used by ``BaseSQLAlchemyRepository``, with server-side prepared
+statements disabled and enabled, and prints p50/p99 latency plus the compiled
+cache hit ratio.
+
+Requires a migrated PostgreSQL database configured through the usual settings::
+
+    PYTHONPATH=src python -m benchmarks.repository_lookups --users 1000 --lookups 20000
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from typing import Any
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from benchmarks.utils import format_latency
+from core.config import get_settings
+from infrastructure.database.engine import create_engine_from_settings
+from infrastructure.database.models import UserModel
+from infrastructure.database.repository.user import UserRepository
+from infrastructure.database.session import get_async_session_factory
+from infrastructure.database.statement_cache import get_statement_cache_statistics
+
+HASHED_PASSWORD = "$argon2id$v=19$m=65536,t=3,p=4$c2FsdGJhc2Ux$ZGF0YWhhc2gx"
+
+
+async def lookup_rebuilt(session: AsyncSession, repository: UserRepository, filters: dict[str, Any]) -> None:
+    result = await session.execute(select(UserModel).filter_by(**filters))
+    result.scalars().first()
+
+
+async def lookup_cached(session: AsyncSession, repository: UserRepository, filters: dict[str, Any]) -> None:
+    stmt, params = repository._query("select", filters)
+    result = await session.execute(stmt, params)
+    result.scalars().first()
+
+
+async def run(prepare_threshold: int | None, rows: list[dict[str, Any]], lookups: int) -> None:
+    settings = get_settings()
+    settings = settings.model_copy(
+        update={"database": settings.database.model_copy(update={"prepare_threshold": prepare_threshold})}
+    )
+    engine = create_engine_from_settings(settings)
+    session_factory = get_async_session_factory(engine)
+    repository = UserRepository(session_factory, UserModel, None, None)  # type: ignore[arg-type]
+    try:
+        for name, method in (("rebuilt", lookup_rebuilt), ("cached", lookup_cached)):
+            for column in ("id", "email"):
+                samples = []
+                async with session_factory() as session:
+                    for _ in range(lookups):
+                        filters = {column: random.choice(rows)[column]}
+                        started_at = time.perf_counter()
+                        await method(session, repository, filters)
+                        samples.append(time.perf_counter() - started_at)
+                label = f"{name} by {column} prepare={prepare_threshold}"
+                print(format_latency(label, samples))
+        statistics = get_statement_cache_statistics(engine)
+        if statistics is not None:
+            print(f"compiled cache hit ratio: {statistics.hit_ratio:.4f}")
+    finally:
+        await engine.dispose()
+
+
+async def main(users: int, lookups: int) -> None:
+    prefix = f"bench-{uuid.uuid4().hex[:8]}"
+    rows = [
+        {"id": uuid.uuid4(), "email": f"{prefix}-{index}@bench.local", "hashed_password": HASHED_PASSWORD}
+        for index in range(users)
+    ]
+    engine = create_engine_from_settings(get_settings())
+    session_factory = get_async_session_factory(engine)
+    async with session_factory() as session:
+        await session.execute(insert(UserModel), rows)
+        await session.commit()
+    try:
+        for prepare_threshold in (None, 0):
+            await run(prepare_threshold, rows, lookups)
+    finally:
+        async with session_factory() as session:
+            await session.execute(delete(UserModel).where(UserModel.email.like(f"{prefix}-%")))
+            await session.commit()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--lookups", type=int, default=20_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.users, args.lookups))
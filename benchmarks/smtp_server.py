@@ -0,0 +1,186 @@
+"""
+In-process SMTP server for benchmarks, with latency and failure injection.
+
+Speaks the subset of SMTP that ``aiosmtplib`` uses: EHLO/HELO, AUTH PLAIN, MAIL,
+RCPT, DATA, RSET, NOOP and QUIT, without TLS. Messages are counted and dropped.
+Can also be run on its own, to point a local instance of the service at it::
+
+    PYTHONPATH=src python -m benchmarks.smtp_server --port 1025 --latency-ms 5 --failure-rate 0.01
+"""
+
+import argparse
+import asyncio
+import contextlib
+import random
+import threading
+from dataclasses import dataclass, field
+from typing import Iterator
+
+REPLIES = {
+    "EHLO": ("250-localhost", "250-AUTH PLAIN", "250-8BITMIME", "250 SIZE 10485760"),
+    "HELO": ("250 localhost",),
+    "AUTH": ("235 2.7.0 Authentication successful",),
+    "MAIL": ("250 OK",),
+    "RSET": ("250 OK",),
+    "NOOP": ("250 OK",),
+}
+"""Fixed replies of commands that are always accepted."""
+
+
+@dataclass
+class BenchmarkSMTPServer:
+    """
+    A minimal SMTP server running on the current event loop.
+
+    :param host: Address to listen on.
+    :param port: Port to listen on; 0 picks a free one.
+    :param reply_latency: Seconds added before every reply.
+    :param data_latency: Seconds added before accepting a message, after its data was received.
+    :param failure_rate: Share of recipients refused with ``failure_code``.
+    :param failure_code: Reply code of refused recipients, e.g. 451 (transient) or 550 (permanent).
+    :param disconnect_rate: Share of messages after whose data the server drops the connection.
+    :param seed: Seed of the failure injection, for repeatable runs.
+    """
+
+    host: str = "127.0.0.1"
+    port: int = 0
+    reply_latency: float = 0.0
+    data_latency: float = 0.0
+    failure_rate: float = 0.0
+    failure_code: int = 451
+    disconnect_rate: float = 0.0
+    seed: int | None = None
+    accepted: int = field(default=0, init=False)
+    refused: int = field(default=0, init=False)
+    disconnected: int = field(default=0, init=False)
+    connections: int = field(default=0, init=False)
+    _server: asyncio.Server | None = field(default=None, init=False, repr=False)
+    _random: random.Random = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._random = random.Random(self.seed)
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            self._server.close_clients()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "BenchmarkSMTPServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.stop()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            await self._reply(writer, "220 localhost benchmark ESMTP")
+            while line := await reader.readline():
+                verb = line.decode("ascii", "replace").split(" ", 1)[0].strip().upper()
+                if verb in REPLIES:
+                    await self._reply(writer, *REPLIES[verb])
+                elif verb == "RCPT":
+                    await self._recipient(writer)
+                elif verb == "DATA":
+                    if not await self._data(reader, writer):
+                        break
+                elif verb == "QUIT":
+                    await self._reply(writer, "221 Bye")
+                    break
+                else:
+                    await self._reply(writer, "502 Command not implemented")
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _recipient(self, writer: asyncio.StreamWriter) -> None:
+        if self.failure_rate and self._random.random() < self.failure_rate:
+            self.refused += 1
+            await self._reply(writer, f"{self.failure_code} Recipient refused")
+        else:
+            await self._reply(writer, "250 OK")
+
+    async def _data(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> bool:
+        """Receives one message; returns False when the connection is dropped instead."""
+        await self._reply(writer, "354 End data with <CR><LF>.<CR><LF>")
+        while await reader.readline() not in {b".\r\n", b""}:
+            pass
+        if self.disconnect_rate and self._random.random() < self.disconnect_rate:
+            self.disconnected += 1
+            return False
+        if self.data_latency:
+            await asyncio.sleep(self.data_latency)
+        self.accepted += 1
+        await self._reply(writer, "250 OK queued")
+        return True
+
+    async def _reply(self, writer: asyncio.StreamWriter, *lines: str) -> None:
+        if self.reply_latency:
+            await asyncio.sleep(self.reply_latency)
+        writer.write("".join(f"{line}\r\n" for line in lines).encode("ascii"))
+        await writer.drain()
+
+
+@contextlib.contextmanager
+def serve_in_thread(server: BenchmarkSMTPServer) -> Iterator[BenchmarkSMTPServer]:
+    """
+    Run the server on its own event loop in a background thread.
+
+    Callers on another loop then do not wait for the server's work to be scheduled
+    between their own tasks. The counters are safe to read once the block exits.
+
+    :param server: The server to run.
+    :return: Context manager yielding the started server.
+    """
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name="benchmark-smtp-server", daemon=True)
+    thread.start()
+    try:
+        asyncio.run_coroutine_threadsafe(server.start(), loop).result()
+        try:
+            yield server
+        finally:
+            asyncio.run_coroutine_threadsafe(server.stop(), loop).result()
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+async def serve(server: BenchmarkSMTPServer) -> None:
+    async with server:
+        print(f"Listening on {server.host}:{server.port}")
+        await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=1025)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="delay before every reply")
+    parser.add_argument("--data-latency-ms", type=float, default=0.0, help="delay before accepting a message")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="share of recipients refused")
+    parser.add_argument("--failure-code", type=int, default=451)
+    parser.add_argument("--disconnect-rate", type=float, default=0.0, help="share of messages dropping the connection")
+    args = parser.parse_args()
+    asyncio.run(
+        serve(
+            BenchmarkSMTPServer(
+                host=args.host,
+                port=args.port,
+                reply_latency=args.latency_ms / 1000,
+                data_latency=args.data_latency_ms / 1000,
+                failure_rate=args.failure_rate,
+                failure_code=args.failure_code,
+                disconnect_rate=args.disconnect_rate,
+            )
+        )
+    )
@@ -0,0 +1,19 @@
+import statistics
+from typing import Sequence
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """Return the ``q``-th percentile (0-100) of the samples using the nearest-rank method."""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(q / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def format_latency(name: str, samples: Sequence[float]) -> str:
+    """Format latency samples given in seconds as a single report line in milliseconds."""
+    return (
+        f"{name:<28} n={len(samples):<7} "
+        f"mean={statistics.fmean(samples) * 1000:8.3f}ms "
+        f"p50={percentile(samples, 50) * 1000:8.3f}ms "
+        f"p99={percentile(samples, 99) * 1000:8.3f}ms"
+    )
@@ -0,0 +1,47 @@
+"""Create revoked refresh tokens table
+
+Revision ID: 7c1e4f2a9b3d
+Revises: 4ba7d64948cd
+Create Date: 2025-06-14 12:10:42.518305
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c1e4f2a9b3d"
+down_revision: Union[str, None] = "4ba7d64948cd"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "revoked_refresh_tokens",
+        sa.Column("hashed_token", sa.Text(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.Column(
+            "revoked_at",
+            sa.DateTime(),
+            server_default=sa.text("timezone('utc', now())"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("hashed_token", name=op.f("pk_revoked_refresh_tokens")),
+    )
+    op.create_index(
+        op.f("ix_revoked_refresh_tokens_expires_at"), "revoked_refresh_tokens", ["expires_at"], unique=False
+    )
+    op.create_index(
+        op.f("ix_revoked_refresh_tokens_revoked_at"), "revoked_refresh_tokens", ["revoked_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_revoked_refresh_tokens_revoked_at"), table_name="revoked_refresh_tokens")
+    op.drop_index(op.f("ix_revoked_refresh_tokens_expires_at"), table_name="revoked_refresh_tokens")
+    op.drop_table("revoked_refresh_tokens")
@@ -16,3 +16,28 @@ class EmailMessageDTO:
     subject: str
     content: EmailMessageContent
     alternative_contents: Sequence[EmailMessageContent]
+
+
+@dataclass(frozen=True)
+class DeliveryResultDTO:
+    """
+    Outcome of delivering one message.
+
+    :param message: The message.
+    :param status: ``sent``; ``failed`` when transient errors outlasted the retries,
+        so delivering it later may succeed; ``rejected`` when the server refused it
+        permanently.
+    :param attempts: Number of delivery attempts made.
+    :param code: SMTP reply code of the last failure, if the server sent one.
+    :param error: Description of the last failure.
+    """
+
+    message: EmailMessageDTO
+    status: Literal["sent", "failed", "rejected"]
+    attempts: int = 1
+    code: int | None = None
+    error: str | None = None
+
+    @property
+    def sent(self) -> bool:
+        return self.status == "sent"
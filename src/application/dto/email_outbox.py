@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from application.dto.email_message import EmailMessageDTO
+
+
+@dataclass(frozen=True)
+class OutboxEntryDTO:
+    """
+    A message claimed from the email outbox.
+
+    :param id: Id of the outbox entry.
+    :param message: The message to deliver.
+    :param attempts: Delivery attempts so far, including the current one.
+    """
+
+    id: int
+    message: EmailMessageDTO
+    attempts: int
+
+
+@dataclass(frozen=True)
+class OutboxLagDTO:
+    """
+    Backlog of the email outbox.
+
+    :param pending: Number of messages waiting for delivery.
+    :param oldest_age: Seconds the oldest waiting message has been queued, 0 when the outbox is empty.
+    """
+
+    pending: int
+    oldest_age: float
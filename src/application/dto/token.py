@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import datetime
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from domain.entities.refresh_token import RefreshToken
+from domain.value_objects.jwt_token import JwtToken
+
+
+@dataclass(frozen=True)
+class TokenClaimsDTO:
+    """
+    Verified claims of an access or refresh token.
+
+    :param subject: Id of the user the token was issued to.
+    :param token_id: Unique id of the token (``jti``).
+    :param token_type: ``access`` or ``refresh``.
+    :param issued_at: Issue time.
+    :param expires_at: Expiration time.
+    :param extra: Any other claims.
+    """
+
+    subject: uuid.UUID
+    token_id: str
+    token_type: Literal["access", "refresh"]
+    issued_at: datetime.datetime
+    expires_at: datetime.datetime
+    extra: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class TokenPairDTO:
+    """
+    Access and refresh tokens issued together.
+
+    :param access_token: Signed access token.
+    :param refresh_token: Signed refresh token.
+    :param refresh: Refresh token entity to persist; it holds the keyed digest of the refresh token id.
+    :param expires_in: Lifetime of the access token in seconds.
+    """
+
+    access_token: JwtToken
+    refresh_token: JwtToken
+    refresh: RefreshToken
+    expires_in: int
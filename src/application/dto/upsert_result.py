@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(frozen=True)
+class UpsertResultDTO:
+    """
+    Outcome of a bulk upsert.
+
+    :param inserted: Number of new rows.
+    :param updated: Number of existing rows that were updated.
+    :param ids: Primary keys of the inserted and updated rows, in no particular order.
+    """
+
+    inserted: int
+    updated: int
+    ids: list[Any] = field(default_factory=list)
@@ -0,0 +1,6 @@
+class ApplicationError(Exception):
+    pass
+
+
+class HashingOverloaded(ApplicationError):
+    pass
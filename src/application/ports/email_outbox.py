@@ -0,0 +1,71 @@
+from typing import Protocol, Sequence
+
+from application.dto.email_message import EmailMessageDTO
+from application.dto.email_outbox import OutboxEntryDTO, OutboxLagDTO
+
+
+class EmailOutboxProtocol(Protocol):
+    """
+    Durable queue of outgoing email.
+
+    Messages are enqueued in the caller's transaction and delivered later by
+    background workers, so a request never waits on the mail server.
+    """
+
+    async def enqueue(self, *messages: EmailMessageDTO) -> None:
+        """
+        Queue messages for delivery.
+
+        :param messages: Messages to deliver.
+        """
+        ...
+
+    async def claim(self, limit: int, visibility_timeout: float, max_attempts: int) -> list[OutboxEntryDTO]:
+        """
+        Claim messages that are due for delivery.
+
+        A claimed message is hidden from other workers for ``visibility_timeout``
+        seconds. If it is not completed by then, it is delivered again.
+
+        :param limit: Maximum number of messages to claim.
+        :param visibility_timeout: Seconds the claimed messages stay hidden.
+        :param max_attempts: Messages already attempted this many times are not claimed.
+        :return: The claimed messages, oldest first.
+        """
+        ...
+
+    async def extend(self, ids: Sequence[int], visibility_timeout: float) -> None:
+        """
+        Keep claimed messages hidden while they are still being delivered.
+
+        :param ids: Ids of the claimed entries.
+        :param visibility_timeout: Seconds from now the messages stay hidden.
+        """
+        ...
+
+    async def complete(self, ids: Sequence[int]) -> None:
+        """
+        Remove delivered messages from the outbox.
+
+        :param ids: Ids of the delivered entries.
+        """
+        ...
+
+    async def remove_exhausted(self, limit: int, max_attempts: int) -> list[OutboxEntryDTO]:
+        """
+        Remove messages that used up their delivery attempts and are no longer claimed.
+
+        :param limit: Maximum number of messages to remove.
+        :param max_attempts: Messages attempted this many times are removed.
+        :return: The removed messages.
+        """
+        ...
+
+    async def lag(self, max_attempts: int) -> OutboxLagDTO:
+        """
+        Measure the backlog of messages still to be delivered.
+
+        :param max_attempts: Messages attempted this many times are not counted.
+        :return: The number of waiting messages and the age of the oldest one.
+        """
+        ...
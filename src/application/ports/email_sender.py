@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import Protocol
 
-from application.dto.email_message import EmailMessageDTO
+from application.dto.email_message import DeliveryResultDTO, EmailMessageDTO
 
 
 @dataclass()
@@ -9,6 +10,14 @@ class EmailSender(ABC):
     name: str
 
     @abstractmethod
+    async def deliver(self, *messages: EmailMessageDTO) -> list[DeliveryResultDTO]:
+        """
+        Sends a sequence of email messages asynchronously and reports the outcome of each.
+
+        :param messages: Sequence of EmailMessage instances to be sent.
+        :return: One result per message, in the order of ``messages``.
+        """
+
     async def send_messages(self, *messages: EmailMessageDTO) -> int:
         """
         Sends a sequence of email messages asynchronously.
@@ -16,3 +25,19 @@ class EmailSender(ABC):
         :param messages: Sequence of EmailMessage instances to be sent.
         :return: Number of messages successfully sent.
         """
+        return sum(result.sent for result in await self.deliver(*messages))
+
+    async def close(self) -> None:
+        """Release the connections held by the sender, if any."""
+
+
+class DeadLetterSinkProtocol(Protocol):
+    """Destination of messages the mail server refused permanently or that could not be delivered."""
+
+    async def put(self, result: DeliveryResultDTO) -> None:
+        """
+        Store an undeliverable message for inspection.
+
+        :param result: Delivery result of the undeliverable message.
+        """
+        ...
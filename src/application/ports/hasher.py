@@ -7,3 +7,23 @@ class HasherProtocol(Protocol):
     def verify(self, raw_secret: str, hashed_secret: HashedSecret) -> bool: ...
 
     def hash(self, raw_secret: str) -> HashedSecret: ...
+
+    def verify_and_update(self, raw_secret: str, hashed_secret: HashedSecret) -> tuple[bool, HashedSecret | None]:
+        """
+        Verify a secret and rehash it if the stored hash does not follow the current policy.
+
+        :param raw_secret: Secret to check.
+        :param hashed_secret: Stored hash.
+        :return: Whether the secret matches, and the new hash to store if it is outdated.
+        """
+        ...
+
+
+class AsyncHasherProtocol(Protocol):
+    async def verify(self, raw_secret: str, hashed_secret: HashedSecret) -> bool: ...
+
+    async def hash(self, raw_secret: str) -> HashedSecret: ...
+
+    async def verify_and_update(
+        self, raw_secret: str, hashed_secret: HashedSecret
+    ) -> tuple[bool, HashedSecret | None]: ...
@@ -1,4 +1,8 @@
-from typing import Any, Protocol
+from typing import Any, AsyncIterator, Protocol, Sequence
+
+from application.dto.upsert_result import UpsertResultDTO
+from domain.entities.user import User
+from domain.value_objects.hashed_secret import HashedSecret
 
 
 class RepositoryProtocol[Entity](Protocol):
@@ -26,6 +30,26 @@ class RepositoryProtocol[Entity](Protocol):
         """
         ...
 
+    async def upsert_many(
+        self,
+        data: list[Entity],
+        conflict_fields: Sequence[str],
+        update_fields: Sequence[str] | None = None,
+        *,
+        batch_size: int = 1000,
+    ) -> UpsertResultDTO:
+        """
+        Insert entities, updating or skipping the ones that conflict with existing records.
+
+        :param data: A list of Entity instances to be saved.
+        :param conflict_fields: Fields of the unique constraint that detects existing records.
+        :param update_fields: Fields overwritten on conflict; None updates every field except the
+            conflict fields and the identifier, an empty sequence leaves existing records untouched.
+        :param batch_size: Number of entities written per statement.
+        :return: Counts of inserted and updated records.
+        """
+        ...
+
     async def get(self, **filters: Any) -> None | Entity:
         """
         Retrieve a single entity matching the given criteria.
@@ -44,6 +68,16 @@ class RepositoryProtocol[Entity](Protocol):
         """
         ...
 
+    def iter_many(self, *, batch_size: int = 1000, **filters: Any) -> AsyncIterator[Entity]:
+        """
+        Stream all entities that match the given criteria in batches.
+
+        :param batch_size: Number of records fetched from the storage per batch.
+        :param filters: Field-based lookup parameters.
+        :return: An async iterator yielding matching Entities one by one.
+        """
+        ...
+
     async def update(self, filters: dict[str, Any], data: dict[str, Any]) -> int:
         """
         Update one or more entities.
@@ -80,3 +114,17 @@ class RepositoryProtocol[Entity](Protocol):
         :return: The total count of matching entities.
         """
         ...
+
+
+class UserRepositoryProtocol(RepositoryProtocol[User], Protocol):
+    """Repository of users."""
+
+    async def update_hashed_password(self, user: User, hashed_password: HashedSecret) -> bool:
+        """
+        Replace the password hash of a user, unless it was changed concurrently.
+
+        :param user: User as loaded, holding the hash being replaced.
+        :param hashed_password: New hash.
+        :return: True if the hash was replaced.
+        """
+        ...
@@ -0,0 +1,38 @@
+import uuid
+from typing import Any, Protocol
+
+from application.dto.token import TokenClaimsDTO, TokenPairDTO
+
+
+class TokenServiceProtocol(Protocol):
+    def issue(self, user_id: uuid.UUID, **claims: Any) -> TokenPairDTO:
+        """
+        Issue an access/refresh token pair.
+
+        :param user_id: Id of the user the tokens are issued to.
+        :param claims: Extra claims of the access token.
+        :return: The signed tokens and the refresh token entity to persist.
+        """
+        ...
+
+    def verify_access_token(self, token: str) -> TokenClaimsDTO:
+        """
+        Verify an access token.
+
+        :param token: Token in compact serialization.
+        :return: Verified claims.
+        :raises InvalidJWTToken: If the token is malformed, forged or not an access token.
+        :raises ExpiredJWTToken: If the token has expired.
+        """
+        ...
+
+    def verify_refresh_token(self, token: str) -> TokenClaimsDTO:
+        """
+        Verify a refresh token.
+
+        :param token: Token in compact serialization.
+        :return: Verified claims.
+        :raises InvalidJWTToken: If the token is malformed, forged or not a refresh token.
+        :raises ExpiredJWTToken: If the token has expired.
+        """
+        ...
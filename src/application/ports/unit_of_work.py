@@ -0,0 +1,28 @@
+from types import TracebackType
+from typing import Protocol, Self
+
+
+class UnitOfWorkProtocol(Protocol):
+    """
+    Transaction scope shared by every repository used inside it.
+
+    Entering the unit of work starts a transaction; leaving it commits the
+    transaction, or rolls it back if an exception was raised.
+    """
+
+    async def __aenter__(self) -> Self: ...
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None: ...
+
+    async def commit(self) -> None:
+        """Commit all changes made in the unit of work so far."""
+        ...
+
+    async def rollback(self) -> None:
+        """Discard all changes made in the unit of work so far."""
+        ...
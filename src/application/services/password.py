@@ -0,0 +1,43 @@
+from dataclasses import dataclass
+
+from application.ports.hasher import AsyncHasherProtocol
+from application.ports.repository import UserRepositoryProtocol
+from core.logging import get_logger
+from domain.entities.user import User
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class PasswordVerifier:
+    """
+    Checks user passwords and upgrades outdated hashes on successful login.
+
+    When the hashing policy changes, every stored hash is moved to the new
+    parameters the next time its owner logs in, without a mass migration.
+
+    :param hasher: Hasher holding the current policy.
+    :param users: Repository the upgraded hash is stored in.
+    """
+
+    hasher: AsyncHasherProtocol
+    users: UserRepositoryProtocol
+
+    async def verify(self, user: User, raw_password: str) -> bool:
+        """
+        Check a password of a user, storing a rehashed password if the stored one is outdated.
+
+        :param user: User logging in; its hash is replaced in place once the upgrade is stored.
+        :param raw_password: Password to check.
+        :return: Whether the password matches.
+        """
+        verified, hashed_password = await self.hasher.verify_and_update(raw_password, user.hashed_password)
+        if not verified or hashed_password is None:
+            return verified
+        try:
+            if await self.users.update_hashed_password(user, hashed_password):
+                user.hashed_password = hashed_password
+        except Exception:
+            # The password was correct; a failed upgrade is retried on the next login.
+            logger.warning("Could not store the upgraded password hash of user %s", user.id, exc_info=True)
+        return verified
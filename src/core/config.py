@@ -4,7 +4,7 @@ from pathlib import Path
 from typing import Any, Literal
 
 from msgspec import field
-from pydantic import EmailStr, Field
+from pydantic import EmailStr, Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 PROJECT_DIR = Path(__file__).parent.parent.parent.resolve()
@@ -20,8 +20,130 @@ class PostgresConnection(BaseSettings):
     engine: str = Field(default="postgresql", frozen=True)
     driver: str = Field(default="psycopg", frozen=True)
 
+    pool_mode: Literal["queue", "null", "pgbouncer"] = Field(
+        default="queue",
+        description=(
+            "Connection pooling mode: 'queue' keeps a pool of persistent connections, "
+            "'null' opens a connection per checkout, 'pgbouncer' delegates pooling to "
+            "PgBouncer in transaction mode"
+        ),
+    )
+    pool_size: int = Field(default=5, description="Number of persistent connections kept in the pool")
+    pool_max_overflow: int = Field(default=10, description="Connections allowed above pool_size under load")
+    pool_recycle: int = Field(default=1800, description="Seconds after which a pooled connection is reopened")
+    pool_pre_ping: bool = Field(default=True, description="Test connections for liveness on checkout")
+    pool_timeout: float = Field(default=30.0, description="Seconds to wait for a free connection")
+    insert_page_size: int = Field(default=1000, description="Rows per INSERT statement in bulk inserts")
+    prepare_threshold: int | None = Field(
+        default=2,
+        description="Executions of a query on a connection before it is prepared server-side; None disables",
+    )
+    query_cache_size: int = Field(default=500, description="Size of the SQLAlchemy compiled statement cache")
+
+    replica_hosts: list[str] = Field(
+        default_factory=list,
+        description="Read replicas as 'host' or 'host:port'; they share the database name and credentials",
+    )
+    replica_ejection_seconds: float = Field(
+        default=30.0, description="Seconds a failed replica is excluded from read routing"
+    )
+
+    def get_url(self, host: str | None = None, port: int | None = None) -> str:
+        host = host or self.host
+        port = port or self.port
+        return f"{self.engine}+{self.driver}://{self.username}:{self.password}@{host}:{port}/{self.name}"
+
+    def get_replica_urls(self) -> list[str]:
+        urls = []
+        for replica in self.replica_hosts:
+            host, _, port = replica.partition(":")
+            urls.append(self.get_url(host=host, port=int(port) if port else None))
+        return urls
+
+
+class RedisConnection(BaseSettings):
+    host: str
+    port: int = 6379
+    db: int = 0
+    password: str | None = None
+
+    user_cache_ttl: int = Field(default=300, description="Seconds a cached user stays valid")
+    user_cache_negative_ttl: int = Field(default=30, description="Seconds a cached 'user not found' stays valid")
+
     def get_url(self) -> str:
-        return f"{self.engine}+{self.driver}://{self.username}:{self.password}@{self.host}:{self.port}/{self.name}"
+        credentials = f":{self.password}@" if self.password else ""
+        return f"redis://{credentials}{self.host}:{self.port}/{self.db}"
+
+
+class HasherSettings(BaseSettings):
+    time_cost: int = Field(default=3, description="Argon2 iterations")
+    memory_cost: int = Field(default=65536, description="Argon2 memory per hash in KiB")
+    parallelism: int = Field(default=4, description="Argon2 lanes per hash")
+
+    executor: Literal["thread", "process"] = Field(
+        default="thread",
+        description="Pool that runs password hashing off the event loop: 'thread' or 'process'",
+    )
+    max_workers: int | None = Field(
+        default=None, description="Number of hashing workers; defaults to the number of CPU cores"
+    )
+    max_concurrency: int | None = Field(
+        default=None,
+        description="Hashes allowed to run at once, bounding hashing memory; defaults to the number of workers",
+    )
+    max_queue: int = Field(default=64, description="Hash calls allowed to wait for a free slot")
+    queue_timeout: float = Field(default=1.0, description="Seconds a hash call may wait for a free slot")
+
+
+class TokenHasherSettings(BaseSettings):
+    keys: dict[str, SecretStr] = Field(
+        description="HMAC keys of token digests by key id; keep retired keys until their tokens expire",
+    )
+    current_key_id: str = Field(description="Id of the key new tokens are hashed with")
+
+
+class JwtKeySettings(BaseSettings):
+    kid: str = Field(description="Key id published in the 'kid' header of signed tokens")
+    algorithm: Literal["RS256", "EdDSA", "HS256"] = Field(default="RS256", description="Signing algorithm")
+    private_key: SecretStr | None = Field(default=None, description="PEM private key, or the shared secret for HS256")
+    private_key_file: Path | None = Field(default=None, description="File holding the private key or secret")
+    public_key: str | None = Field(
+        default=None, description="PEM public key; derived from the private key when not set"
+    )
+
+    def read_private_key(self) -> bytes | None:
+        if self.private_key is not None:
+            return self.private_key.get_secret_value().encode()
+        if self.private_key_file is not None:
+            return self.private_key_file.read_bytes()
+        return None
+
+
+class JwtSettings(BaseSettings):
+    keys: list[JwtKeySettings] = Field(description="Keys accepted for verification")
+    signing_kid: str = Field(description="Id of the key new tokens are signed with")
+    issuer: str = Field(description="Value of the 'iss' claim")
+    audience: str | None = Field(default=None, description="Value of the 'aud' claim")
+    access_token_ttl: int = Field(default=900, description="Lifetime of access tokens in seconds")
+    refresh_token_ttl: int = Field(default=30 * 24 * 3600, description="Lifetime of refresh tokens in seconds")
+    verified_cache_size: int = Field(default=10_000, description="Recently verified access tokens kept in memory")
+    jwks_max_age: int = Field(
+        default=300, description="Seconds clients may cache the JWKS; keep it well below the key rotation overlap"
+    )
+
+
+class RevocationFilterSettings(BaseSettings):
+    capacity: int = Field(default=1_000_000, description="Revoked refresh tokens the local filter is sized for")
+    error_rate: float = Field(
+        default=0.001, gt=0, lt=1, description="False-positive rate of the local filter at full capacity"
+    )
+    sync_interval: float = Field(
+        default=5.0, description="Seconds between syncs; revocations on other instances take this long to apply"
+    )
+    sync_overlap: float = Field(default=10.0, description="Seconds of revocations re-read by every sync")
+    rebuild_interval: float = Field(
+        default=3600.0, description="Seconds between full rebuilds dropping expired entries"
+    )
 
 
 class EmailSMTPConfig(BaseSettings):
@@ -32,14 +154,44 @@ class EmailSMTPConfig(BaseSettings):
     password: str = Field(description="SMTP password or API secret")
     use_tls: bool = Field(default=True, description="Enable STARTTLS")
     use_ssl: bool = Field(default=False, description="Enable SSL/TLS")
+    pool_size: int = Field(default=4, ge=1, description="Maximum number of concurrent SMTP connections")
+    max_messages_per_connection: int = Field(
+        default=100, ge=1, description="Maximum number of messages sent over one SMTP connection"
+    )
+    idle_timeout: float = Field(
+        default=60.0, description="Seconds an unused SMTP connection is kept open; keep it below the server's timeout"
+    )
+    health_check_interval: float = Field(
+        default=10.0, description="Idle seconds after which an SMTP connection is checked with NOOP before reuse"
+    )
+    max_retries: int = Field(default=3, ge=0, description="Retries of a message after a 4xx reply or connection error")
+    retry_base_delay: float = Field(default=1.0, description="Seconds before the first retry; doubles every retry")
+    retry_max_delay: float = Field(default=30.0, description="Upper bound of the retry delay in seconds")
+    dead_letter_file: Path | None = Field(
+        default=None, description="JSON Lines file for messages refused with a 5xx reply; logged when not set"
+    )
 
 
 class EmailConsoleConfig(BaseSettings):
     backend: Literal["console"]
 
 
+class EmailOutboxSettings(BaseSettings):
+    enabled: bool = Field(default=False, description="Run email outbox delivery workers in the application")
+    concurrency: int = Field(default=2, ge=1, description="Number of concurrent outbox delivery loops")
+    batch_size: int = Field(default=50, ge=1, description="Maximum number of messages claimed per batch")
+    visibility_timeout: float = Field(
+        default=60.0,
+        gt=0,
+        description="Seconds a claimed message is hidden before it is delivered again; extended while it is being sent",
+    )
+    poll_interval: float = Field(default=1.0, description="Seconds an idle delivery loop waits before polling")
+    max_attempts: int = Field(default=5, ge=1, description="Maximum number of delivery attempts per message")
+
+
 class EmailSettings(BaseSettings):
     config: EmailSMTPConfig | EmailConsoleConfig
+    outbox: EmailOutboxSettings = Field(default_factory=EmailOutboxSettings)
     from_email: EmailStr = Field(description="Default from email address")
     from_name: str | None = Field(default=None, description="Default from name")
     templates_dir: Path = Field(
@@ -59,6 +211,11 @@ class Settings(BaseSettings):
     )
     database: PostgresConnection
     email: EmailSettings
+    redis: RedisConnection | None = None
+    hasher: HasherSettings = Field(default_factory=HasherSettings)
+    token_hasher: TokenHasherSettings | None = None
+    jwt: JwtSettings | None = None
+    revocation: RevocationFilterSettings = Field(default_factory=RevocationFilterSettings)
 
 
 def _get_env_file() -> Path:
@@ -18,5 +18,9 @@ class InvalidJWTToken(DomainError):
     pass
 
 
+class ExpiredJWTToken(InvalidJWTToken):
+    pass
+
+
 class InvalidTTL(DomainError):
     pass
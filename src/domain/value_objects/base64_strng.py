@@ -5,25 +5,35 @@ from domain.errors import InvalidBase64Encoding
 from domain.value_objects.base import BaseValueObject
 
 
+def decode_base64url(value: str) -> bytes:
+    """
+    Decode unpadded URL-safe Base64.
+
+    :param value: Encoded string.
+    :return: Decoded bytes.
+    :raises InvalidBase64Encoding: If the value is empty, not ASCII or not valid Base64.
+    """
+    if not value:
+        raise InvalidBase64Encoding("Invalid base64 encoding: empty string is not valid Base64")
+
+    try:
+        encoded = value.encode("ascii")
+    except UnicodeEncodeError:
+        raise InvalidBase64Encoding("Invalid base64 encoding: contains non-ASCII characters")
+
+    try:
+        return base64.urlsafe_b64decode(encoded + b"=" * (-len(encoded) % 4))
+    except Exception as e:
+        raise InvalidBase64Encoding(f"Invalid base64 encoding: {e}")
+
+
 @dataclass(frozen=True)
 class Base64String(BaseValueObject[str]):
     def validate(self) -> None:
         if not isinstance(self.value, str):
             raise InvalidBase64Encoding("Invalid base64 encoding: value must be a string")
 
-        if not self.value:
-            raise InvalidBase64Encoding("Invalid base64 encoding: empty string is not valid Base64")
-
-        try:
-            self.value.encode("ascii")
-        except UnicodeEncodeError:
-            raise InvalidBase64Encoding("Invalid base64 encoding: contains non-ASCII characters")
-
-        try:
-            padding = "=" * (-len(self.value) % 4)
-            base64.urlsafe_b64decode(self.value + padding)
-        except Exception as e:
-            raise InvalidBase64Encoding(f"Invalid base64 encoding: {e}")
+        decode_base64url(self.value)
 
     def as_generic_type(self) -> str:
         return self.value
@@ -1,16 +1,18 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from domain.errors import InvalidHashedSecret
 from domain.value_objects.base import BaseValueObject
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HashedSecret(BaseValueObject):
     """
     Value object for hashed secret.
     Ensures the hashed secret follows the Modular Crypt Format (MCF):
     $<algorithm>$<options>$<salt>$<hash>
 
+    The string is split once, during validation, and its fields are stored in slots.
+
     Properties:
         algorithm: str -- the hashing algorithm identifier
 
@@ -22,31 +24,43 @@ class HashedSecret(BaseValueObject):
     """
 
     value: str
+    _algorithm: str = field(init=False, repr=False, compare=False)
+    _options: str = field(init=False, repr=False, compare=False)
+    _salt: str = field(init=False, repr=False, compare=False)
+    _hash: str = field(init=False, repr=False, compare=False)
 
     @property
     def algorithm(self) -> str:
         """Return the hashing algorithm identifier."""
-        return self.value.split("$")[1]
+        return self._algorithm
 
     @property
     def options(self) -> str:
         """Return the algorithm parameters string."""
-        return "$".join(self.value.split("$")[2:-2])
+        return self._options
 
     @property
     def salt(self) -> str:
         """Return the salt portion of the MCF string."""
-        return self.value.split("$")[-2]
+        return self._salt
 
     @property
     def hash(self) -> str:
         """Return the hash portion of the MCF string."""
-        return self.value.split("$")[-1]
+        return self._hash
 
     def validate(self) -> None:
-        parts = self.value.split("$")
-        if len(parts) < 5 or not parts[1] or not parts[-2] or not parts[-1]:
-            raise InvalidHashedSecret(f"Invalid MCF format: expected at least 4 fields, got {len(parts) - 1}")
+        fields = self.value.count("$")
+        if fields < 4:
+            raise InvalidHashedSecret(f"Invalid MCF format: expected at least 4 fields, got {fields}")
+        _, algorithm, rest = self.value.split("$", 2)
+        options, salt, hash_ = rest.rsplit("$", 2)
+        if not algorithm or not salt or not hash_:
+            raise InvalidHashedSecret(f"Invalid MCF format: expected at least 4 fields, got {fields}")
+        object.__setattr__(self, "_algorithm", algorithm)
+        object.__setattr__(self, "_options", options)
+        object.__setattr__(self, "_salt", salt)
+        object.__setattr__(self, "_hash", hash_)
 
     def as_generic_type(self) -> str:
         return str(self.value)
@@ -1,18 +1,40 @@
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any
 
-from domain.errors import InvalidJWTToken
+from domain.errors import InvalidBase64Encoding, InvalidJWTToken
 from domain.value_objects.base import BaseValueObject
-from domain.value_objects.base64_strng import Base64String
+from domain.value_objects.base64_strng import Base64String, decode_base64url
 
 
 @dataclass(frozen=True)
 class JwtToken(BaseValueObject[str]):
-    @property
+    """
+    Value object for a JWT in compact serialization: ``<header>.<payload>.<signature>``.
+
+    The token is split and decoded once, during validation. The decoded header,
+    payload and signature are kept on the instance, so reading them is free.
+
+    Properties:
+        header_obj: dict[str, Any] -- the decoded JOSE header; do not mutate it
+
+        payload_obj: dict[str, Any] -- the decoded claims; do not mutate it
+
+        signing_input: bytes -- ``<header>.<payload>``, the bytes covered by the signature
+
+        signature_bytes: bytes -- the decoded signature
+    """
+
+    _header_obj: dict[str, Any] = field(init=False, repr=False, compare=False)
+    _payload_obj: dict[str, Any] = field(init=False, repr=False, compare=False)
+    _signing_input: bytes = field(init=False, repr=False, compare=False)
+    _signature_bytes: bytes = field(init=False, repr=False, compare=False)
+
+    @cached_property
     def parts(self) -> tuple[Base64String, Base64String, Base64String]:
-        parts = self.value.split(".")
-        return tuple(Base64String(part) for part in parts)  # type: ignore[return-value]
+        header, payload, signature = self.value.split(".")
+        return Base64String(header), Base64String(payload), Base64String(signature)
 
     @property
     def header(self) -> Base64String:
@@ -28,42 +50,53 @@ class JwtToken(BaseValueObject[str]):
 
     @property
     def header_obj(self) -> dict[str, Any]:
-        decoded = self.header.decode()
-        return json.loads(decoded)
+        return self._header_obj
 
     @property
     def payload_obj(self) -> dict[str, Any]:
-        decoded = self.payload.decode()
-        return json.loads(decoded)
+        return self._payload_obj
 
-    def validate(self) -> None:
-        try:
-            parts = self.parts
-        except Exception as e:
-            raise InvalidJWTToken(f"Invalid JWT token format: {e}")
+    @property
+    def signing_input(self) -> bytes:
+        return self._signing_input
 
-        if len(parts) != 3:
-            raise InvalidJWTToken(f"Invalid JWT token format: expected exactly 3 parts, got {len(parts)}")
+    @property
+    def signature_bytes(self) -> bytes:
+        return self._signature_bytes
+
+    def validate(self) -> None:
+        segments = self.value.split(".") if isinstance(self.value, str) else []
+        if len(segments) != 3:
+            raise InvalidJWTToken(f"Invalid JWT token format: expected exactly 3 parts, got {len(segments)}")
 
         try:
-            _ = self.header_obj
-        except json.JSONDecodeError as e:
-            raise InvalidJWTToken(f"Invalid JWT token format: invalid JSON in header: {e}")
-        except UnicodeDecodeError as e:
-            raise InvalidJWTToken(f"Invalid JWT token format: invalid UTF-8 encoding in header: {e}")
+            header, payload, signature = (decode_base64url(segment) for segment in segments)
+        except InvalidBase64Encoding as e:
+            raise InvalidJWTToken(f"Invalid JWT token format: {e}")
 
-        header = self.header_obj
-        if "alg" not in header:
+        header_obj = self._load_json(header, "header")
+        if "alg" not in header_obj:
             raise InvalidJWTToken("Invalid JWT token format: JWT header missing required field 'alg'")
-        if header.get("typ") != "JWT":
+        if header_obj.get("typ") != "JWT":
             raise InvalidJWTToken("Invalid JWT token format: JWT header 'typ' must be 'JWT'")
+        payload_obj = self._load_json(payload, "payload")
 
-        try:
-            _ = self.payload_obj
-        except json.JSONDecodeError as e:
-            raise InvalidJWTToken(f"Invalid JWT token format: invalid JSON in payload: {e}")
-        except UnicodeDecodeError as e:
-            raise InvalidJWTToken(f"Invalid JWT token format: invalid UTF-8 encoding in payload: {e}")
+        object.__setattr__(self, "_header_obj", header_obj)
+        object.__setattr__(self, "_payload_obj", payload_obj)
+        object.__setattr__(self, "_signing_input", self.value[: self.value.rindex(".")].encode("ascii"))
+        object.__setattr__(self, "_signature_bytes", signature)
 
     def as_generic_type(self) -> str:
         return str(self.value)
+
+    @staticmethod
+    def _load_json(data: bytes, name: str) -> dict[str, Any]:
+        try:
+            decoded = json.loads(data.decode("utf-8"))
+        except UnicodeDecodeError as e:
+            raise InvalidJWTToken(f"Invalid JWT token format: invalid UTF-8 encoding in {name}: {e}")
+        except json.JSONDecodeError as e:
+            raise InvalidJWTToken(f"Invalid JWT token format: invalid JSON in {name}: {e}")
+        if not isinstance(decoded, dict):
+            raise InvalidJWTToken(f"Invalid JWT token format: {name} must be a JSON object")
+        return decoded
@@ -0,0 +1,14 @@
+from redis.asyncio import Redis
+
+from core.config import RedisConnection
+
+
+def create_redis_from_settings(redis_settings: RedisConnection) -> Redis:
+    """Create an asyncio Redis client.
+
+    The hiredis parser is picked up automatically when it is installed.
+
+    :param redis_settings: Redis connection settings.
+    :return: A Redis client with its own connection pool.
+    """
+    return Redis.from_url(redis_settings.get_url())
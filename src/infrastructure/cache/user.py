@@ -0,0 +1,239 @@
+import functools
+import json
+import uuid
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Sequence
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.util import await_only
+
+from application.dto.upsert_result import UpsertResultDTO
+from core.logging import get_logger
+from domain.entities.user import User
+from domain.value_objects.email import Email
+from domain.value_objects.hashed_secret import HashedSecret
+from infrastructure.database.replicas import read_from_primary
+from infrastructure.database.repository.user import UserRepository
+from infrastructure.database.unit_of_work import get_current_session
+
+logger = get_logger(__name__)
+
+_MISSING = b""
+_PENDING_KEYS = "user_cache_pending_keys"
+
+
+def dump_user(user: User) -> bytes:
+    """Serialize a user into a compact JSON array: ``[id, email, hashed_password, is_active]``."""
+    payload = [user.id.hex, user.email.as_generic_type(), user.hashed_password.as_generic_type(), user.is_active]
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def load_user(data: bytes | str) -> User:
+    """Deserialize a user produced by :func:`dump_user`."""
+    user_id, email, hashed_password, is_active = json.loads(data)
+    return User(
+        id=uuid.UUID(hex=user_id),
+        email=Email(email),
+        hashed_password=HashedSecret(hashed_password),
+        is_active=is_active,
+    )
+
+
+@dataclass
+class CachedUserRepository:
+    """
+    Read-through Redis cache in front of ``UserRepository`` lookups by ``id`` or ``email``.
+
+    Found users are cached for ``ttl`` seconds and misses for ``negative_ttl`` seconds.
+    Lookups that fill the cache, and the reads finding the users a write
+    changes, go to the primary, never to a replica.
+    Every write drops the keys of the affected users; other queries go straight to
+    the repository. Redis errors are logged and the lookup falls back to the database.
+    Inside a unit of work the cache is read but never populated, because the
+    session may see uncommitted rows, and keys are dropped only once the unit of
+    work commits: dropped before, a concurrent lookup could cache the old
+    committed row again for ``ttl`` seconds.
+
+    :param repository: Repository used as the source of truth.
+    :param redis: Redis client.
+    :param ttl: Lifetime of a cached user in seconds.
+    :param negative_ttl: Lifetime of a cached miss in seconds.
+    :param key_prefix: Prefix of the cache keys.
+    """
+
+    repository: UserRepository
+    redis: Redis
+    ttl: int
+    negative_ttl: int
+    key_prefix: str = "user"
+
+    async def add(self, data: User) -> User:
+        user = await self.repository.add(data)
+        await self._invalidate([user])
+        return user
+
+    async def add_many(self, data: list[User]) -> list[User]:
+        users = await self.repository.add_many(data)
+        await self._invalidate(users)
+        return users
+
+    async def upsert_many(
+        self,
+        data: list[User],
+        conflict_fields: Sequence[str],
+        update_fields: Sequence[str] | None = None,
+        *,
+        batch_size: int = 1000,
+    ) -> UpsertResultDTO:
+        previous_emails: list[str] = []
+        if "email" not in conflict_fields:
+            # Users are otherwise only unique by id, and an update on it may change the email.
+            with read_from_primary():
+                previous_emails = await self.repository.get_emails([user.id for user in data])
+        result = await self.repository.upsert_many(data, conflict_fields, update_fields, batch_size=batch_size)
+        keys = [self._id_key(user_id) for user_id in result.ids]
+        keys.extend(self._email_key(user.email) for user in data)
+        keys.extend(self._email_key(email) for email in previous_emails)
+        await self._delete(keys)
+        return result
+
+    async def get(self, **filters: Any) -> User | None:
+        key = self._lookup_key(filters)
+        if key is None:
+            return await self.repository.get(**filters)
+
+        try:
+            cached = await self.redis.get(key)
+        except RedisError:
+            logger.warning("User cache read failed for %s", key, exc_info=True)
+            return await self.repository.get(**filters)
+
+        if cached == _MISSING:
+            return None
+        if cached is not None:
+            return load_user(cached)
+
+        if get_current_session() is not None:
+            return await self.repository.get(**filters)
+        # A lagging replica would pin the old row for the whole TTL instead of the replication lag.
+        with read_from_primary():
+            user = await self.repository.get(**filters)
+        await self._store(key, user)
+        return user
+
+    async def get_many(self, **filters: Any) -> list[User]:
+        return await self.repository.get_many(**filters)
+
+    def iter_many(self, *, batch_size: int = 1000, **filters: Any) -> AsyncIterator[User]:
+        return self.repository.iter_many(batch_size=batch_size, **filters)
+
+    async def update(self, filters: dict[str, Any], data: dict[str, Any]) -> int:
+        affected = await self._affected(filters)
+        updated = await self.repository.update(filters, data)
+        keys = self._user_keys(affected)
+        if "email" in data:
+            keys.append(self._email_key(data["email"]))
+        await self._delete(keys)
+        return updated
+
+    async def update_hashed_password(self, user: User, hashed_password: HashedSecret) -> bool:
+        updated = await self.repository.update_hashed_password(user, hashed_password)
+        if updated:
+            await self._invalidate([user])
+        return updated
+
+    async def delete(self, **filters: Any) -> int:
+        affected = await self._affected(filters)
+        deleted = await self.repository.delete(**filters)
+        await self._invalidate(affected)
+        return deleted
+
+    async def exists(self, **filters: Any) -> bool:
+        return await self.repository.exists(**filters)
+
+    async def count(self, **filters: Any) -> int:
+        return await self.repository.count(**filters)
+
+    async def _affected(self, filters: dict[str, Any]) -> list[User]:
+        """Find the users a write will change; a lagging replica could miss some or show old emails."""
+        with read_from_primary():
+            return await self.repository.get_many(**filters)
+
+    def _id_key(self, user_id: uuid.UUID | str) -> str:
+        return f"{self.key_prefix}:id:{uuid.UUID(str(user_id)).hex}"
+
+    def _email_key(self, email: Email | str) -> str:
+        return f"{self.key_prefix}:email:{str(email).casefold()}"
+
+    def _lookup_key(self, filters: dict[str, Any]) -> str | None:
+        if len(filters) != 1:
+            return None
+        if "id" in filters:
+            return self._id_key(filters["id"])
+        if "email" in filters:
+            return self._email_key(filters["email"])
+        return None
+
+    def _user_keys(self, users: list[User]) -> list[str]:
+        keys = []
+        for user in users:
+            keys.append(self._id_key(user.id))
+            keys.append(self._email_key(user.email))
+        return keys
+
+    async def _store(self, key: str, user: User | None) -> None:
+        try:
+            if user is None:
+                await self.redis.set(key, _MISSING, ex=self.negative_ttl)
+                return
+            value = dump_user(user)
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.set(self._id_key(user.id), value, ex=self.ttl)
+                pipe.set(self._email_key(user.email), value, ex=self.ttl)
+                await pipe.execute()
+        except RedisError:
+            logger.warning("User cache write failed for %s", key, exc_info=True)
+
+    async def _invalidate(self, users: list[User]) -> None:
+        await self._delete(self._user_keys(users))
+
+    async def _delete(self, keys: list[str]) -> None:
+        if not keys:
+            return
+        session = get_current_session()
+        if session is not None:
+            self._delete_after_commit(session, keys)
+            return
+        await self._delete_now(keys)
+
+    def _delete_after_commit(self, session: AsyncSession, keys: list[str]) -> None:
+        """Collect ``keys`` on the session and drop them once it commits; a rollback discards them."""
+        info_key = (_PENDING_KEYS, id(self))
+        pending: set[str] | None = session.info.get(info_key)
+        if pending is None:
+            pending = session.info[info_key] = set()
+            event.listen(
+                session.sync_session, "after_commit", functools.partial(self._after_commit, info_key), once=True
+            )
+            event.listen(session.sync_session, "after_rollback", functools.partial(_discard, info_key), once=True)
+        pending.update(keys)
+
+    def _after_commit(self, info_key: tuple[str, int], session: Session) -> None:
+        keys = session.info.pop(info_key, None)
+        if keys:
+            # Runs inside AsyncSession.commit(), whose greenlet can await the Redis client.
+            await_only(self._delete_now(list(keys)))
+
+    async def _delete_now(self, keys: list[str]) -> None:
+        try:
+            await self.redis.delete(*keys)
+        except RedisError:
+            logger.warning("User cache invalidation failed for %d keys", len(keys), exc_info=True)
+
+
+def _discard(info_key: tuple[str, int], session: Session) -> None:
+    session.info.pop(info_key, None)
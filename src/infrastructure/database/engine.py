@@ -1,13 +1,62 @@
+from typing import Any
+
 import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
-from core.config import Settings
+from core.config import PostgresConnection, Settings
+from infrastructure.database.pool import InstrumentedAsyncQueuePool
+from infrastructure.database.statement_cache import instrument_statement_cache
 
 
 def create_engine_from_settings(settings: Settings) -> AsyncEngine:
-    engine = create_async_engine(
-        url=settings.database.get_url(),
-        poolclass=sa.NullPool,
-        future=True,
-    )
+    """Create an async engine configured according to the database pool mode.
+
+    - ``queue``: keeps persistent connections in an instrumented queue pool.
+    - ``null``: opens a new connection for every checkout.
+    - ``pgbouncer``: leaves pooling to PgBouncer in transaction mode, so no
+      connections are held by the application and server-side prepared
+      statements are disabled (they do not survive across transactions).
+
+    Outside of PgBouncer mode psycopg prepares a query on the server once it
+    has been executed ``prepare_threshold`` times on a connection.
+
+    :param settings: Application settings.
+    :return: An AsyncEngine instance.
+    """
+    return _create_engine(settings.database, settings.database.get_url())
+
+
+def create_replica_engines_from_settings(settings: Settings) -> list[AsyncEngine]:
+    """Create one async engine per configured read replica.
+
+    Replica engines use the same pool and statement settings as the primary.
+
+    :param settings: Application settings.
+    :return: A list of AsyncEngine instances, empty if no replicas are configured.
+    """
+    return [_create_engine(settings.database, url) for url in settings.database.get_replica_urls()]
+
+
+def _create_engine(database: PostgresConnection, url: str) -> AsyncEngine:
+    options: dict[str, Any] = {
+        "insertmanyvalues_page_size": database.insert_page_size,
+        "query_cache_size": database.query_cache_size,
+        "connect_args": {"prepare_threshold": database.prepare_threshold},
+    }
+    if database.pool_mode == "queue":
+        options.update(
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=database.pool_size,
+            max_overflow=database.pool_max_overflow,
+            pool_recycle=database.pool_recycle,
+            pool_pre_ping=database.pool_pre_ping,
+            pool_timeout=database.pool_timeout,
+        )
+    elif database.pool_mode == "pgbouncer":
+        options.update(poolclass=sa.NullPool, connect_args={"prepare_threshold": None})
+    else:
+        options.update(poolclass=sa.NullPool)
+
+    engine = create_async_engine(url=url, future=True, **options)
+    instrument_statement_cache(engine)
     return engine
@@ -0,0 +1,241 @@
+import csv
+import json
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Mapping, TextIO, cast
+
+from psycopg import AsyncConnection, sql
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from domain.entities.user import User
+from domain.errors import DomainError
+from domain.value_objects.email import Email
+from domain.value_objects.hashed_secret import HashedSecret
+from infrastructure.database.mapper import EntityMapper
+from infrastructure.database.models import UserModel
+
+USER_COLUMNS = ("id", "email", "hashed_password", "is_active")
+"""Columns written by the import, in ``COPY`` order."""
+
+_TRUE_VALUES = frozenset({"1", "true", "t", "yes", "y"})
+_FALSE_VALUES = frozenset({"", "0", "false", "f", "no", "n"})
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    """
+    A single record read from an import file.
+
+    :param line: Line number of the record in the file.
+    :param data: Decoded record, or ``None`` if the line could not be decoded.
+    :param error: Decoding error, if any.
+    """
+
+    line: int
+    data: dict[str, Any] | None
+    error: str | None = None
+
+
+@dataclass
+class ImportReport:
+    """
+    Running totals of an import.
+
+    :param read: Number of records read from the file.
+    :param imported: Number of users inserted.
+    :param rejected: Number of records written to the reject file.
+    """
+
+    read: int = 0
+    imported: int = 0
+    rejected: int = 0
+    started_at: float = field(default_factory=time.monotonic, repr=False)
+
+    @property
+    def rows_per_second(self) -> float:
+        elapsed = time.monotonic() - self.started_at
+        return self.read / elapsed if elapsed > 0 else 0.0
+
+
+def read_user_records(path: Path) -> Iterator[ImportRecord]:
+    """
+    Stream records from a CSV file with a header row or a JSON Lines file.
+
+    The format is chosen by the file suffix: ``.csv`` or ``.jsonl``/``.ndjson``.
+
+    :param path: Path to the import file.
+    :return: Iterator over the records of the file.
+    :raises ValueError: If the file format is not supported.
+    """
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        return _read_csv(path)
+    if suffix in {".jsonl", ".ndjson"}:
+        return _read_jsonl(path)
+    raise ValueError(f"Unsupported import file format: {path.suffix!r}")
+
+
+def _read_csv(path: Path) -> Iterator[ImportRecord]:
+    with path.open(newline="", encoding="utf-8") as file:
+        reader = csv.DictReader(file)
+        for row in reader:
+            if None in row:
+                # Unquoted MCF hashes contain commas and spill into extra columns.
+                yield ImportRecord(line=reader.line_num, data=None, error="Row has more fields than the header")
+                continue
+            yield ImportRecord(line=reader.line_num, data=row)
+
+
+def _read_jsonl(path: Path) -> Iterator[ImportRecord]:
+    with path.open(encoding="utf-8") as file:
+        for line_number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError as error:
+                yield ImportRecord(line=line_number, data=None, error=f"Invalid JSON: {error}")
+                continue
+            if not isinstance(data, dict):
+                yield ImportRecord(line=line_number, data=None, error="Expected a JSON object")
+                continue
+            yield ImportRecord(line=line_number, data=data)
+
+
+def parse_user_record(data: Mapping[str, Any]) -> User:
+    """
+    Validate an import record and build a user from it.
+
+    ``email`` and ``hashed_password`` are required; ``id`` defaults to a new UUID
+    and ``is_active`` to ``False``.
+
+    :param data: Decoded record.
+    :return: User built from the record.
+    :raises DomainError: If the email or the hashed password is invalid.
+    :raises ValueError: If a field is missing or malformed.
+    """
+    for name in ("email", "hashed_password"):
+        if not data.get(name):
+            raise ValueError(f"Missing required field {name!r}")
+    user_id = data.get("id")
+    return User(
+        id=uuid.UUID(str(user_id)) if user_id else uuid.uuid4(),
+        email=Email(str(data["email"]).strip()),
+        hashed_password=HashedSecret(str(data["hashed_password"])),
+        is_active=_parse_bool(data.get("is_active")),
+    )
+
+
+def _parse_bool(value: Any) -> bool:
+    if value is None or isinstance(value, bool):
+        return bool(value)
+    normalized = str(value).strip().lower()
+    if normalized in _TRUE_VALUES:
+        return True
+    if normalized in _FALSE_VALUES:
+        return False
+    raise ValueError(f"Invalid boolean value: {value!r}")
+
+
+@dataclass
+class UserCopyImporter:
+    """
+    Bulk loads users with ``COPY FROM STDIN``, bypassing the ORM.
+
+    Records are validated with the domain value objects and buffered into batches
+    of ``batch_size`` rows, so memory stays bounded regardless of the file size.
+    Each batch is copied into a temporary staging table and moved into ``users``
+    with ``INSERT ... ON CONFLICT DO NOTHING`` in its own transaction: a batch is
+    either fully applied or not at all, and rows whose id or email already exists
+    are rejected instead of aborting the import.
+
+    Invalid and conflicting records, and repeats of an id or email within one
+    batch, are written to ``rejects`` as JSON lines with the line number, the
+    reason and the original record.
+
+    :param engine: Engine of the primary database; it must use the psycopg driver.
+    :param mapper: Mapper used to dump users into column values.
+    :param batch_size: Number of rows copied per transaction.
+    :param on_progress: Called with the running totals after every batch.
+    """
+
+    engine: AsyncEngine
+    mapper: EntityMapper
+    batch_size: int = 10_000
+    on_progress: Callable[[ImportReport], None] | None = None
+
+    async def run(self, records: Iterable[ImportRecord], rejects: TextIO) -> ImportReport:
+        report = ImportReport()
+        batch: list[tuple[ImportRecord, dict[str, Any]]] = []
+        async with self.engine.connect() as connection:
+            raw_connection = await connection.get_raw_connection()
+            # Only None once the pooled connection was invalidated, never while it is checked out.
+            driver_connection = cast(AsyncConnection[Any], raw_connection.driver_connection)
+            for record in records:
+                report.read += 1
+                if record.data is None:
+                    self._reject(report, rejects, record, record.error or "Invalid record")
+                    continue
+                try:
+                    user = parse_user_record(record.data)
+                except (DomainError, ValueError) as error:
+                    self._reject(report, rejects, record, str(error))
+                    continue
+                batch.append((record, self.mapper.dump(user)))
+                if len(batch) >= self.batch_size:
+                    await self._flush(driver_connection, batch, report, rejects)
+                    batch = []
+            if batch:
+                await self._flush(driver_connection, batch, report, rejects)
+        return report
+
+    async def _flush(
+        self,
+        connection: AsyncConnection[Any],
+        batch: list[tuple[ImportRecord, dict[str, Any]]],
+        report: ImportReport,
+        rejects: TextIO,
+    ) -> None:
+        unique: list[tuple[ImportRecord, dict[str, Any]]] = []
+        seen_ids: set[uuid.UUID] = set()
+        seen_emails: set[str] = set()
+        for record, row in batch:
+            if row["id"] in seen_ids or row["email"] in seen_emails:
+                # ON CONFLICT would keep one of the copies and the others could not be told apart.
+                self._reject(report, rejects, record, "Duplicate id or email in the same batch")
+                continue
+            seen_ids.add(row["id"])
+            seen_emails.add(row["email"])
+            unique.append((record, row))
+        inserted = await self._copy(connection, [row for _, row in unique])
+        for record, row in unique:
+            if row["id"] not in inserted:
+                self._reject(report, rejects, record, "User with this id or email already exists")
+        report.imported += len(inserted)
+        if self.on_progress is not None:
+            self.on_progress(report)
+
+    async def _copy(self, connection: AsyncConnection[Any], rows: list[dict[str, Any]]) -> set[uuid.UUID]:
+        table = sql.Identifier(UserModel.__tablename__)
+        staging = sql.Identifier(f"{UserModel.__tablename__}_import")
+        columns = sql.SQL(", ").join(map(sql.Identifier, USER_COLUMNS))
+        async with connection.transaction(), connection.cursor() as cursor:
+            await cursor.execute(
+                sql.SQL("CREATE TEMPORARY TABLE {} (LIKE {} INCLUDING DEFAULTS) ON COMMIT DROP").format(staging, table)
+            )
+            async with cursor.copy(sql.SQL("COPY {} ({}) FROM STDIN").format(staging, columns)) as copy:
+                for row in rows:
+                    await copy.write_row([row[column] for column in USER_COLUMNS])
+            await cursor.execute(
+                sql.SQL("INSERT INTO {} ({}) SELECT {} FROM {} ON CONFLICT DO NOTHING RETURNING id").format(
+                    table, columns, columns, staging
+                )
+            )
+            return {row[0] for row in await cursor.fetchall()}
+
+    @staticmethod
+    def _reject(report: ImportReport, rejects: TextIO, record: ImportRecord, reason: str) -> None:
+        report.rejected += 1
+        rejects.write(json.dumps({"line": record.line, "error": reason, "record": record.data}, default=str) + "\n")
@@ -1,9 +1,69 @@
-from adaptix import Retort, name_mapping
+import datetime
+import uuid
+from typing import Any, Callable, cast
 
+from adaptix import Retort, as_is_dumper, dumper
+from adaptix.conversion import ConversionRetort, coercer
+
+from domain.entities.user import User
+from domain.value_objects.email import Email
+from domain.value_objects.hashed_secret import HashedSecret
 from infrastructure.database.models import UserModel
 
+VALUE_OBJECTS: tuple[tuple[type[Any], type[Any]], ...] = (
+    (str, Email),
+    (str, HashedSecret),
+)
+"""Value objects stored in a single column, as (column type, value object type) pairs."""
+
+MAPPED_MODELS: tuple[tuple[type[Any], type[Any]], ...] = ((UserModel, User),)
+"""(model, entity) pairs whose converters are generated at startup."""
+
+
+class EntityMapper:
+    """
+    Converts between ORM models and domain entities.
+
+    Converters are generated by adaptix once per (model, entity) pair and cached, so
+    mapping a row is a single call of a function specialized for that pair. Pairs
+    that were not registered up front are compiled on first use.
+    """
+
+    def __init__(self) -> None:
+        conversion_recipe = []
+        dump_recipe = [as_is_dumper(uuid.UUID), as_is_dumper(datetime.datetime)]
+        for column_type, value_object_type in VALUE_OBJECTS:
+            conversion_recipe.append(coercer(column_type, value_object_type, value_object_type))
+            conversion_recipe.append(coercer(value_object_type, column_type, value_object_type.as_generic_type))
+            dump_recipe.append(dumper(value_object_type, value_object_type.as_generic_type))
+        self._conversion_retort = ConversionRetort(recipe=conversion_recipe)
+        self._dump_retort = Retort(recipe=dump_recipe)
+        self._loaders: dict[tuple[type[Any], type[Any]], Callable[[Any], Any]] = {}
+        self._dumpers: dict[type[Any], Callable[[Any], dict[str, Any]]] = {}
+
+    def register(self, model_type: type[Any], entity_type: type[Any]) -> None:
+        """Generate and cache the converters for a (model, entity) pair."""
+        self._loaders[(model_type, entity_type)] = self._conversion_retort.get_converter(model_type, entity_type)
+        self._dumpers[entity_type] = self._dump_retort.get_dumper(entity_type)
+
+    def load[Entity](self, model: Any, entity_type: type[Entity]) -> Entity:
+        """Convert an ORM model instance to a domain entity."""
+        loader = self._loaders.get((type(model), entity_type))
+        if loader is None:
+            self.register(type(model), entity_type)
+            loader = self._loaders[(type(model), entity_type)]
+        return cast(Entity, loader(model))
+
+    def dump(self, entity: Any) -> dict[str, Any]:
+        """Convert a domain entity to a mapping of model column values."""
+        entity_dumper = self._dumpers.get(type(entity))
+        if entity_dumper is None:
+            entity_dumper = self._dumpers[type(entity)] = self._dump_retort.get_dumper(type(entity))
+        return entity_dumper(entity)
+
 
-def get_mapper() -> Retort:
-    mapper = Retort()
-    mapper.extend(recipe=[name_mapping(UserModel, map={"email": ["email", "value"]})])
+def get_mapper() -> EntityMapper:
+    mapper = EntityMapper()
+    for model_type, entity_type in MAPPED_MODELS:
+        mapper.register(model_type, entity_type)
     return mapper
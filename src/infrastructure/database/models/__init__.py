@@ -1,8 +1,12 @@
 from .base import BaseModel, TimestampedModel
+from .email_outbox import EmailOutboxModel
+from .revoked_token import RevokedTokenModel
 from .user import UserModel
 
 __all__ = (
     "BaseModel",
+    "EmailOutboxModel",
+    "RevokedTokenModel",
     "TimestampedModel",
     "UserModel",
 )
@@ -0,0 +1,45 @@
+import datetime
+from typing import Any
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from infrastructure.database.models.base import BaseModel
+
+
+class EmailOutboxModel(BaseModel):
+    """Email messages waiting for delivery; a row is deleted once its message was sent."""
+
+    __tablename__ = "email_outbox"
+
+    id: Mapped[int] = mapped_column(
+        sa.BigInteger,
+        sa.Identity(),
+        primary_key=True,
+    )
+
+    message: Mapped[dict[str, Any]] = mapped_column(
+        JSONB,
+        nullable=False,
+    )
+
+    attempts: Mapped[int] = mapped_column(
+        sa.Integer,
+        nullable=False,
+        default=0,
+        server_default=sa.text("0"),
+    )
+
+    created_at: Mapped[datetime.datetime] = mapped_column(
+        sa.DateTime,
+        nullable=False,
+        server_default=sa.func.timezone("utc", sa.func.now()),
+    )
+
+    available_at: Mapped[datetime.datetime] = mapped_column(
+        sa.DateTime,
+        nullable=False,
+        index=True,
+        server_default=sa.func.timezone("utc", sa.func.now()),
+    )
@@ -0,0 +1,30 @@
+import datetime
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Mapped, mapped_column
+
+from infrastructure.database.models.base import BaseModel
+
+
+class RevokedTokenModel(BaseModel):
+    """Append-only denylist of revoked refresh tokens, keyed by their keyed digest."""
+
+    __tablename__ = "revoked_refresh_tokens"
+
+    hashed_token: Mapped[str] = mapped_column(
+        sa.Text,
+        primary_key=True,
+    )
+
+    expires_at: Mapped[datetime.datetime] = mapped_column(
+        sa.DateTime,
+        nullable=False,
+        index=True,
+    )
+
+    revoked_at: Mapped[datetime.datetime] = mapped_column(
+        sa.DateTime,
+        nullable=False,
+        index=True,
+        server_default=sa.func.timezone("utc", sa.func.now()),
+    )
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+
+@dataclass
+class PoolCounters:
+    """Cumulative checkout counters collected by an instrumented pool."""
+
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_time_total: float = 0.0
+    wait_time_max: float = 0.0
+
+    def record_checkout(self, wait_time: float) -> None:
+        self.checkouts += 1
+        self.wait_time_total += wait_time
+        self.wait_time_max = max(self.wait_time_max, wait_time)
+
+
+@dataclass(frozen=True)
+class PoolStatistics:
+    """
+    Point-in-time snapshot of the connection pool state.
+
+    :param size: Configured number of persistent connections.
+    :param checked_in: Idle connections currently held by the pool.
+    :param checked_out: Connections currently in use.
+    :param overflow: Connections opened above ``size`` (negative while the pool is still filling up).
+    :param checkouts: Total number of successful checkouts.
+    :param timeouts: Total number of checkouts that gave up waiting for a connection.
+    :param wait_time_total: Total seconds spent in checkout.
+    :param wait_time_max: Longest single checkout in seconds.
+    """
+
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    wait_time_total: float
+    wait_time_max: float
+
+    @property
+    def wait_time_avg(self) -> float:
+        return self.wait_time_total / self.checkouts if self.checkouts else 0.0
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records checkout counts and wait times."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.counters = PoolCounters()
+
+    def connect(self) -> PoolProxiedConnection:
+        started_at = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.counters.timeouts += 1
+            raise
+        self.counters.record_checkout(time.perf_counter() - started_at)
+        return connection
+
+    def recreate(self) -> InstrumentedAsyncQueuePool:
+        pool = super().recreate()
+        assert isinstance(pool, InstrumentedAsyncQueuePool)
+        pool.counters = self.counters
+        return pool
+
+
+def get_pool_statistics(engine: AsyncEngine) -> PoolStatistics | None:
+    """
+    Collect statistics of the engine connection pool.
+
+    :param engine: Engine created by ``create_engine_from_settings``.
+    :return: Pool statistics, or None if the engine does not use an instrumented pool.
+    """
+    pool = engine.pool
+    if not isinstance(pool, InstrumentedAsyncQueuePool):
+        return None
+    return PoolStatistics(
+        size=pool.size(),
+        checked_in=pool.checkedin(),
+        checked_out=pool.checkedout(),
+        overflow=pool.overflow(),
+        checkouts=pool.counters.checkouts,
+        timeouts=pool.counters.timeouts,
+        wait_time_total=pool.counters.wait_time_total,
+        wait_time_max=pool.counters.wait_time_max,
+    )
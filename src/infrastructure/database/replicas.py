@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from core.logging import get_logger
+from infrastructure.database.session import get_async_session_factory
+
+logger = get_logger(__name__)
+
+_read_from_primary: ContextVar[bool] = ContextVar("read_from_primary", default=False)
+
+REPLICA_FAILURES = (exc.OperationalError, exc.InterfaceError, exc.TimeoutError, OSError)
+"""Errors that mark a replica as unhealthy and make the read fall back to the primary."""
+
+
+@contextmanager
+def read_from_primary() -> Iterator[None]:
+    """
+    Route every repository read inside the block to the primary.
+
+    Use it to read your own writes right after they were committed, before the
+    replicas have caught up::
+
+        await users.update({"id": user_id}, {"is_active": True})
+        with read_from_primary():
+            user = await users.get(id=user_id)
+    """
+    token = _read_from_primary.set(True)
+    try:
+        yield
+    finally:
+        _read_from_primary.reset(token)
+
+
+def is_primary_read_forced() -> bool:
+    return _read_from_primary.get()
+
+
+@dataclass
+class Replica:
+    name: str
+    session_factory: async_sessionmaker[AsyncSession]
+    ejected_until: float = 0.0
+
+    def is_healthy(self, now: float) -> bool:
+        return self.ejected_until <= now
+
+
+@dataclass
+class ReplicaRouter:
+    """
+    Round-robin selection of read replicas with health-based ejection.
+
+    A replica that fails with a connection-level error is ejected for
+    ``ejection_seconds`` and put back into rotation afterwards.
+
+    :param replicas: Replicas to route reads to.
+    :param ejection_seconds: How long a failed replica stays out of rotation.
+    """
+
+    replicas: list[Replica]
+    ejection_seconds: float = 30.0
+
+    _position: int = field(default=0, init=False, repr=False)
+
+    @classmethod
+    def from_engines(cls, engines: list[AsyncEngine], ejection_seconds: float = 30.0) -> ReplicaRouter:
+        replicas = [
+            Replica(
+                name=engine.url.render_as_string(hide_password=True), session_factory=get_async_session_factory(engine)
+            )
+            for engine in engines
+        ]
+        return cls(replicas=replicas, ejection_seconds=ejection_seconds)
+
+    def choose(self) -> Replica | None:
+        """
+        Return the next healthy replica, or None if every replica is ejected.
+        """
+        now = time.monotonic()
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[self._position % len(self.replicas)]
+            self._position += 1
+            if replica.is_healthy(now):
+                return replica
+        return None
+
+    def eject(self, replica: Replica) -> None:
+        replica.ejected_until = time.monotonic() + self.ejection_seconds
+        logger.warning("Replica %s ejected from read routing for %.1fs", replica.name, self.ejection_seconds)
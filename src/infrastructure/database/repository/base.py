@@ -1,9 +1,29 @@
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Collection, Literal, Sequence, cast
 
-from adaptix import Retort
-from sqlalchemy import delete, func, select, update
+from sqlalchemy import (
+    Boolean,
+    CursorResult,
+    Insert,
+    Result,
+    Select,
+    bindparam,
+    delete,
+    func,
+    insert,
+    inspect,
+    literal_column,
+    select,
+    update,
+)
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import class_mapper
+
+from application.dto.upsert_result import UpsertResultDTO
+from infrastructure.database.mapper import EntityMapper
+from infrastructure.database.replicas import REPLICA_FAILURES, ReplicaRouter, is_primary_read_forced
+from infrastructure.database.unit_of_work import commit_or_flush, get_current_session, session_scope
 
 
 @dataclass
@@ -11,64 +31,202 @@ class BaseSQLAlchemyRepository[Model, Entity]:
     session_factory: async_sessionmaker[AsyncSession]
     model_type: type[Model]
     entity_type: type[Entity]
-    mapper: Retort
+    mapper: EntityMapper
+    replicas: ReplicaRouter | None = field(default=None, kw_only=True)
+
+    _queries: dict[tuple[str, tuple[str, ...]], Select[Any]] = field(default_factory=dict, init=False, repr=False)
 
     async def add(self, data: Entity) -> Entity:
         model = self._from_entity(data)
-        async with self.session_factory() as session:
+        async with session_scope(self.session_factory) as session:
             session.add(model)
-            await session.commit()
+            await commit_or_flush(session)
             await session.refresh(model)
         return self._to_entity(model)
 
     async def add_many(self, data: list[Entity]) -> list[Entity]:
-        models = [self._from_entity(entity) for entity in data]
-        async with self.session_factory() as session:
-            session.add_all(models)
-            await session.commit()
-            for model in models:
-                await session.refresh(model)
-        return [self._to_entity(model) for model in models]
+        """
+        Insert all entities with a single INSERT ... RETURNING statement.
+
+        The rows are sent in insertmanyvalues batches and the server-generated
+        columns come back in the same round trip, in the order of ``data``.
+        """
+        if not data:
+            return []
+        values = [self._dump(entity) for entity in data]
+        async with session_scope(self.session_factory) as session:
+            stmt = insert(self.model_type).returning(self.model_type, sort_by_parameter_order=True)
+            result = await session.scalars(stmt, values)
+            entities = [self._to_entity(model) for model in result.all()]
+            await commit_or_flush(session)
+        return entities
+
+    async def upsert_many(
+        self,
+        data: list[Entity],
+        conflict_fields: Sequence[str],
+        update_fields: Sequence[str] | None = None,
+        *,
+        batch_size: int = 1000,
+    ) -> UpsertResultDTO:
+        """
+        Bulk ``INSERT ... ON CONFLICT (...) DO UPDATE`` (or ``DO NOTHING``) in chunks of ``batch_size``.
+
+        Inserted and updated rows are told apart with ``RETURNING xmax = 0``: a row
+        version created by the insert has no deleting transaction yet. All chunks run
+        in one transaction. A chunk must not contain two entities with the same
+        conflict key, PostgreSQL refuses to update the same row twice in one statement.
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be greater than 0")
+        inserted = updated = 0
+        ids: list[Any] = []
+        async with session_scope(self.session_factory) as session:
+            for start in range(0, len(data), batch_size):
+                values = [self._dump(entity) for entity in data[start : start + batch_size]]
+                stmt = self._upsert_statement(values[0].keys(), conflict_fields, update_fields)
+                result = await session.execute(stmt, values)
+                for row_id, is_inserted in result.tuples():
+                    ids.append(row_id)
+                    if is_inserted:
+                        inserted += 1
+                    else:
+                        updated += 1
+            await commit_or_flush(session)
+        return UpsertResultDTO(inserted=inserted, updated=updated, ids=ids)
 
     async def get(self, **filters: Any) -> Entity | None:
-        async with self.session_factory() as session:
-            stmt = select(self.model_type).filter_by(**filters)
-            result = await session.execute(stmt)
-            model = result.scalars().first()
+        stmt, params = self._query("select", filters)
+        model = await self._read(stmt, params, lambda result: result.scalars().first())
         return self._to_entity(model) if model else None
 
     async def get_many(self, **filters: Any) -> list[Entity]:
-        async with self.session_factory() as session:
-            stmt = select(self.model_type).filter_by(**filters)
-            result = await session.execute(stmt)
-            models = result.scalars().all()
+        stmt, params = self._query("select", filters)
+        models = await self._read(stmt, params, lambda result: result.scalars().all())
         return [self._to_entity(model) for model in models]
 
+    async def iter_many(self, *, batch_size: int = 1000, **filters: Any) -> AsyncIterator[Entity]:
+        """
+        Stream matching entities ordered by primary key using keyset pagination.
+
+        Each batch is fetched with ``WHERE pk > :last_pk ORDER BY pk LIMIT :batch_size``
+        in its own short query, so no connection or transaction is held between
+        batches and at most one batch of rows is kept in memory. Entities are
+        mapped one at a time as they are consumed. Inside a unit of work the
+        objects a batch loads are expunged again, while objects the session held
+        before, possibly with pending changes, stay attached.
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be greater than 0")
+        mapper = class_mapper(self.model_type)
+        primary_key = mapper.primary_key[0]
+        primary_key_attribute = mapper.get_property_by_column(primary_key).key
+        last_key: Any = None
+        while True:
+            stmt = select(self.model_type).filter_by(**filters).order_by(primary_key).limit(batch_size)
+            if last_key is not None:
+                stmt = stmt.where(primary_key > last_key)
+            session = get_current_session()
+            known = set(session.identity_map.keys()) if session is not None else set()
+            models = await self._read(stmt, {}, lambda result: result.scalars().all())
+            if session is not None:
+                for model in models:
+                    if inspect(model).identity_key not in known:
+                        session.expunge(model)
+            for model in models:
+                yield self._to_entity(model)
+            if len(models) < batch_size:
+                return
+            last_key = getattr(models[-1], primary_key_attribute)
+
     async def update(self, filters: dict[str, Any], data: dict[str, Any]) -> int:
-        async with self.session_factory() as session:
+        async with session_scope(self.session_factory) as session:
             stmt = update(self.model_type).filter_by(**filters).values(**data)
             result = await session.execute(stmt)
-            await session.commit()
-        return result.rowcount()
+            await commit_or_flush(session)
+        return cast(CursorResult[Any], result).rowcount
 
     async def delete(self, **filters: Any) -> int:
-        async with self.session_factory() as session:
+        async with session_scope(self.session_factory) as session:
             stmt = delete(self.model_type).filter_by(**filters)
             result = await session.execute(stmt)
-            await session.commit()
-        return result.rowcount()
+            await commit_or_flush(session)
+        return cast(CursorResult[Any], result).rowcount
 
     async def exists(self, **filters: Any) -> bool:
-        async with self.session_factory() as session:
-            stmt = select(self.model_type).filter_by(**filters).exists()
-            result = await session.execute(stmt)
-        return result.scalar()
+        stmt, params = self._query("exists", filters)
+        return await self._read(stmt, params, lambda result: bool(result.scalar()))
 
     async def count(self, **filters: Any) -> int:
-        async with self.session_factory() as session:
-            stmt = select(func.count()).select_from(self.model_type).filter_by(**filters)
-            result = await session.execute(stmt)
-        return result.scalar()
+        stmt, params = self._query("count", filters)
+        return await self._read(stmt, params, lambda result: int(result.scalar_one()))
+
+    def _upsert_statement(
+        self,
+        fields: Collection[str],
+        conflict_fields: Sequence[str],
+        update_fields: Sequence[str] | None,
+    ) -> Insert:
+        primary_key = class_mapper(self.model_type).primary_key[0]
+        stmt = postgresql.insert(self.model_type)
+        if update_fields is None:
+            update_fields = [name for name in fields if name not in conflict_fields and name != primary_key.key]
+        if update_fields:
+            upsert = stmt.on_conflict_do_update(
+                index_elements=list(conflict_fields),
+                set_={name: stmt.excluded[name] for name in update_fields},
+            )
+        else:
+            upsert = stmt.on_conflict_do_nothing(index_elements=list(conflict_fields))
+        return upsert.returning(primary_key, literal_column("xmax = 0", Boolean))
+
+    def _query(
+        self, kind: Literal["select", "exists", "count"], filters: dict[str, Any]
+    ) -> tuple[Select[Any], dict[str, Any]]:
+        """
+        Return a lookup statement for the given filter names together with its parameters.
+
+        Statements are built once per (kind, filter names) with bind parameters and
+        reused, so hot lookups skip statement construction and cache key generation
+        and always send the same SQL text, which psycopg prepares on the server after
+        ``prepare_threshold`` executions. Filters comparing with None are built
+        inline because they compile to ``IS NULL``.
+        """
+        if any(value is None for value in filters.values()):
+            return self._build_query(kind, filters), {}
+        key = (kind, tuple(sorted(filters)))
+        stmt = self._queries.get(key)
+        if stmt is None:
+            stmt = self._build_query(kind, {name: bindparam(name) for name in key[1]})
+            self._queries[key] = stmt
+        return stmt, filters
+
+    def _build_query(self, kind: Literal["select", "exists", "count"], criteria: dict[str, Any]) -> Select[Any]:
+        if kind == "select":
+            return select(self.model_type).filter_by(**criteria)
+        if kind == "exists":
+            return select(select(self.model_type).filter_by(**criteria).exists())
+        return select(func.count()).select_from(self.model_type).filter_by(**criteria)
+
+    async def _read[T](self, stmt: Select[Any], params: dict[str, Any], extract: Callable[[Result[Any]], T]) -> T:
+        """
+        Execute a read statement on a replica, or on the primary when no replica can serve it.
+
+        Reads go to the primary inside a unit of work, inside ``read_from_primary()``,
+        when no replica is healthy, or after the chosen replica fails (it is then ejected).
+        """
+        replica = None
+        if self.replicas is not None and get_current_session() is None and not is_primary_read_forced():
+            replica = self.replicas.choose()
+        if replica is not None:
+            try:
+                async with replica.session_factory() as session:
+                    return extract(await session.execute(stmt, params))
+            except REPLICA_FAILURES:
+                assert self.replicas is not None
+                self.replicas.eject(replica)
+        async with session_scope(self.session_factory) as session:
+            return extract(await session.execute(stmt, params))
 
     def _to_entity(self, model: Model) -> Entity:
         """
@@ -81,5 +239,11 @@ class BaseSQLAlchemyRepository[Model, Entity]:
         Convert domain entity to ORM model instance.
         """
 
-        payload = self.mapper.dump(entity)
+        payload = self._dump(entity)
         return self.model_type(**payload)
+
+    def _dump(self, entity: Entity) -> dict[str, Any]:
+        """
+        Convert domain entity to a mapping of model column values.
+        """
+        return self.mapper.dump(entity)
@@ -0,0 +1,115 @@
+import datetime
+from dataclasses import dataclass
+from typing import Sequence
+
+from adaptix import Retort
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from application.dto.email_message import EmailMessageDTO
+from application.dto.email_outbox import OutboxEntryDTO, OutboxLagDTO
+from infrastructure.database.models import EmailOutboxModel
+from infrastructure.database.unit_of_work import commit_or_flush, session_scope
+
+_retort = Retort()
+
+_utc_now = func.timezone("utc", func.now())
+
+
+@dataclass
+class EmailOutboxRepository:
+    """
+    Email outbox stored in the ``email_outbox`` table.
+
+    Enqueueing joins the current unit of work, so a message is queued only if the
+    transaction that produced it commits. Workers claim due rows with
+    ``FOR UPDATE SKIP LOCKED``, so concurrent workers never claim the same row.
+    A claim pushes ``available_at`` forward by the visibility timeout, and so does
+    extending it. A row that is not completed or extended in time becomes due again.
+
+    :param session_factory: Factory of sessions on the primary database.
+    """
+
+    session_factory: async_sessionmaker[AsyncSession]
+
+    async def enqueue(self, *messages: EmailMessageDTO) -> None:
+        if not messages:
+            return
+        values = [{"message": _retort.dump(message, EmailMessageDTO)} for message in messages]
+        async with session_scope(self.session_factory) as session:
+            await session.execute(insert(EmailOutboxModel), values)
+            await commit_or_flush(session)
+
+    async def claim(self, limit: int, visibility_timeout: float, max_attempts: int) -> list[OutboxEntryDTO]:
+        due = (
+            select(EmailOutboxModel.id)
+            .where(EmailOutboxModel.available_at <= _utc_now, EmailOutboxModel.attempts < max_attempts)
+            .order_by(EmailOutboxModel.available_at, EmailOutboxModel.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(EmailOutboxModel)
+            .where(EmailOutboxModel.id.in_(due.scalar_subquery()))
+            .values(
+                available_at=_utc_now + datetime.timedelta(seconds=visibility_timeout),
+                attempts=EmailOutboxModel.attempts + 1,
+            )
+            .returning(EmailOutboxModel.id, EmailOutboxModel.message, EmailOutboxModel.attempts)
+        )
+        async with session_scope(self.session_factory) as session:
+            rows = (await session.execute(stmt)).all()
+            await commit_or_flush(session)
+        return [
+            OutboxEntryDTO(id=row.id, message=_retort.load(row.message, EmailMessageDTO), attempts=row.attempts)
+            for row in sorted(rows, key=lambda row: row.id)
+        ]
+
+    async def extend(self, ids: Sequence[int], visibility_timeout: float) -> None:
+        if not ids:
+            return
+        stmt = (
+            update(EmailOutboxModel)
+            .where(EmailOutboxModel.id.in_(ids))
+            .values(available_at=_utc_now + datetime.timedelta(seconds=visibility_timeout))
+        )
+        async with session_scope(self.session_factory) as session:
+            await session.execute(stmt)
+            await commit_or_flush(session)
+
+    async def complete(self, ids: Sequence[int]) -> None:
+        if not ids:
+            return
+        async with session_scope(self.session_factory) as session:
+            await session.execute(delete(EmailOutboxModel).where(EmailOutboxModel.id.in_(ids)))
+            await commit_or_flush(session)
+
+    async def remove_exhausted(self, limit: int, max_attempts: int) -> list[OutboxEntryDTO]:
+        exhausted = (
+            select(EmailOutboxModel.id)
+            .where(EmailOutboxModel.available_at <= _utc_now, EmailOutboxModel.attempts >= max_attempts)
+            .order_by(EmailOutboxModel.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            delete(EmailOutboxModel)
+            .where(EmailOutboxModel.id.in_(exhausted.scalar_subquery()))
+            .returning(EmailOutboxModel.id, EmailOutboxModel.message, EmailOutboxModel.attempts)
+        )
+        async with session_scope(self.session_factory) as session:
+            rows = (await session.execute(stmt)).all()
+            await commit_or_flush(session)
+        return [
+            OutboxEntryDTO(id=row.id, message=_retort.load(row.message, EmailMessageDTO), attempts=row.attempts)
+            for row in sorted(rows, key=lambda row: row.id)
+        ]
+
+    async def lag(self, max_attempts: int) -> OutboxLagDTO:
+        stmt = select(
+            func.count(),
+            func.extract("epoch", _utc_now - func.min(EmailOutboxModel.created_at)),
+        ).where(EmailOutboxModel.attempts < max_attempts)
+        async with session_scope(self.session_factory) as session:
+            pending, oldest_age = (await session.execute(stmt)).one()
+        return OutboxLagDTO(pending=pending, oldest_age=float(oldest_age or 0.0))
@@ -0,0 +1,75 @@
+import datetime
+from dataclasses import dataclass
+from typing import Any, cast
+
+from sqlalchemy import CursorResult, delete, exists, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from domain.value_objects.hashed_secret import HashedSecret
+from infrastructure.database.models import RevokedTokenModel
+from infrastructure.database.unit_of_work import commit_or_flush, session_scope
+
+
+@dataclass
+class RevokedTokenRepository:
+    """
+    Denylist of revoked refresh tokens.
+
+    :param session_factory: Factory of sessions on the primary database.
+    """
+
+    session_factory: async_sessionmaker[AsyncSession]
+
+    async def add(self, hashed_token: HashedSecret, expires_at: datetime.datetime) -> None:
+        """Revoke a token; revoking it again is a no-op."""
+        stmt = (
+            insert(RevokedTokenModel)
+            .values(hashed_token=hashed_token.as_generic_type(), expires_at=_naive_utc(expires_at))
+            .on_conflict_do_nothing(index_elements=[RevokedTokenModel.hashed_token])
+        )
+        async with session_scope(self.session_factory) as session:
+            await session.execute(stmt)
+            await commit_or_flush(session)
+
+    async def exists(self, hashed_token: HashedSecret) -> bool:
+        stmt = select(exists().where(RevokedTokenModel.hashed_token == hashed_token.as_generic_type()))
+        async with session_scope(self.session_factory) as session:
+            return bool((await session.execute(stmt)).scalar())
+
+    async def get_revoked_after(
+        self, revoked_at: datetime.datetime, hashed_token: str = "", *, limit: int = 10_000
+    ) -> list[tuple[str, datetime.datetime]]:
+        """
+        Return unexpired revocations after the ``(revoked_at, hashed_token)`` position, in that order.
+
+        :param revoked_at: Revocation time to start after, in naive UTC.
+        :param hashed_token: Digest to start after among revocations at ``revoked_at``.
+        :param limit: Maximum number of rows.
+        :return: ``(hashed_token, revoked_at)`` pairs.
+        """
+        stmt = (
+            select(RevokedTokenModel.hashed_token, RevokedTokenModel.revoked_at)
+            .where(tuple_(RevokedTokenModel.revoked_at, RevokedTokenModel.hashed_token) > (revoked_at, hashed_token))
+            .where(RevokedTokenModel.expires_at > _naive_utc(datetime.datetime.now(datetime.UTC)))
+            .order_by(RevokedTokenModel.revoked_at, RevokedTokenModel.hashed_token)
+            .limit(limit)
+        )
+        async with session_scope(self.session_factory) as session:
+            return [(row.hashed_token, row.revoked_at) for row in await session.execute(stmt)]
+
+    async def delete_expired(self) -> int:
+        """Drop revocations of tokens that have expired anyway."""
+        stmt = delete(RevokedTokenModel).where(
+            RevokedTokenModel.expires_at <= _naive_utc(datetime.datetime.now(datetime.UTC))
+        )
+        async with session_scope(self.session_factory) as session:
+            result = await session.execute(stmt)
+            await commit_or_flush(session)
+        return cast(CursorResult[Any], result).rowcount
+
+
+def _naive_utc(value: datetime.datetime) -> datetime.datetime:
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(datetime.UTC).replace(tzinfo=None)
@@ -1,6 +1,11 @@
+import uuid
 from dataclasses import dataclass
+from typing import Sequence
+
+from sqlalchemy import select
 
 from domain.entities.user import User
+from domain.value_objects.hashed_secret import HashedSecret
 from infrastructure.database.models import UserModel
 from infrastructure.database.repository.base import BaseSQLAlchemyRepository
 
@@ -9,3 +14,23 @@ from infrastructure.database.repository.base import BaseSQLAlchemyRepository
 class UserRepository(BaseSQLAlchemyRepository[UserModel, User]):
     model_type = UserModel
     entity_type = User
+
+    async def update_hashed_password(self, user: User, hashed_password: HashedSecret) -> bool:
+        """
+        Replace the password hash of a user, unless it was changed concurrently.
+
+        The update only matches while the row still holds the hash the user was
+        loaded with, so an upgrade at login never overwrites a password change.
+        """
+        updated = await self.update(
+            {"id": user.id, "hashed_password": user.hashed_password.as_generic_type()},
+            {"hashed_password": hashed_password.as_generic_type()},
+        )
+        return updated == 1
+
+    async def get_emails(self, ids: Sequence[uuid.UUID]) -> list[str]:
+        """Return the current emails of the users with the given ids, in no particular order."""
+        if not ids:
+            return []
+        stmt = select(UserModel.email).where(UserModel.id.in_(ids))
+        return await self._read(stmt, {}, lambda result: list(result.scalars().all()))
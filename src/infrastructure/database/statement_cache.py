@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import weakref
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import Engine, event
+from sqlalchemy.engine.interfaces import CacheStats
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+@dataclass
+class StatementCacheCounters:
+    """Counters of SQLAlchemy compiled cache lookups for executed statements."""
+
+    hits: int = 0
+    misses: int = 0
+    uncached: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+_counters: weakref.WeakKeyDictionary[Engine, StatementCacheCounters] = weakref.WeakKeyDictionary()
+
+
+def instrument_statement_cache(engine: AsyncEngine) -> StatementCacheCounters:
+    """
+    Count compiled cache hits and misses of every statement executed by the engine.
+
+    :param engine: Engine to instrument.
+    :return: Counters updated after each cursor execution.
+    """
+    counters = StatementCacheCounters()
+
+    def after_cursor_execute(*args: Any) -> None:
+        context = args[4]
+        cache_hit = getattr(context, "cache_hit", None)
+        if cache_hit is CacheStats.CACHE_HIT:
+            counters.hits += 1
+        elif cache_hit is CacheStats.CACHE_MISS:
+            counters.misses += 1
+        else:
+            counters.uncached += 1
+
+    event.listen(engine.sync_engine, "after_cursor_execute", after_cursor_execute)
+    _counters[engine.sync_engine] = counters
+    return counters
+
+
+def get_statement_cache_statistics(engine: AsyncEngine) -> StatementCacheCounters | None:
+    """
+    Return compiled cache counters of the engine.
+
+    :param engine: Engine created by ``create_engine_from_settings``.
+    :return: Counters, or None if the engine is not instrumented.
+    """
+    return _counters.get(engine.sync_engine)
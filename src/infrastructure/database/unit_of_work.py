@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import AsyncIterator, Self
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+_current_session: ContextVar[AsyncSession | None] = ContextVar("current_session", default=None)
+
+
+def get_current_session() -> AsyncSession | None:
+    """Return the session of the active unit of work, or None outside of one."""
+    return _current_session.get()
+
+
+@asynccontextmanager
+async def session_scope(session_factory: async_sessionmaker[AsyncSession]) -> AsyncIterator[AsyncSession]:
+    """Yield the session of the active unit of work, or a new short-lived session from ``session_factory``."""
+    session = _current_session.get()
+    if session is not None:
+        yield session
+        return
+    async with session_factory() as session:
+        yield session
+
+
+async def commit_or_flush(session: AsyncSession) -> None:
+    """Commit a short-lived session, or only flush when the session belongs to the active unit of work."""
+    if session is _current_session.get():
+        await session.flush()
+    else:
+        await session.commit()
+
+
+@dataclass
+class SQLAlchemyUnitOfWork:
+    """
+    Unit of work that keeps a single session and transaction for a use case.
+
+    While the unit of work is active, every ``BaseSQLAlchemyRepository`` call made
+    from the same task reuses its session and only flushes its changes; the
+    transaction is committed once when the block exits without an error.
+
+    :param session_factory: Factory used to open the shared session.
+
+    Example::
+
+        async with SQLAlchemyUnitOfWork(session_factory):
+            if not await users.exists(email=email):
+                await users.add(user)
+    """
+
+    session_factory: async_sessionmaker[AsyncSession]
+
+    _session: AsyncSession | None = field(default=None, init=False, repr=False)
+    _token: Token[AsyncSession | None] | None = field(default=None, init=False, repr=False)
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            raise RuntimeError("Unit of work is not active")
+        return self._session
+
+    async def __aenter__(self) -> Self:
+        if _current_session.get() is not None:
+            raise RuntimeError("Unit of work is already active in this context")
+        self._session = self.session_factory()
+        self._token = _current_session.set(self._session)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        session = self.session
+        try:
+            if exc_type is None:
+                await session.commit()
+            else:
+                await session.rollback()
+        finally:
+            assert self._token is not None
+            _current_session.reset(self._token)
+            self._token = None
+            self._session = None
+            await session.close()
+
+    async def commit(self) -> None:
+        await self.session.commit()
+
+    async def rollback(self) -> None:
+        await self.session.rollback()
@@ -2,7 +2,7 @@ import sys
 from dataclasses import dataclass, field
 from typing import TextIO
 
-from application.dto.email_message import EmailMessageDTO
+from application.dto.email_message import DeliveryResultDTO, EmailMessageDTO
 from application.ports.email_sender import EmailSender
 
 
@@ -23,9 +23,9 @@ class ConsoleEmailSender(EmailSender):
         )
         self.stream.write(msg)
 
-    async def send_messages(self, *messages: EmailMessageDTO) -> int:
-        sent_count = 0
+    async def deliver(self, *messages: EmailMessageDTO) -> list[DeliveryResultDTO]:
+        results = []
         for message in messages:
             await self._write_message(message)
-            sent_count += 1
-        return sent_count
+            results.append(DeliveryResultDTO(message=message, status="sent"))
+        return results
@@ -0,0 +1,53 @@
+import asyncio
+import dataclasses
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+from application.dto.email_message import DeliveryResultDTO
+from core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class LoggingDeadLetterSink:
+    """Logs undeliverable messages without their content."""
+
+    async def put(self, result: DeliveryResultDTO) -> None:
+        logger.error(
+            "Email to %s %s after %d attempts: %s %s",
+            result.message.to_email,
+            result.status,
+            result.attempts,
+            result.code,
+            result.error,
+        )
+
+
+@dataclass
+class JsonLinesDeadLetterSink:
+    """
+    Appends undeliverable messages to a JSON Lines file, one record per message.
+
+    Each record holds the status, the reply code, the error and the whole message, so it can
+    be inspected and re-queued.
+
+    :param path: File the records are appended to.
+    """
+
+    path: Path
+
+    async def put(self, result: DeliveryResultDTO) -> None:
+        record = {
+            "status": result.status,
+            "code": result.code,
+            "error": result.error,
+            "attempts": result.attempts,
+            "message": dataclasses.asdict(result.message),
+        }
+        await asyncio.to_thread(self._append, json.dumps(record, default=list) + "\n")
+
+    def _append(self, line: str) -> None:
+        with self.path.open("a", encoding="utf-8") as file:
+            file.write(line)
@@ -0,0 +1,30 @@
+from application.ports.email_sender import DeadLetterSinkProtocol, EmailSender
+from core.config import EmailSettings, EmailSMTPConfig
+from infrastructure.email.console import ConsoleEmailSender
+from infrastructure.email.dead_letter import JsonLinesDeadLetterSink, LoggingDeadLetterSink
+from infrastructure.email.smtp import SMTPEmailSender
+
+
+def create_email_sender(email_settings: EmailSettings) -> EmailSender:
+    """
+    Create the email sender of the configured backend.
+
+    :param email_settings: Email settings.
+    :return: An SMTP sender, or a console sender for local development.
+    """
+    if email_settings.backend == "smtp":
+        return SMTPEmailSender.from_email_settings(email_settings)
+    return ConsoleEmailSender()
+
+
+def create_dead_letter_sink(email_settings: EmailSettings) -> DeadLetterSinkProtocol:
+    """
+    Create the sink undeliverable messages are handed to.
+
+    :param email_settings: Email settings.
+    :return: A JSON Lines sink when an SMTP dead-letter file is configured, otherwise a logging sink.
+    """
+    config = email_settings.config
+    if isinstance(config, EmailSMTPConfig) and config.dead_letter_file is not None:
+        return JsonLinesDeadLetterSink(config.dead_letter_file)
+    return LoggingDeadLetterSink()
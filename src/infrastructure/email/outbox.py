@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+from dataclasses import dataclass, field
+from typing import Self, Sequence
+
+from application.dto.email_message import DeliveryResultDTO
+from application.ports.email_outbox import EmailOutboxProtocol
+from application.ports.email_sender import DeadLetterSinkProtocol, EmailSender
+from core.config import EmailOutboxSettings
+from core.logging import get_logger
+from infrastructure.email.dead_letter import LoggingDeadLetterSink
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class OutboxCounters:
+    """Cumulative counters collected by an outbox worker."""
+
+    batches: int = 0
+    claimed: int = 0
+    sent: int = 0
+    failed: int = 0
+    rejected: int = 0
+    exhausted: int = 0
+
+
+@dataclass(frozen=True)
+class OutboxStatistics:
+    """
+    Point-in-time snapshot of the email outbox and its workers.
+
+    :param pending: Messages waiting for delivery, including claimed ones.
+    :param lag: Seconds the oldest waiting message has been queued.
+    :param batches: Total number of batches claimed.
+    :param claimed: Total number of messages claimed.
+    :param sent: Total number of messages delivered.
+    :param failed: Total number of messages left for redelivery after a transient failure.
+    :param rejected: Total number of messages refused permanently and dead-lettered.
+    :param exhausted: Total number of messages dead-lettered after ``max_attempts`` attempts.
+    """
+
+    pending: int
+    lag: float
+    batches: int
+    claimed: int
+    sent: int
+    failed: int
+    rejected: int
+    exhausted: int
+
+
+@dataclass
+class EmailOutboxWorker:
+    """
+    Drains the email outbox in batches through an email sender.
+
+    ``concurrency`` loops claim up to ``batch_size`` due messages each and hand
+    them to ``EmailSender.deliver``. Sent messages are removed from the outbox,
+    and so are rejected ones, which the sender has dead-lettered. Messages that
+    failed transiently stay and are delivered again after ``visibility_timeout``
+    seconds, so delivery is at least once. While a batch is being sent, its claim
+    is extended every half ``visibility_timeout``, so retries and backoff in the
+    sender never make it due again. A message whose ``max_attempts``-th attempt
+    fails is handed to ``dead_letter`` and removed. An idle loop also dead-letters
+    exhausted messages whose last claim was never completed, then polls every
+    ``poll_interval`` seconds.
+
+    :param outbox: Queue of outgoing messages.
+    :param sender: Sender the messages are delivered with.
+    :param concurrency: Number of concurrent delivery loops.
+    :param batch_size: Maximum number of messages claimed per batch.
+    :param visibility_timeout: Seconds a claimed message is hidden from other loops.
+    :param poll_interval: Seconds an idle loop waits before claiming again.
+    :param max_attempts: Maximum number of delivery attempts per message.
+    :param dead_letter: Destination of messages that used up their delivery attempts.
+    """
+
+    outbox: EmailOutboxProtocol
+    sender: EmailSender
+    concurrency: int = 1
+    batch_size: int = 50
+    visibility_timeout: float = 60.0
+    poll_interval: float = 1.0
+    max_attempts: int = 5
+    dead_letter: DeadLetterSinkProtocol = field(default_factory=LoggingDeadLetterSink)
+    counters: OutboxCounters = field(default_factory=OutboxCounters, init=False)
+
+    @classmethod
+    def from_settings(
+        cls,
+        outbox: EmailOutboxProtocol,
+        sender: EmailSender,
+        settings: EmailOutboxSettings,
+        dead_letter: DeadLetterSinkProtocol | None = None,
+    ) -> Self:
+        return cls(
+            outbox=outbox,
+            sender=sender,
+            concurrency=settings.concurrency,
+            batch_size=settings.batch_size,
+            visibility_timeout=settings.visibility_timeout,
+            poll_interval=settings.poll_interval,
+            max_attempts=settings.max_attempts,
+            dead_letter=dead_letter or LoggingDeadLetterSink(),
+        )
+
+    async def run(self) -> None:
+        """Deliver messages until cancelled."""
+        async with asyncio.TaskGroup() as task_group:
+            for _ in range(self.concurrency):
+                task_group.create_task(self._work())
+
+    async def deliver_batch(self) -> int:
+        """
+        Claim and send one batch of due messages.
+
+        :return: Number of messages claimed.
+        """
+        entries = await self.outbox.claim(self.batch_size, self.visibility_timeout, self.max_attempts)
+        if not entries:
+            return 0
+        self.counters.batches += 1
+        self.counters.claimed += len(entries)
+        heartbeat = asyncio.create_task(self._extend_claim([entry.id for entry in entries]))
+        try:
+            results = await self.sender.deliver(*(entry.message for entry in entries))
+        finally:
+            heartbeat.cancel()
+        done = []
+        for entry, result in zip(entries, results, strict=True):
+            if result.status == "sent":
+                self.counters.sent += 1
+                done.append(entry.id)
+            elif result.status == "rejected":
+                self.counters.rejected += 1
+                done.append(entry.id)
+            elif entry.attempts >= self.max_attempts:
+                self.counters.exhausted += 1
+                await self.dead_letter.put(dataclasses.replace(result, attempts=entry.attempts))
+                done.append(entry.id)
+            else:
+                self.counters.failed += 1
+        await self.outbox.complete(done)
+        if len(done) < len(entries):
+            logger.warning("%d of %d outbox messages will be retried", len(entries) - len(done), len(entries))
+        return len(entries)
+
+    async def dead_letter_exhausted(self) -> int:
+        """
+        Dead-letter messages left in the outbox with their delivery attempts used up.
+
+        ``deliver_batch`` dead-letters a message whose last attempt fails. This
+        picks up the ones whose last claim was never completed, e.g. because the
+        worker stopped while sending them.
+
+        :return: Number of messages dead-lettered.
+        """
+        entries = await self.outbox.remove_exhausted(self.batch_size, self.max_attempts)
+        for entry in entries:
+            self.counters.exhausted += 1
+            await self.dead_letter.put(
+                DeliveryResultDTO(
+                    message=entry.message,
+                    status="failed",
+                    attempts=entry.attempts,
+                    error="Delivery attempts exhausted",
+                )
+            )
+        return len(entries)
+
+    async def statistics(self) -> OutboxStatistics:
+        lag = await self.outbox.lag(self.max_attempts)
+        return OutboxStatistics(
+            pending=lag.pending,
+            lag=lag.oldest_age,
+            batches=self.counters.batches,
+            claimed=self.counters.claimed,
+            sent=self.counters.sent,
+            failed=self.counters.failed,
+            rejected=self.counters.rejected,
+            exhausted=self.counters.exhausted,
+        )
+
+    async def _work(self) -> None:
+        while True:
+            try:
+                claimed = await self.deliver_batch()
+                if claimed < self.batch_size:
+                    await self.dead_letter_exhausted()
+            except Exception:
+                logger.warning("Email outbox delivery failed", exc_info=True)
+                claimed = 0
+            if claimed < self.batch_size:
+                await asyncio.sleep(self.poll_interval)
+
+    async def _extend_claim(self, ids: Sequence[int]) -> None:
+        while True:
+            await asyncio.sleep(self.visibility_timeout / 2)
+            try:
+                await self.outbox.extend(ids, self.visibility_timeout)
+            except Exception:
+                logger.warning("Email outbox claim could not be extended", exc_info=True)
@@ -1,18 +1,83 @@
 from __future__ import annotations
 
 import asyncio
+import random
+import time
 from dataclasses import dataclass, field
 from email.message import EmailMessage
 
 import aiosmtplib
 
-from application.dto.email_message import EmailMessageDTO
-from application.ports.email_sender import EmailSender
+from application.dto.email_message import DeliveryResultDTO, EmailMessageDTO
+from application.ports.email_sender import DeadLetterSinkProtocol, EmailSender
 from core.config import EmailSettings, EmailSMTPConfig
+from core.logging import get_logger
+from infrastructure.email.dead_letter import JsonLinesDeadLetterSink, LoggingDeadLetterSink
+
+logger = get_logger(__name__)
+
+MESSAGE_ERRORS = (
+    aiosmtplib.SMTPRecipientsRefused,
+    aiosmtplib.SMTPRecipientRefused,
+    aiosmtplib.SMTPSenderRefused,
+    aiosmtplib.SMTPDataError,
+)
+"""Replies that are a verdict on the message itself rather than on the connection."""
+
+
+@dataclass
+class PooledSMTPConnection:
+    """
+    An SMTP client of the pool and its use since it last connected.
+
+    :param client: The client; it may be connected or not.
+    :param messages_sent: Messages sent since the client connected.
+    :param last_used_at: Monotonic time the connection was last used.
+    :param idle_timer: Closes the connection when it stays idle too long.
+    """
+
+    client: aiosmtplib.SMTP
+    messages_sent: int = 0
+    last_used_at: float = 0.0
+    idle_timer: asyncio.TimerHandle | None = None
 
 
 @dataclass
 class SMTPEmailSender(EmailSender):
+    """
+    Sends email over a pool of persistent SMTP connections.
+
+    A batch is split into chunks of at most ``max_messages_per_connection``
+    messages, spread evenly over the pool, and every chunk is sent over one pooled
+    connection. At most ``pool_size`` connections are open at once across all
+    concurrent ``send_messages`` calls.
+
+    Connections stay open and authenticated between calls, so a single message
+    does not pay for the connect, TLS and AUTH round trips. A connection idle for
+    ``health_check_interval`` seconds is checked with ``NOOP`` before reuse. One
+    idle for ``idle_timeout`` seconds is closed. One that has sent
+    ``max_messages_per_connection`` messages is replaced. If the server drops a
+    connection, it is reopened.
+
+    Every message gets its own :class:`DeliveryResultDTO`. Transient failures are
+    retried up to ``max_retries`` times with exponential backoff and jitter. These
+    are 4xx replies, connection errors and timeouts. A connection error partway
+    through a chunk reconnects at once for its first retry, so the rest of the
+    chunk is not lost. A message refused with a 5xx reply is not retried. It is
+    reported as ``rejected`` and handed to ``dead_letter``. A chunk keeps its
+    connection while it backs off. If the server stays unreachable through all
+    the retries of one message, the rest of the chunk fails without an attempt.
+
+    :param pool_size: Maximum number of concurrent SMTP connections.
+    :param max_messages_per_connection: Maximum number of messages sent over one connection.
+    :param idle_timeout: Seconds an unused connection is kept open.
+    :param health_check_interval: Idle seconds after which a connection is checked before reuse.
+    :param max_retries: Retries of a message after a transient failure.
+    :param retry_base_delay: Seconds before the first retry; the delay doubles with every retry.
+    :param retry_max_delay: Upper bound of the retry delay in seconds.
+    :param dead_letter: Destination of permanently rejected messages.
+    """
+
     name: str = field(default="smtp", init=False)
 
     host: str
@@ -24,16 +89,24 @@ class SMTPEmailSender(EmailSender):
 
     from_email: str
     from_name: str | None = field(default=None, kw_only=True)
+    pool_size: int = field(default=1, kw_only=True)
+    max_messages_per_connection: int = field(default=100, kw_only=True)
+    idle_timeout: float = field(default=60.0, kw_only=True)
+    health_check_interval: float = field(default=10.0, kw_only=True)
+    max_retries: int = field(default=3, kw_only=True)
+    retry_base_delay: float = field(default=1.0, kw_only=True)
+    retry_max_delay: float = field(default=30.0, kw_only=True)
+    dead_letter: DeadLetterSinkProtocol = field(default_factory=LoggingDeadLetterSink, kw_only=True)
 
     def __post_init__(self) -> None:
-        self._lock = asyncio.Lock()
-        self._smtp_client = aiosmtplib.SMTP(
-            hostname=self.host,
-            port=self.port,
-            username=self.username,
-            password=self.password,
-            use_tls=self.use_tls,
-        )
+        if self.pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+        if self.max_messages_per_connection < 1:
+            raise ValueError("max_messages_per_connection must be at least 1")
+        self._connections = [PooledSMTPConnection(client=self._create_client()) for _ in range(self.pool_size)]
+        self._pool: asyncio.Queue[PooledSMTPConnection] = asyncio.Queue()
+        for connection in self._connections:
+            self._pool.put_nowait(connection)
 
     @classmethod
     def from_email_settings(cls, email_settings: EmailSettings) -> SMTPEmailSender:
@@ -49,29 +122,170 @@ class SMTPEmailSender(EmailSender):
             use_ssl=email_settings.config.use_ssl,
             from_email=email_settings.from_email,
             from_name=email_settings.from_name,
+            pool_size=email_settings.config.pool_size,
+            max_messages_per_connection=email_settings.config.max_messages_per_connection,
+            idle_timeout=email_settings.config.idle_timeout,
+            health_check_interval=email_settings.config.health_check_interval,
+            max_retries=email_settings.config.max_retries,
+            retry_base_delay=email_settings.config.retry_base_delay,
+            retry_max_delay=email_settings.config.retry_max_delay,
+            dead_letter=(
+                JsonLinesDeadLetterSink(email_settings.config.dead_letter_file)
+                if email_settings.config.dead_letter_file is not None
+                else LoggingDeadLetterSink()
+            ),
         )
         return sender
 
-    async def send_messages(self, *messages: EmailMessageDTO) -> int:
-        sent_count = 0
-        async with self._lock:
-            async with self._smtp_client as client:
-                for message in messages:
-                    email_message = EmailMessage()
-                    email_message["From"] = (
-                        f"{self.from_name} <{self.from_email}>" if self.from_name else self.from_email
+    async def deliver(self, *messages: EmailMessageDTO) -> list[DeliveryResultDTO]:
+        if not messages:
+            return []
+        chunk_size = min(self.max_messages_per_connection, -(-len(messages) // self.pool_size))
+        chunks = [messages[i : i + chunk_size] for i in range(0, len(messages), chunk_size)]
+        chunk_results = await asyncio.gather(*(self._send_chunk(chunk) for chunk in chunks))
+        return [result for results in chunk_results for result in results]
+
+    async def close(self) -> None:
+        for connection in self._connections:
+            if connection.idle_timer is not None:
+                connection.idle_timer.cancel()
+                connection.idle_timer = None
+            await self._disconnect(connection)
+
+    async def _send_chunk(self, messages: tuple[EmailMessageDTO, ...]) -> list[DeliveryResultDTO]:
+        results: list[DeliveryResultDTO] = []
+        connection = await self._acquire()
+        try:
+            for message in messages:
+                result = await self._deliver_one(connection, message)
+                if result.status == "rejected":
+                    await self._dead_letter(result)
+                results.append(result)
+                if result.status == "failed" and not connection.client.is_connected:
+                    # The server stayed unreachable through every retry; fail the rest of the chunk fast.
+                    break
+        finally:
+            self._release(connection)
+        for message in messages[len(results) :]:
+            results.append(
+                DeliveryResultDTO(message=message, status="failed", attempts=0, error="SMTP server unavailable")
+            )
+        return results
+
+    async def _deliver_one(self, connection: PooledSMTPConnection, message: EmailMessageDTO) -> DeliveryResultDTO:
+        email_message = self._build_message(message)
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                await self._ensure_session(connection)
+                await self._send(connection, email_message)
+                return DeliveryResultDTO(message=message, status="sent", attempts=attempt)
+            except MESSAGE_ERRORS as error:
+                code = _reply_code(error)
+                if code is not None and code >= 500:
+                    return DeliveryResultDTO(
+                        message=message, status="rejected", attempts=attempt, code=code, error=str(error)
                     )
-                    email_message["To"] = message.to_email
-                    email_message["Subject"] = message.subject
-                    maintype, subtype = message.content.type.split("/")
-                    email_message.set_content(message.content.body, subtype=subtype)
-                    for alternative_content in message.alternative_contents:
-                        maintype, subtype = alternative_content.type.split("/")
-                        email_message.add_alternative(alternative_content.body, subtype=subtype)
-                    try:
-                        await client.send_message(email_message)
-                    except Exception:
-                        continue
-                    sent_count += 1
-
-        return sent_count
+                delay = self._retry_delay(attempt)
+                failure = DeliveryResultDTO(
+                    message=message, status="failed", attempts=attempt, code=code, error=str(error)
+                )
+            except (aiosmtplib.SMTPException, OSError) as error:
+                # Connection-level failure: drop the session; the next attempt reconnects.
+                connection.client.close()
+                delay = 0.0 if attempt == 1 else self._retry_delay(attempt - 1)
+                failure = DeliveryResultDTO(
+                    message=message, status="failed", attempts=attempt, code=_reply_code(error), error=str(error)
+                )
+            if attempt > self.max_retries:
+                return failure
+            await asyncio.sleep(delay)
+
+    def _retry_delay(self, retry: int) -> float:
+        delay = min(self.retry_max_delay, self.retry_base_delay * 2 ** (retry - 1))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    async def _dead_letter(self, result: DeliveryResultDTO) -> None:
+        try:
+            await self.dead_letter.put(result)
+        except Exception:
+            logger.error("Could not dead-letter the email to %s", result.message.to_email, exc_info=True)
+
+    async def _acquire(self) -> PooledSMTPConnection:
+        connection = await self._pool.get()
+        if connection.idle_timer is not None:
+            connection.idle_timer.cancel()
+            connection.idle_timer = None
+        return connection
+
+    def _release(self, connection: PooledSMTPConnection) -> None:
+        connection.last_used_at = time.monotonic()
+        if connection.client.is_connected:
+            loop = asyncio.get_running_loop()
+            connection.idle_timer = loop.call_later(self.idle_timeout, self._close_idle, connection)
+        self._pool.put_nowait(connection)
+
+    @staticmethod
+    def _close_idle(connection: PooledSMTPConnection) -> None:
+        # Runs only while the connection sits in the pool: acquiring it cancels the timer.
+        connection.idle_timer = None
+        connection.client.close()
+
+    async def _ensure_session(self, connection: PooledSMTPConnection) -> None:
+        client = connection.client
+        if client.is_connected:
+            if connection.messages_sent >= self.max_messages_per_connection:
+                await self._disconnect(connection)
+            elif time.monotonic() - connection.last_used_at >= self.health_check_interval:
+                try:
+                    await client.noop()
+                except aiosmtplib.SMTPException:
+                    client.close()
+        if not client.is_connected:
+            await client.connect()
+            connection.messages_sent = 0
+
+    @staticmethod
+    async def _send(connection: PooledSMTPConnection, email_message: EmailMessage) -> None:
+        await connection.client.send_message(email_message)
+        connection.messages_sent += 1
+        connection.last_used_at = time.monotonic()
+
+    @staticmethod
+    async def _disconnect(connection: PooledSMTPConnection) -> None:
+        if not connection.client.is_connected:
+            return
+        try:
+            await connection.client.quit()
+        except aiosmtplib.SMTPException:
+            connection.client.close()
+
+    def _create_client(self) -> aiosmtplib.SMTP:
+        return aiosmtplib.SMTP(
+            hostname=self.host,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            use_tls=self.use_tls,
+        )
+
+    def _build_message(self, message: EmailMessageDTO) -> EmailMessage:
+        email_message = EmailMessage()
+        email_message["From"] = f"{self.from_name} <{self.from_email}>" if self.from_name else self.from_email
+        email_message["To"] = message.to_email
+        email_message["Subject"] = message.subject
+        maintype, subtype = message.content.type.split("/")
+        email_message.set_content(message.content.body, subtype=subtype)
+        for alternative_content in message.alternative_contents:
+            maintype, subtype = alternative_content.type.split("/")
+            email_message.add_alternative(alternative_content.body, subtype=subtype)
+        return email_message
+
+
+def _reply_code(error: Exception) -> int | None:
+    if isinstance(error, aiosmtplib.SMTPRecipientsRefused):
+        return max((recipient.code for recipient in error.recipients), default=None)
+    if isinstance(error, aiosmtplib.SMTPResponseException):
+        return error.code
+    return None
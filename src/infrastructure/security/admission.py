@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from application.errors import HashingOverloaded
+from application.ports.hasher import AsyncHasherProtocol
+from domain.value_objects.hashed_secret import HashedSecret
+
+
+@dataclass
+class AdmissionCounters:
+    """Cumulative counters collected by an admission-controlled hasher."""
+
+    admitted: int = 0
+    rejected: int = 0
+    timed_out: int = 0
+    wait_time_total: float = 0.0
+    wait_time_max: float = 0.0
+
+    def record_admission(self, wait_time: float) -> None:
+        self.admitted += 1
+        self.wait_time_total += wait_time
+        self.wait_time_max = max(self.wait_time_max, wait_time)
+
+
+@dataclass(frozen=True)
+class AdmissionStatistics:
+    """
+    Point-in-time snapshot of the hashing scheduler state.
+
+    :param max_concurrency: Maximum number of hashes running at once.
+    :param max_queue: Maximum number of calls waiting for a slot.
+    :param in_flight: Hashes currently running.
+    :param queue_depth: Calls currently waiting for a slot.
+    :param admitted: Total number of calls that got a slot.
+    :param rejected: Total number of calls rejected because the queue was full.
+    :param timed_out: Total number of calls that gave up waiting for a slot.
+    :param wait_time_total: Total seconds admitted calls spent waiting.
+    :param wait_time_max: Longest wait of an admitted call in seconds.
+    """
+
+    max_concurrency: int
+    max_queue: int
+    in_flight: int
+    queue_depth: int
+    admitted: int
+    rejected: int
+    timed_out: int
+    wait_time_total: float
+    wait_time_max: float
+
+    @property
+    def wait_time_avg(self) -> float:
+        return self.wait_time_total / self.admitted if self.admitted else 0.0
+
+
+@dataclass
+class AdmissionControlledHasher:
+    """
+    Bounds the number of concurrent hashes and the queue in front of them.
+
+    Every Argon2 call allocates its whole memory cost up front, so the number of
+    hashes running at once bounds the memory used for hashing. Calls beyond
+    ``max_concurrency`` wait in a queue of at most ``max_queue`` calls for at most
+    ``queue_timeout`` seconds; past either limit ``HashingOverloaded`` is raised
+    right away, so an overloaded worker answers quickly instead of timing out.
+
+    A slot is held until the hash itself finishes, not until the caller stops
+    waiting: a cancelled or timed-out caller cannot stop an executor job, so its
+    slot is only released once the job is done.
+
+    :param hasher: Hasher doing the work.
+    :param max_concurrency: Maximum number of hashes running at once.
+    :param max_queue: Maximum number of calls waiting for a slot.
+    :param queue_timeout: Seconds a call may wait for a slot.
+    """
+
+    hasher: AsyncHasherProtocol
+    max_concurrency: int
+    max_queue: int
+    queue_timeout: float
+    counters: AdmissionCounters = field(default_factory=AdmissionCounters, init=False)
+    _semaphore: asyncio.Semaphore = field(init=False, repr=False)
+    _in_flight: int = field(default=0, init=False, repr=False)
+    _waiting: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    async def verify(self, raw_secret: str, hashed_secret: HashedSecret) -> bool:
+        return await self._run(lambda: self.hasher.verify(raw_secret, hashed_secret))
+
+    async def hash(self, raw_secret: str) -> HashedSecret:
+        return await self._run(lambda: self.hasher.hash(raw_secret))
+
+    async def verify_and_update(self, raw_secret: str, hashed_secret: HashedSecret) -> tuple[bool, HashedSecret | None]:
+        # A rehash runs in the same slot: it costs at most one more hash of the same kind.
+        return await self._run(lambda: self.hasher.verify_and_update(raw_secret, hashed_secret))
+
+    def statistics(self) -> AdmissionStatistics:
+        return AdmissionStatistics(
+            max_concurrency=self.max_concurrency,
+            max_queue=self.max_queue,
+            in_flight=self._in_flight,
+            queue_depth=self._waiting,
+            admitted=self.counters.admitted,
+            rejected=self.counters.rejected,
+            timed_out=self.counters.timed_out,
+            wait_time_total=self.counters.wait_time_total,
+            wait_time_max=self.counters.wait_time_max,
+        )
+
+    async def _run[T](self, job: Callable[[], Awaitable[T]]) -> T:
+        await self._admit()
+        task = asyncio.create_task(_call(job))
+        task.add_done_callback(self._release)
+        # Shielded: cancelling the caller must not free the slot while the job still runs.
+        return await asyncio.shield(task)
+
+    async def _admit(self) -> None:
+        started_at = time.perf_counter()
+        if self._semaphore.locked():
+            if self._waiting >= self.max_queue:
+                self.counters.rejected += 1
+                raise HashingOverloaded(f"Hashing queue is full ({self.max_queue} waiting)")
+            self._waiting += 1
+            try:
+                async with asyncio.timeout(self.queue_timeout):
+                    await self._semaphore.acquire()
+            except TimeoutError:
+                self.counters.timed_out += 1
+                raise HashingOverloaded(f"No hashing slot available within {self.queue_timeout}s") from None
+            finally:
+                self._waiting -= 1
+        else:
+            await self._semaphore.acquire()
+        self.counters.record_admission(time.perf_counter() - started_at)
+        self._in_flight += 1
+
+    def _release(self, task: asyncio.Task[Any]) -> None:
+        self._in_flight -= 1
+        self._semaphore.release()
+        if not task.cancelled():
+            # Retrieve the error of a job whose caller was cancelled, so it is not logged as unhandled.
+            task.exception()
+
+
+async def _call[T](job: Callable[[], Awaitable[T]]) -> T:
+    return await job()
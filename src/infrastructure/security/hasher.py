@@ -1,15 +1,55 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import multiprocessing
+import os
+import secrets
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Mapping, Self
+
+from argon2 import DEFAULT_MEMORY_COST, DEFAULT_PARALLELISM, DEFAULT_TIME_COST
 from pwdlib import PasswordHash as PWDLibPasswordHash
 from pwdlib.hashers.argon2 import Argon2Hasher as PWDLibArgon2Hasher
 
+from application.ports.hasher import HasherProtocol
+from core.config import HasherSettings, TokenHasherSettings
 from domain.value_objects.hashed_secret import HashedSecret
+from infrastructure.security.admission import AdmissionControlledHasher
 
 
 class Argon2Hasher:
-    _hasher = PWDLibPasswordHash(
-        hashers=[
-            PWDLibArgon2Hasher(),
-        ]
-    )
+    """
+    Argon2id hasher with configurable cost.
+
+    :param time_cost: Number of iterations.
+    :param memory_cost: Memory used by a single hash in KiB.
+    :param parallelism: Number of lanes used by a single hash.
+    """
+
+    def __init__(
+        self,
+        time_cost: int = DEFAULT_TIME_COST,
+        memory_cost: int = DEFAULT_MEMORY_COST,
+        parallelism: int = DEFAULT_PARALLELISM,
+    ) -> None:
+        self.time_cost = time_cost
+        self.memory_cost = memory_cost
+        self.parallelism = parallelism
+        self._hasher = PWDLibPasswordHash(
+            hashers=[
+                PWDLibArgon2Hasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism),
+            ]
+        )
+
+    @classmethod
+    def from_settings(cls, settings: HasherSettings) -> Self:
+        return cls(
+            time_cost=settings.time_cost,
+            memory_cost=settings.memory_cost,
+            parallelism=settings.parallelism,
+        )
 
     def verify(self, raw_secret: str, hashed_secret: HashedSecret) -> bool:
         return self._hasher.verify(password=raw_secret, hash=hashed_secret.as_generic_type())
@@ -17,10 +57,166 @@ class Argon2Hasher:
     def hash(self, raw_secret: str) -> HashedSecret:
         return HashedSecret(self._hasher.hash(password=raw_secret))
 
+    def verify_and_update(self, raw_secret: str, hashed_secret: HashedSecret) -> tuple[bool, HashedSecret | None]:
+        verified, updated = self._hasher.verify_and_update(password=raw_secret, hash=hashed_secret.as_generic_type())
+        return verified, HashedSecret(updated) if updated is not None else None
+
 
 class PasswordHasher(Argon2Hasher):
     pass
 
 
-class TokenHasher(Argon2Hasher):
-    pass
+TOKEN_BYTES = 32
+"""Entropy of generated tokens: 256 bits."""
+
+MIN_TOKEN_KEY_BYTES = 32
+
+
+def generate_token() -> str:
+    """Generate a random URL-safe token with 256 bits of entropy."""
+    return secrets.token_urlsafe(TOKEN_BYTES)
+
+
+@dataclass(frozen=True)
+class TokenHasher:
+    """
+    Keyed HMAC-SHA256 digests for high-entropy random tokens.
+
+    Refresh, confirm and reset tokens carry 256 bits of entropy, so a slow salted
+    hash adds nothing but cost. A keyed digest is deterministic: the stored value
+    can be found with an equality lookup on a unique index, and verification takes
+    microseconds instead of an Argon2 run.
+
+    Digests are stored in MCF form ``$hmac-sha256$v=1$<key id>$<digest>``, where the
+    key id takes the place of the salt. New digests use ``current_key_id``; older
+    keys stay in ``keys`` to verify tokens issued before a rotation.
+
+    :param keys: HMAC keys by key id.
+    :param current_key_id: Id of the key used for new digests.
+    :raises ValueError: If the current key is missing or a key is shorter than 32 bytes.
+    """
+
+    ALGORITHM = "hmac-sha256"
+    VERSION = "v=1"
+
+    keys: Mapping[str, bytes]
+    current_key_id: str
+
+    def __post_init__(self) -> None:
+        if self.current_key_id not in self.keys:
+            raise ValueError(f"Unknown current token key id: {self.current_key_id!r}")
+        for key_id, key in self.keys.items():
+            if "$" in key_id or not key_id:
+                raise ValueError(f"Invalid token key id: {key_id!r}")
+            if len(key) < MIN_TOKEN_KEY_BYTES:
+                raise ValueError(f"Token key {key_id!r} must be at least {MIN_TOKEN_KEY_BYTES} bytes long")
+
+    @classmethod
+    def from_settings(cls, settings: TokenHasherSettings) -> Self:
+        return cls(
+            keys={key_id: key.get_secret_value().encode() for key_id, key in settings.keys.items()},
+            current_key_id=settings.current_key_id,
+        )
+
+    def verify(self, raw_secret: str, hashed_secret: HashedSecret) -> bool:
+        if hashed_secret.algorithm != self.ALGORITHM:
+            return False
+        key_id = hashed_secret.salt
+        if key_id not in self.keys:
+            return False
+        return hmac.compare_digest(self._hash(raw_secret, key_id).as_generic_type(), hashed_secret.as_generic_type())
+
+    def hash(self, raw_secret: str) -> HashedSecret:
+        return self._hash(raw_secret, self.current_key_id)
+
+    def verify_and_update(self, raw_secret: str, hashed_secret: HashedSecret) -> tuple[bool, HashedSecret | None]:
+        if not self.verify(raw_secret, hashed_secret):
+            return False, None
+        if hashed_secret.salt != self.current_key_id:
+            return True, self.hash(raw_secret)
+        return True, None
+
+    def lookup_hashes(self, raw_secret: str) -> list[HashedSecret]:
+        """
+        Return the digests of a token under every known key, current key first.
+
+        Use them in an ``IN`` lookup on the stored digests to find a token issued
+        under any key that has not been retired yet.
+        """
+        return [self._hash(raw_secret, key_id) for key_id in self._key_ids()]
+
+    def _key_ids(self) -> list[str]:
+        return [self.current_key_id, *(key_id for key_id in self.keys if key_id != self.current_key_id)]
+
+    def _hash(self, raw_secret: str, key_id: str) -> HashedSecret:
+        digest = hmac.digest(self.keys[key_id], raw_secret.encode(), hashlib.sha256)
+        encoded = base64.b64encode(digest).rstrip(b"=").decode()
+        return HashedSecret(f"${self.ALGORITHM}${self.VERSION}${key_id}${encoded}")
+
+
+@dataclass
+class ExecutorHasher:
+    """
+    Async adapter that runs a synchronous hasher on an executor.
+
+    Argon2 is CPU- and memory-bound; running it on the event loop stalls every other
+    request of the worker for the duration of a hash. The underlying argon2 binding
+    releases the GIL, so a thread pool hashes in parallel on all cores; a process
+    pool isolates the work completely at the cost of pickling every call.
+
+    :param hasher: Synchronous hasher doing the work; it must be picklable for a process pool.
+    :param executor: Executor the work is submitted to.
+    """
+
+    hasher: HasherProtocol
+    executor: Executor
+
+    async def verify(self, raw_secret: str, hashed_secret: HashedSecret) -> bool:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.hasher.verify, raw_secret, hashed_secret)
+
+    async def hash(self, raw_secret: str) -> HashedSecret:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.hasher.hash, raw_secret)
+
+    async def verify_and_update(self, raw_secret: str, hashed_secret: HashedSecret) -> tuple[bool, HashedSecret | None]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.hasher.verify_and_update, raw_secret, hashed_secret)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the executor, waiting for submitted hashes if ``wait`` is set."""
+        self.executor.shutdown(wait=wait)
+
+
+def create_hasher_executor(settings: HasherSettings) -> Executor:
+    """Create the executor for hashing configured by ``settings``.
+
+    :param settings: Hasher settings.
+    :return: A thread or process pool executor, with one worker per CPU core unless ``max_workers`` is set.
+    """
+    max_workers = settings.max_workers or os.cpu_count() or 1
+    if settings.executor == "process":
+        # Forking a multi-threaded server process can deadlock the child.
+        return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("forkserver"))
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hasher")
+
+
+def create_async_hasher(
+    hasher: HasherProtocol, executor: Executor, settings: HasherSettings
+) -> AdmissionControlledHasher:
+    """Wrap a synchronous hasher into an async, admission-controlled one.
+
+    The caller owns ``executor`` and shuts it down on exit.
+
+    :param hasher: Synchronous hasher doing the work.
+    :param executor: Executor created by ``create_hasher_executor``.
+    :param settings: Hasher settings.
+    :return: Async hasher running at most ``max_concurrency`` hashes at once on ``executor``.
+    """
+    max_concurrency = settings.max_concurrency or settings.max_workers or os.cpu_count() or 1
+    return AdmissionControlledHasher(
+        hasher=ExecutorHasher(hasher=hasher, executor=executor),
+        max_concurrency=max_concurrency,
+        max_queue=settings.max_queue,
+        queue_timeout=settings.queue_timeout,
+    )
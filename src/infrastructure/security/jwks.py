@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Iterable, Self
+
+from infrastructure.security.jwt import SigningKey
+
+SYMMETRIC_ALGORITHMS = frozenset({"HS256"})
+
+
+@dataclass(frozen=True)
+class JwksDocument:
+    """
+    Pre-serialized JSON Web Key Set of the public verification keys.
+
+    The body and its strong ETag are computed once, so serving the key set is a
+    constant response. Every asymmetric key is published, not just the signing
+    one: during a rotation the next key is published before tokens are signed
+    with it, and the previous key stays until its tokens have expired. Symmetric
+    keys are never published.
+
+    :param body: Serialized key set.
+    :param etag: Strong entity tag of ``body``, quoted.
+    :param headers: Caching headers of every response.
+    """
+
+    body: bytes
+    etag: str
+    headers: dict[str, str]
+
+    @classmethod
+    def from_keys(cls, keys: Iterable[SigningKey], max_age: int) -> Self:
+        jwks = []
+        for key in sorted(keys, key=lambda key: key.kid):
+            if key.algorithm_name in SYMMETRIC_ALGORITHMS:
+                continue
+            jwk = key.algorithm.to_jwk(key.public_key, as_dict=True)
+            jwk.update(kid=key.kid, alg=key.algorithm_name, use="sig")
+            jwks.append(jwk)
+        body = json.dumps({"keys": jwks}, separators=(",", ":"), sort_keys=True).encode()
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        return cls(body=body, etag=etag, headers={"ETag": etag, "Cache-Control": f"public, max-age={max_age}"})
+
+    def matches(self, if_none_match: str | None) -> bool:
+        """Whether an ``If-None-Match`` header value matches this document."""
+        if not if_none_match:
+            return False
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or self.etag in tags
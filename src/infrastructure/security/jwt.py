@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import base64
+import datetime
+import hashlib
+import json
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Literal, Self
+
+from jwt import get_algorithm_by_name
+from jwt.algorithms import Algorithm
+
+from application.dto.token import TokenClaimsDTO, TokenPairDTO
+from core.config import JwtKeySettings, JwtSettings
+from domain.entities.refresh_token import RefreshToken
+from domain.errors import ExpiredJWTToken, InvalidJWTToken
+from domain.value_objects.jwt_token import JwtToken
+from infrastructure.security.hasher import TokenHasher, generate_token
+
+REGISTERED_CLAIMS = frozenset({"iss", "sub", "aud", "exp", "iat", "jti", "typ"})
+
+
+def _b64encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+@dataclass(frozen=True)
+class SigningKey:
+    """
+    A signing key parsed once at startup.
+
+    :param kid: Key id.
+    :param algorithm: PyJWT algorithm implementation.
+    :param algorithm_name: JWS ``alg`` value.
+    :param private_key: Prepared private key, or None for a verification-only key.
+    :param public_key: Prepared key used for verification.
+    :param header: Encoded JOSE header of tokens signed with this key.
+    """
+
+    kid: str
+    algorithm: Algorithm
+    algorithm_name: str
+    private_key: Any
+    public_key: Any
+    header: bytes
+
+    @classmethod
+    def from_settings(cls, settings: JwtKeySettings) -> Self:
+        algorithm = get_algorithm_by_name(settings.algorithm)
+        private_material = settings.read_private_key()
+        private_key = algorithm.prepare_key(private_material) if private_material is not None else None
+        if settings.public_key is not None:
+            public_key = algorithm.prepare_key(settings.public_key.encode())
+        elif private_key is None:
+            raise ValueError(f"JWT key {settings.kid!r} has neither a private nor a public key")
+        elif settings.algorithm == "HS256":
+            public_key = private_key
+        else:
+            public_key = private_key.public_key()
+        header = {"alg": settings.algorithm, "kid": settings.kid, "typ": "JWT"}
+        return cls(
+            kid=settings.kid,
+            algorithm=algorithm,
+            algorithm_name=settings.algorithm,
+            private_key=private_key,
+            public_key=public_key,
+            header=_b64encode(json.dumps(header, separators=(",", ":")).encode()),
+        )
+
+
+@dataclass
+class VerifiedTokenCache:
+    """
+    Bounded LRU of verified token claims keyed by the SHA-256 digest of the token.
+
+    An entry never outlives the ``exp`` of its token, so a cached token expires
+    exactly when it would fail verification.
+
+    :param maxsize: Maximum number of entries.
+    """
+
+    maxsize: int
+    hits: int = 0
+    misses: int = 0
+    _entries: OrderedDict[bytes, TokenClaimsDTO] = field(default_factory=OrderedDict, init=False, repr=False)
+
+    def get(self, digest: bytes, now: float) -> TokenClaimsDTO | None:
+        claims = self._entries.get(digest)
+        if claims is None:
+            self.misses += 1
+            return None
+        if claims.expires_at.timestamp() <= now:
+            del self._entries[digest]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(digest)
+        self.hits += 1
+        return claims
+
+    def put(self, digest: bytes, claims: TokenClaimsDTO) -> None:
+        self._entries[digest] = claims
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@dataclass
+class JwtTokenService:
+    """
+    Issues and verifies access/refresh JWT pairs.
+
+    Keys are parsed once when the service is built, and the encoded header of each
+    key is precomputed, so signing a token encodes only its claims. The ``alg`` of a
+    token must match the algorithm of the key named by its ``kid``.
+
+    Verified access tokens are kept in a :class:`VerifiedTokenCache`, so a bearer
+    token presented on every request pays for the signature check once.
+    Refresh tokens are used once, so they are always verified in full.
+
+    The refresh token id (``jti``) is a random 256-bit token. The returned
+    ``RefreshToken`` entity holds its keyed digest, for lookup and revocation.
+
+    :param keys: Keys accepted for verification, by key id.
+    :param signing_key: Key new tokens are signed with.
+    :param token_hasher: Hasher of refresh token ids.
+    :param issuer: Value of the ``iss`` claim.
+    :param audience: Value of the ``aud`` claim, if any.
+    :param access_token_ttl: Lifetime of access tokens in seconds.
+    :param refresh_token_ttl: Lifetime of refresh tokens in seconds.
+    :param cache: Cache of verified access tokens.
+    """
+
+    keys: dict[str, SigningKey]
+    signing_key: SigningKey
+    token_hasher: TokenHasher
+    issuer: str
+    audience: str | None
+    access_token_ttl: int
+    refresh_token_ttl: int
+    cache: VerifiedTokenCache
+
+    @classmethod
+    def from_settings(cls, settings: JwtSettings, token_hasher: TokenHasher) -> Self:
+        keys = {key_settings.kid: SigningKey.from_settings(key_settings) for key_settings in settings.keys}
+        signing_key = keys.get(settings.signing_kid)
+        if signing_key is None or signing_key.private_key is None:
+            raise ValueError(f"JWT signing key {settings.signing_kid!r} is not configured with a private key")
+        return cls(
+            keys=keys,
+            signing_key=signing_key,
+            token_hasher=token_hasher,
+            issuer=settings.issuer,
+            audience=settings.audience,
+            access_token_ttl=settings.access_token_ttl,
+            refresh_token_ttl=settings.refresh_token_ttl,
+            cache=VerifiedTokenCache(maxsize=settings.verified_cache_size),
+        )
+
+    def issue(self, user_id: uuid.UUID, **claims: Any) -> TokenPairDTO:
+        now = int(time.time())
+        access_token = self._sign({
+            **claims,
+            **self._claims(user_id, uuid.uuid4().hex, "access", now, now + self.access_token_ttl),
+        })
+        refresh_id = generate_token()
+        refresh_expires_at = now + self.refresh_token_ttl
+        refresh_token = self._sign(self._claims(user_id, refresh_id, "refresh", now, refresh_expires_at))
+        refresh = RefreshToken(
+            id=user_id,
+            hashed_token=self.token_hasher.hash(refresh_id),
+            expires_at=datetime.datetime.fromtimestamp(refresh_expires_at, datetime.UTC),
+        )
+        return TokenPairDTO(
+            access_token=access_token,
+            refresh_token=refresh_token,
+            refresh=refresh,
+            expires_in=self.access_token_ttl,
+        )
+
+    def verify_access_token(self, token: str) -> TokenClaimsDTO:
+        now = time.time()
+        digest = hashlib.sha256(token.encode()).digest()
+        claims = self.cache.get(digest, now)
+        if claims is None:
+            claims = self._verify(token, "access", now)
+            self.cache.put(digest, claims)
+        return claims
+
+    def verify_refresh_token(self, token: str) -> TokenClaimsDTO:
+        return self._verify(token, "refresh", time.time())
+
+    def _claims(
+        self, user_id: uuid.UUID, token_id: str, token_type: str, issued_at: int, expires_at: int
+    ) -> dict[str, Any]:
+        claims: dict[str, Any] = {
+            "iss": self.issuer,
+            "sub": str(user_id),
+            "iat": issued_at,
+            "exp": expires_at,
+            "jti": token_id,
+            "typ": token_type,
+        }
+        if self.audience is not None:
+            claims["aud"] = self.audience
+        return claims
+
+    def _sign(self, claims: dict[str, Any]) -> JwtToken:
+        key = self.signing_key
+        signing_input = key.header + b"." + _b64encode(json.dumps(claims, separators=(",", ":")).encode())
+        signature = key.algorithm.sign(signing_input, key.private_key)
+        return JwtToken((signing_input + b"." + _b64encode(signature)).decode("ascii"))
+
+    def _verify(self, token: str, token_type: Literal["access", "refresh"], now: float) -> TokenClaimsDTO:
+        jwt_token = JwtToken(token)
+        header = jwt_token.header_obj
+        kid = header.get("kid", "")
+        if not isinstance(kid, str):
+            raise InvalidJWTToken("Invalid JWT token: 'kid' must be a string")
+        key = self.keys.get(kid)
+        if key is None:
+            raise InvalidJWTToken("Invalid JWT token: unknown signing key")
+        if header["alg"] != key.algorithm_name:
+            raise InvalidJWTToken("Invalid JWT token: algorithm does not match the signing key")
+        if not key.algorithm.verify(jwt_token.signing_input, key.public_key, jwt_token.signature_bytes):
+            raise InvalidJWTToken("Invalid JWT token: signature verification failed")
+
+        payload = jwt_token.payload_obj
+        if payload.get("typ") != token_type:
+            raise InvalidJWTToken(f"Invalid JWT token: expected a {token_type} token")
+        if payload.get("iss") != self.issuer:
+            raise InvalidJWTToken("Invalid JWT token: unexpected issuer")
+        if self.audience is not None and payload.get("aud") != self.audience:
+            raise InvalidJWTToken("Invalid JWT token: unexpected audience")
+        try:
+            expires_at = int(payload["exp"])
+            issued_at = int(payload["iat"])
+            subject = uuid.UUID(payload["sub"])
+            token_id = str(payload["jti"])
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            # uuid.UUID() raises AttributeError for a non-string subject.
+            raise InvalidJWTToken(f"Invalid JWT token: missing or malformed claim: {e}")
+        if expires_at <= now:
+            raise ExpiredJWTToken("Invalid JWT token: token has expired")
+
+        return TokenClaimsDTO(
+            subject=subject,
+            token_id=token_id,
+            token_type=token_type,
+            issued_at=datetime.datetime.fromtimestamp(issued_at, datetime.UTC),
+            expires_at=datetime.datetime.fromtimestamp(expires_at, datetime.UTC),
+            extra={name: value for name, value in payload.items() if name not in REGISTERED_CLAIMS},
+        )
@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import hashlib
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Self
+
+from core.config import RevocationFilterSettings
+from core.logging import get_logger
+from domain.value_objects.hashed_secret import HashedSecret
+from infrastructure.database.repository.revoked_token import RevokedTokenRepository
+
+logger = get_logger(__name__)
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+SYNC_BATCH_SIZE = 10_000
+"""Revocations read per query while syncing."""
+
+
+@dataclass
+class BloomFilter:
+    """
+    Bloom filter over strings.
+
+    Sized for ``capacity`` keys at ``error_rate`` false positives. The bit
+    positions come from one BLAKE2b digest per key, with double hashing.
+
+    :param capacity: Number of keys the filter is sized for.
+    :param error_rate: False-positive rate at ``capacity`` keys.
+    """
+
+    capacity: int
+    error_rate: float
+    count: int = field(default=0, init=False)
+    size: int = field(init=False)
+    hash_count: int = field(init=False)
+    _bits: bytearray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.size = max(64, math.ceil(-self.capacity * math.log(self.error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / self.capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self._bits)
+
+    @property
+    def estimated_false_positive_rate(self) -> float:
+        return (1 - math.exp(-self.hash_count * self.count / self.size)) ** self.hash_count
+
+    def add(self, key: str) -> None:
+        added = False
+        for index in self._indexes(key):
+            byte, bit = divmod(index, 8)
+            if not self._bits[byte] & (1 << bit):
+                self._bits[byte] |= 1 << bit
+                added = True
+        # Keys re-read by overlapping syncs do not inflate the count; the rare new key
+        # whose bits are all set already is not counted either.
+        if added:
+            self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        for index in self._indexes(key):
+            byte, bit = divmod(index, 8)
+            if not self._bits[byte] & (1 << bit):
+                return False
+        return True
+
+    def _indexes(self, key: str) -> list[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
+
+
+@dataclass(frozen=True)
+class RevocationStatistics:
+    """
+    Point-in-time snapshot of the revocation filter.
+
+    :param entries: Revocations loaded into the filter.
+    :param size_bytes: Memory used by the filter bits.
+    :param estimated_false_positive_rate: False-positive rate expected at the current fill.
+    :param lookups: Total number of revocation checks.
+    :param definite_misses: Checks answered by the filter without a database query.
+    :param false_positives: Checks the filter passed on that the database found not revoked.
+    :param last_sync_at: Monotonic time of the last successful sync, or None before the first one.
+    """
+
+    entries: int
+    size_bytes: int
+    estimated_false_positive_rate: float
+    lookups: int
+    definite_misses: int
+    false_positives: int
+    last_sync_at: float | None
+
+    @property
+    def observed_false_positive_rate(self) -> float:
+        queried = self.lookups - self.definite_misses
+        return self.false_positives / queried if queried else 0.0
+
+
+@dataclass
+class RevocationFilter:
+    """
+    Local Bloom filter of revoked refresh tokens in front of the denylist table.
+
+    A token the filter has never seen is definitely not revoked, so almost every
+    refresh skips the database query. Only filter hits, which are real
+    revocations or false positives, are confirmed in the database. The filter is
+    kept current by :meth:`sync`, which reads only the revocations added since the
+    previous sync. Reading restarts ``sync_overlap`` seconds back, to catch
+    transactions that committed late. :meth:`rebuild` starts from an empty filter,
+    dropping expired revocations. It runs when the filter outgrows its capacity
+    or after ``rebuild_interval`` seconds.
+
+    Revocations made by this process are visible at once. Revocations made by
+    other instances are visible after their next sync. Until the first load
+    completes, every check goes to the database.
+
+    :param repository: Denylist storage.
+    :param capacity: Revocations the filter is sized for.
+    :param error_rate: False-positive rate at ``capacity``.
+    :param sync_interval: Seconds between incremental syncs in :meth:`run`.
+    :param sync_overlap: Seconds re-read by every incremental sync.
+    :param rebuild_interval: Seconds between full rebuilds in :meth:`run`.
+    """
+
+    repository: RevokedTokenRepository
+    capacity: int
+    error_rate: float
+    sync_interval: float = 5.0
+    sync_overlap: float = 10.0
+    rebuild_interval: float = 3600.0
+    lookups: int = field(default=0, init=False)
+    definite_misses: int = field(default=0, init=False)
+    false_positives: int = field(default=0, init=False)
+    _filter: BloomFilter = field(init=False, repr=False)
+    _cursor: datetime.datetime = field(default=_EPOCH, init=False, repr=False)
+    _ready: bool = field(default=False, init=False, repr=False)
+    _revoked_during_rebuild: set[str] | None = field(default=None, init=False, repr=False)
+    _last_sync_at: float | None = field(default=None, init=False, repr=False)
+    _last_rebuild_at: float = field(default=0.0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._filter = BloomFilter(capacity=self.capacity, error_rate=self.error_rate)
+
+    @classmethod
+    def from_settings(cls, repository: RevokedTokenRepository, settings: RevocationFilterSettings) -> Self:
+        return cls(
+            repository=repository,
+            capacity=settings.capacity,
+            error_rate=settings.error_rate,
+            sync_interval=settings.sync_interval,
+            sync_overlap=settings.sync_overlap,
+            rebuild_interval=settings.rebuild_interval,
+        )
+
+    async def is_revoked(self, hashed_token: HashedSecret) -> bool:
+        self.lookups += 1
+        if self._ready and hashed_token.as_generic_type() not in self._filter:
+            self.definite_misses += 1
+            return False
+        revoked = await self.repository.exists(hashed_token)
+        if self._ready and not revoked:
+            self.false_positives += 1
+        return revoked
+
+    async def revoke(self, hashed_token: HashedSecret, expires_at: datetime.datetime) -> None:
+        await self.repository.add(hashed_token, expires_at)
+        self._filter.add(hashed_token.as_generic_type())
+        if self._revoked_during_rebuild is not None:
+            self._revoked_during_rebuild.add(hashed_token.as_generic_type())
+
+    async def sync(self) -> int:
+        """
+        Load the revocations added since the previous sync.
+
+        Rebuilds instead when the filter was never loaded or has outgrown its capacity.
+
+        :return: Number of revocations read.
+        """
+        if not self._ready or self._filter.count > self.capacity:
+            return await self.rebuild()
+        loaded, self._cursor = await self._load(
+            self._filter, max(_EPOCH, self._cursor - datetime.timedelta(seconds=self.sync_overlap))
+        )
+        return loaded
+
+    async def rebuild(self) -> int:
+        """
+        Replace the filter with one loaded from all unexpired revocations.
+
+        :return: Number of revocations read.
+        """
+        rebuilt = BloomFilter(
+            capacity=max(self.capacity, self._filter.count * 2),
+            error_rate=self.error_rate,
+        )
+        # Local revocations may commit after the rows they would appear in were read.
+        self._revoked_during_rebuild = set()
+        try:
+            loaded, cursor = await self._load(rebuilt, _EPOCH)
+            for hashed_token in self._revoked_during_rebuild:
+                rebuilt.add(hashed_token)
+        finally:
+            self._revoked_during_rebuild = None
+        self._filter = rebuilt
+        self._cursor = cursor
+        self._ready = True
+        self._last_rebuild_at = time.monotonic()
+        return loaded
+
+    async def run(self) -> None:
+        """Keep the filter in sync until cancelled."""
+        while True:
+            try:
+                if not self._ready or time.monotonic() - self._last_rebuild_at >= self.rebuild_interval:
+                    await self.rebuild()
+                else:
+                    await self.sync()
+            except Exception:
+                logger.warning("Refresh token revocation sync failed", exc_info=True)
+            await asyncio.sleep(self.sync_interval)
+
+    def statistics(self) -> RevocationStatistics:
+        return RevocationStatistics(
+            entries=self._filter.count,
+            size_bytes=self._filter.size_bytes,
+            estimated_false_positive_rate=self._filter.estimated_false_positive_rate,
+            lookups=self.lookups,
+            definite_misses=self.definite_misses,
+            false_positives=self.false_positives,
+            last_sync_at=self._last_sync_at,
+        )
+
+    async def _load(self, bloom: BloomFilter, after: datetime.datetime) -> tuple[int, datetime.datetime]:
+        loaded = 0
+        cursor = max(self._cursor, after)
+        # Keyset position of the next page: the last row read so far.
+        page_revoked_at, page_hashed_token = after, ""
+        while True:
+            rows = await self.repository.get_revoked_after(page_revoked_at, page_hashed_token, limit=SYNC_BATCH_SIZE)
+            for hashed_token, revoked_at in rows:
+                bloom.add(hashed_token)
+            if rows:
+                page_hashed_token, page_revoked_at = rows[-1]
+            loaded += len(rows)
+            cursor = max(cursor, page_revoked_at)
+            if len(rows) < SYNC_BATCH_SIZE:
+                break
+        self._last_sync_at = time.monotonic()
+        return loaded, cursor
@@ -0,0 +1,53 @@
+"""
+Bulk import of existing accounts into the ``users`` table::
+
+    PYTHONPATH=src python -m interface.cli.import_users users.csv --reject-file rejects.jsonl
+
+The input is a CSV file with a header row or a JSON Lines file with the fields
+``email``, ``hashed_password`` and optionally ``id`` and ``is_active``.
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+from core.config import get_settings
+from infrastructure.database.engine import create_engine_from_settings
+from infrastructure.database.importer import ImportReport, UserCopyImporter, read_user_records
+from infrastructure.database.mapper import get_mapper
+
+
+def print_progress(report: ImportReport) -> None:
+    print(
+        f"read {report.read}, imported {report.imported}, rejected {report.rejected} "
+        f"({report.rows_per_second:,.0f} rows/s)",
+        file=sys.stderr,
+    )
+
+
+async def import_users(path: Path, reject_file: Path, batch_size: int) -> ImportReport:
+    records = read_user_records(path)
+    engine = create_engine_from_settings(get_settings())
+    importer = UserCopyImporter(engine=engine, mapper=get_mapper(), batch_size=batch_size, on_progress=print_progress)
+    try:
+        with reject_file.open("w", encoding="utf-8") as rejects:
+            return await importer.run(records, rejects)
+    finally:
+        await engine.dispose()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", type=Path, help="CSV or JSON Lines file to import")
+    parser.add_argument("--reject-file", type=Path, default=Path("rejects.jsonl"), help="where invalid rows go")
+    parser.add_argument("--batch-size", type=int, default=10_000, help="rows copied per transaction")
+    args = parser.parse_args()
+
+    report = asyncio.run(import_users(args.path, args.reject_file, args.batch_size))
+    print_progress(report)
+    return 1 if report.rejected else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
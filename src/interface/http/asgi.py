@@ -1,16 +1,30 @@
 from litestar import Litestar
 
+from application.errors import HashingOverloaded
+from core.config import Settings
+from interface.http.controlles.jwks import jwks
 from interface.http.controlles.system import health
+from interface.http.exception_handlers import hashing_overloaded_handler
+from interface.http.lifespan import email_outbox_lifespan, jwks_lifespan
 
 
-def create_asgi_application() -> Litestar:
+def create_asgi_application(settings: Settings | None = None) -> Litestar:
     """Returned ASGI application.
 
+    :param settings: Application settings; read from the environment at startup when not given.
     :return: ASGI application.
     """
     app = Litestar(
         route_handlers=[
             health,
-        ]
+            jwks,
+        ],
+        exception_handlers={
+            HashingOverloaded: hashing_overloaded_handler,
+        },
+        lifespan=[
+            jwks_lifespan(settings),
+            email_outbox_lifespan(settings),
+        ],
     )
     return app
@@ -0,0 +1,19 @@
+from typing import Any
+
+from litestar import Request, Response, get
+from litestar.datastructures import State
+from litestar.enums import MediaType
+from litestar.exceptions import NotFoundException
+from litestar.status_codes import HTTP_304_NOT_MODIFIED
+
+from infrastructure.security.jwks import JwksDocument
+
+
+@get("/.well-known/jwks.json", sync_to_thread=False)
+def jwks(request: Request[Any, Any, Any], state: State) -> Response[bytes]:
+    document: JwksDocument | None = state.jwks
+    if document is None:
+        raise NotFoundException("JWT signing is not configured")
+    if document.matches(request.headers.get("if-none-match")):
+        return Response(content=b"", status_code=HTTP_304_NOT_MODIFIED, headers=document.headers)
+    return Response(content=document.body, media_type=MediaType.JSON, headers=document.headers)
@@ -0,0 +1,17 @@
+from typing import Any
+
+from litestar import Request, Response
+from litestar.status_codes import HTTP_503_SERVICE_UNAVAILABLE
+
+from application.errors import HashingOverloaded
+
+RETRY_AFTER_SECONDS = 1
+
+
+def hashing_overloaded_handler(request: Request[Any, Any, Any], exc: HashingOverloaded) -> Response[dict[str, object]]:
+    """Turn hashing overload into an immediate 503 the client may retry."""
+    return Response(
+        content={"status_code": HTTP_503_SERVICE_UNAVAILABLE, "detail": "Service is overloaded, retry later"},
+        status_code=HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+    )
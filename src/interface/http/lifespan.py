@@ -0,0 +1,77 @@
+import asyncio
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, suppress
+from typing import AsyncIterator, Callable
+
+from litestar import Litestar
+
+from core.config import Settings, get_settings
+from infrastructure.database.engine import create_engine_from_settings
+from infrastructure.database.repository.email_outbox import EmailOutboxRepository
+from infrastructure.database.session import get_async_session_factory
+from infrastructure.email.factory import create_dead_letter_sink, create_email_sender
+from infrastructure.email.outbox import EmailOutboxWorker
+from infrastructure.security.jwks import JwksDocument
+from infrastructure.security.jwt import SigningKey
+
+
+def jwks_lifespan(settings: Settings | None = None) -> Callable[[Litestar], AbstractAsyncContextManager[None]]:
+    """
+    Publish the key set of the configured JWT keys in ``app.state.jwks``.
+
+    The keys are parsed and the key set serialized once, at startup. Without JWT
+    settings ``app.state.jwks`` is None.
+
+    :param settings: Application settings; read from the environment at startup when not given.
+    :return: Lifespan context manager factory for Litestar.
+    """
+
+    @asynccontextmanager
+    async def lifespan(app: Litestar) -> AsyncIterator[None]:
+        jwt_settings = (settings or get_settings()).jwt
+        app.state.jwks = None
+        if jwt_settings is not None:
+            keys = [SigningKey.from_settings(key) for key in jwt_settings.keys]
+            app.state.jwks = JwksDocument.from_keys(keys, max_age=jwt_settings.jwks_max_age)
+        yield
+
+    return lifespan
+
+
+def email_outbox_lifespan(settings: Settings | None = None) -> Callable[[Litestar], AbstractAsyncContextManager[None]]:
+    """
+    Run the email outbox delivery workers for the lifetime of the application, when the outbox is enabled.
+
+    The outbox and the worker are stored in ``app.state.email_outbox`` and
+    ``app.state.email_outbox_worker``. On shutdown the workers are cancelled and
+    the sender's connections are closed. Messages being sent at that moment are
+    delivered again after the visibility timeout.
+
+    :param settings: Application settings; read from the environment at startup when not given.
+    :return: Lifespan context manager factory for Litestar.
+    """
+
+    @asynccontextmanager
+    async def lifespan(app: Litestar) -> AsyncIterator[None]:
+        app_settings = settings or get_settings()
+        if not app_settings.email.outbox.enabled:
+            yield
+            return
+        engine = create_engine_from_settings(app_settings)
+        outbox = EmailOutboxRepository(get_async_session_factory(engine))
+        sender = create_email_sender(app_settings.email)
+        worker = EmailOutboxWorker.from_settings(
+            outbox, sender, app_settings.email.outbox, dead_letter=create_dead_letter_sink(app_settings.email)
+        )
+        app.state.email_outbox = outbox
+        app.state.email_outbox_worker = worker
+        task = asyncio.create_task(worker.run())
+        try:
+            yield
+        finally:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+            await sender.close()
+            await engine.dispose()
+
+    return lifespan
@@ -0,0 +1,41 @@
+from typing import Callable
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+
+def build_session() -> MagicMock:
+    session = MagicMock()
+    session.__aenter__.return_value = session
+    session.execute = AsyncMock(return_value=MagicMock())
+    session.scalars = AsyncMock(return_value=MagicMock())
+    session.flush = AsyncMock()
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    session.refresh = AsyncMock()
+    session.close = AsyncMock()
+    return session
+
+
+def build_session_factory() -> MagicMock:
+    """Mocked async_sessionmaker; every created session is recorded in ``factory.sessions``."""
+    factory = MagicMock()
+    factory.sessions = []
+
+    def create_session() -> MagicMock:
+        session = build_session()
+        factory.sessions.append(session)
+        return session
+
+    factory.side_effect = create_session
+    return factory
+
+
+@pytest.fixture
+def session_factory() -> MagicMock:
+    return build_session_factory()
+
+
+@pytest.fixture
+def make_session_factory() -> Callable[[], MagicMock]:
+    return build_session_factory
@@ -0,0 +1,140 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy import exc
+from sqlalchemy.util import greenlet_spawn
+
+from core.config import EmailConsoleConfig, EmailSettings, PostgresConnection, Settings
+from infrastructure.database.engine import create_engine_from_settings, create_replica_engines_from_settings
+from infrastructure.database.pool import InstrumentedAsyncQueuePool, get_pool_statistics
+from infrastructure.database.statement_cache import get_statement_cache_statistics, instrument_statement_cache
+
+
+def build_settings(**database_options) -> Settings:
+    return Settings(
+        database=PostgresConnection(
+            name="auth",
+            host="localhost",
+            port=5432,
+            username="user",
+            password="password",
+            **database_options,
+        ),
+        email=EmailSettings(config=EmailConsoleConfig(backend="console"), from_email="noreply@example.com"),
+    )
+
+
+class TestCreateEngineFromSettings:
+    def test_queue_mode_uses_instrumented_pool(self) -> None:
+        settings = build_settings(pool_mode="queue", pool_size=7, pool_max_overflow=3, pool_timeout=2.5)
+        engine = create_engine_from_settings(settings)
+
+        assert isinstance(engine.pool, InstrumentedAsyncQueuePool)
+        assert engine.pool.size() == 7
+        assert engine.pool._max_overflow == 3
+        assert engine.pool.timeout() == 2.5
+
+        statistics = get_pool_statistics(engine)
+        assert statistics is not None
+        assert statistics.size == 7
+        assert statistics.checked_out == 0
+        assert statistics.wait_time_avg == 0.0
+
+    def test_null_mode_uses_null_pool(self) -> None:
+        engine = create_engine_from_settings(build_settings(pool_mode="null"))
+
+        assert isinstance(engine.pool, sa.NullPool)
+        assert get_pool_statistics(engine) is None
+
+    @pytest.mark.parametrize(
+        "pool_mode,prepare_threshold,expected",
+        [("queue", 2, 2), ("null", 0, 0), ("queue", None, None), ("pgbouncer", 2, None)],
+    )
+    def test_prepare_threshold(self, pool_mode: str, prepare_threshold: int | None, expected: int | None) -> None:
+        settings = build_settings(pool_mode=pool_mode, prepare_threshold=prepare_threshold)
+        with (
+            patch("infrastructure.database.engine.create_async_engine") as create_async_engine,
+            patch("infrastructure.database.engine.instrument_statement_cache"),
+        ):
+            create_engine_from_settings(settings)
+
+        kwargs = create_async_engine.call_args.kwargs
+        assert kwargs["connect_args"] == {"prepare_threshold": expected}
+
+    def test_pgbouncer_mode_uses_null_pool(self) -> None:
+        engine = create_engine_from_settings(build_settings(pool_mode="pgbouncer"))
+
+        assert isinstance(engine.pool, sa.NullPool)
+
+    def test_replica_engines(self) -> None:
+        settings = build_settings(replica_hosts=["replica-1", "replica-2:6432"])
+
+        engines = create_replica_engines_from_settings(settings)
+
+        assert [(engine.url.host, engine.url.port) for engine in engines] == [("replica-1", 5432), ("replica-2", 6432)]
+        assert all(isinstance(engine.pool, InstrumentedAsyncQueuePool) for engine in engines)
+
+    def test_statement_cache_is_instrumented(self) -> None:
+        engine = create_engine_from_settings(build_settings(query_cache_size=50))
+
+        assert get_statement_cache_statistics(engine) is not None
+
+
+class TestInstrumentedAsyncQueuePool:
+    @pytest.fixture
+    def pool(self) -> InstrumentedAsyncQueuePool:
+        return InstrumentedAsyncQueuePool(MagicMock, pool_size=1, max_overflow=0, timeout=0.01)
+
+    async def test_counts_checkouts(self, pool: InstrumentedAsyncQueuePool) -> None:
+        def checkout_twice() -> None:
+            pool.connect().close()
+            pool.connect().close()
+
+        await greenlet_spawn(checkout_twice)
+
+        assert pool.counters.checkouts == 2
+        assert pool.counters.timeouts == 0
+        assert pool.counters.wait_time_max >= 0
+
+    async def test_counts_timeouts(self, pool: InstrumentedAsyncQueuePool) -> None:
+        def exhaust() -> None:
+            connection = pool.connect()
+            try:
+                with pytest.raises(exc.TimeoutError):
+                    pool.connect()
+            finally:
+                connection.close()
+
+        await greenlet_spawn(exhaust)
+
+        assert pool.counters.checkouts == 1
+        assert pool.counters.timeouts == 1
+
+    def test_recreate_keeps_counters(self, pool: InstrumentedAsyncQueuePool) -> None:
+        pool.counters.record_checkout(0.5)
+
+        recreated = pool.recreate()
+
+        assert recreated.counters is pool.counters
+        assert recreated.size() == pool.size()
+
+
+class TestStatementCacheInstrumentation:
+    def test_counts_compiled_cache_hits(self) -> None:
+        sync_engine = sa.create_engine("sqlite://")
+        engine = SimpleNamespace(sync_engine=sync_engine)
+        counters = instrument_statement_cache(engine)
+        stmt = sa.select(sa.literal(1))
+
+        with sync_engine.connect() as connection:
+            for _ in range(3):
+                connection.execute(stmt)
+            connection.exec_driver_sql("SELECT 1")
+
+        assert counters.misses == 1
+        assert counters.hits == 2
+        assert counters.uncached == 1
+        assert counters.hit_ratio == pytest.approx(2 / 3)
+        assert get_statement_cache_statistics(engine) is counters
@@ -0,0 +1,271 @@
+import asyncio
+import dataclasses
+from typing import Sequence
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from application.dto.email_message import DeliveryResultDTO, EmailMessageContent, EmailMessageDTO
+from application.dto.email_outbox import OutboxEntryDTO, OutboxLagDTO
+from application.ports.email_sender import EmailSender
+from infrastructure.database.repository.email_outbox import EmailOutboxRepository
+from infrastructure.email.outbox import EmailOutboxWorker
+
+
+def make_message(to_email: str) -> EmailMessageDTO:
+    return EmailMessageDTO(
+        to_email=to_email,
+        subject="Hi",
+        content=EmailMessageContent(type="text/plain", body="Hello"),
+        alternative_contents=(EmailMessageContent(type="text/html", body="<p>Hello</p>"),),
+    )
+
+
+class FakeOutbox:
+    def __init__(self, count: int) -> None:
+        self.entries = {
+            i: OutboxEntryDTO(id=i, message=make_message(f"user{i}@example.com"), attempts=0) for i in range(count)
+        }
+        self.claimed: set[int] = set()
+        self.extended: list[list[int]] = []
+        self.next_id = count
+
+    async def enqueue(self, *messages: EmailMessageDTO) -> None:
+        for message in messages:
+            self.entries[self.next_id] = OutboxEntryDTO(id=self.next_id, message=message, attempts=0)
+            self.next_id += 1
+
+    async def claim(self, limit: int, visibility_timeout: float, max_attempts: int) -> list[OutboxEntryDTO]:
+        due = [
+            dataclasses.replace(entry, attempts=entry.attempts + 1)
+            for entry_id, entry in sorted(self.entries.items())
+            if entry_id not in self.claimed and entry.attempts < max_attempts
+        ][:limit]
+        self.entries.update((entry.id, entry) for entry in due)
+        self.claimed.update(entry.id for entry in due)
+        return due
+
+    async def extend(self, ids: Sequence[int], visibility_timeout: float) -> None:
+        self.extended.append(list(ids))
+
+    async def complete(self, ids: Sequence[int]) -> None:
+        for entry_id in ids:
+            del self.entries[entry_id]
+
+    async def remove_exhausted(self, limit: int, max_attempts: int) -> list[OutboxEntryDTO]:
+        exhausted = [
+            entry
+            for entry_id, entry in sorted(self.entries.items())
+            if entry_id not in self.claimed and entry.attempts >= max_attempts
+        ][:limit]
+        for entry in exhausted:
+            del self.entries[entry.id]
+        return exhausted
+
+    async def lag(self, max_attempts: int) -> OutboxLagDTO:
+        return OutboxLagDTO(pending=len(self.entries), oldest_age=1.5 if self.entries else 0.0)
+
+
+class RecordingDeadLetterSink:
+    def __init__(self) -> None:
+        self.results: list[DeliveryResultDTO] = []
+
+    async def put(self, result: DeliveryResultDTO) -> None:
+        self.results.append(result)
+
+
+class RecordingSender(EmailSender):
+    def __init__(
+        self, failing: frozenset[str] = frozenset(), rejected: frozenset[str] = frozenset(), delay: float = 0.0
+    ) -> None:
+        super().__init__(name="recording")
+        self.failing = failing
+        self.rejected = rejected
+        self.delay = delay
+        self.batches: list[list[str]] = []
+
+    async def deliver(self, *messages: EmailMessageDTO) -> list[DeliveryResultDTO]:
+        self.batches.append([message.to_email for message in messages])
+        await asyncio.sleep(self.delay)
+        return [
+            DeliveryResultDTO(
+                message=message,
+                status="failed"
+                if message.to_email in self.failing
+                else "rejected"
+                if message.to_email in self.rejected
+                else "sent",
+            )
+            for message in messages
+        ]
+
+
+class TestEmailOutboxWorker:
+    async def test_sends_and_completes_batches(self) -> None:
+        outbox = FakeOutbox(5)
+        sender = RecordingSender()
+        worker = EmailOutboxWorker(outbox=outbox, sender=sender, batch_size=2)
+
+        assert [await worker.deliver_batch() for _ in range(4)] == [2, 2, 1, 0]
+
+        assert list(map(len, sender.batches)) == [2, 2, 1]
+        statistics = await worker.statistics()
+        assert (statistics.pending, statistics.lag, statistics.sent, statistics.failed) == (0, 0.0, 5, 0)
+        assert statistics.batches == 3
+
+    async def test_delivers_enqueued_messages(self) -> None:
+        outbox = FakeOutbox(1)
+        sender = RecordingSender()
+        worker = EmailOutboxWorker(outbox=outbox, sender=sender)
+
+        await outbox.enqueue(make_message("a@example.com"), make_message("b@example.com"))
+
+        assert await worker.deliver_batch() == 3
+        assert sender.batches == [["user0@example.com", "a@example.com", "b@example.com"]]
+        assert outbox.entries == {}
+
+    async def test_keeps_only_failed_messages(self) -> None:
+        outbox = FakeOutbox(3)
+        sender = RecordingSender(failing=frozenset({"user1@example.com"}), rejected=frozenset({"user2@example.com"}))
+        worker = EmailOutboxWorker(outbox=outbox, sender=sender)
+
+        assert await worker.deliver_batch() == 3
+
+        assert list(outbox.entries) == [1]
+        statistics = await worker.statistics()
+        assert (statistics.pending, statistics.lag) == (1, 1.5)
+        assert (statistics.sent, statistics.failed, statistics.rejected) == (1, 1, 1)
+
+    async def test_extends_the_claim_while_a_batch_is_being_sent(self) -> None:
+        outbox = FakeOutbox(2)
+        worker = EmailOutboxWorker(outbox=outbox, sender=RecordingSender(delay=0.05), visibility_timeout=0.02)
+
+        assert await worker.deliver_batch() == 2
+
+        assert len(outbox.extended) >= 2
+        assert all(ids == [0, 1] for ids in outbox.extended)
+        extensions = len(outbox.extended)
+        await asyncio.sleep(0.03)
+        assert len(outbox.extended) == extensions
+
+    async def test_dead_letters_messages_failing_their_last_attempt(self) -> None:
+        outbox = FakeOutbox(2)
+        dead_letter = RecordingDeadLetterSink()
+        worker = EmailOutboxWorker(
+            outbox=outbox,
+            sender=RecordingSender(failing=frozenset({"user1@example.com"})),
+            max_attempts=2,
+            dead_letter=dead_letter,
+        )
+
+        assert await worker.deliver_batch() == 2
+        outbox.claimed.clear()
+        assert await worker.deliver_batch() == 1
+
+        assert outbox.entries == {}
+        assert [(result.message.to_email, result.attempts) for result in dead_letter.results] == [
+            ("user1@example.com", 2)
+        ]
+        statistics = await worker.statistics()
+        assert (statistics.sent, statistics.failed, statistics.exhausted) == (1, 1, 1)
+
+    async def test_dead_letters_exhausted_messages_left_behind(self) -> None:
+        outbox = FakeOutbox(2)
+        outbox.entries[0] = dataclasses.replace(outbox.entries[0], attempts=3)
+        dead_letter = RecordingDeadLetterSink()
+        worker = EmailOutboxWorker(outbox=outbox, sender=RecordingSender(), max_attempts=3, dead_letter=dead_letter)
+
+        assert await worker.dead_letter_exhausted() == 1
+
+        assert list(outbox.entries) == [1]
+        assert [(result.message.to_email, result.status) for result in dead_letter.results] == [
+            ("user0@example.com", "failed")
+        ]
+        assert worker.counters.exhausted == 1
+
+    async def test_run_drains_with_concurrent_loops(self) -> None:
+        outbox = FakeOutbox(10)
+        worker = EmailOutboxWorker(
+            outbox=outbox, sender=RecordingSender(), concurrency=3, batch_size=2, poll_interval=0.01
+        )
+
+        task = asyncio.create_task(worker.run())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert outbox.entries == {}
+        assert worker.counters.sent == 10
+
+
+class TestEmailOutboxRepository:
+    async def test_claim_skips_locked_rows_and_sets_visibility_timeout(self, session_factory: MagicMock) -> None:
+        repository = EmailOutboxRepository(session_factory)
+        row = MagicMock(
+            id=7,
+            attempts=1,
+            message={
+                "to_email": "a@example.com",
+                "subject": "Hi",
+                "content": {"type": "text/plain", "body": "Hello"},
+                "alternative_contents": [],
+            },
+        )
+        session = session_factory()
+        session_factory.side_effect = None
+        session_factory.return_value = session
+        session.execute.return_value.all.return_value = [row]
+
+        entries = await repository.claim(limit=10, visibility_timeout=30, max_attempts=5)
+
+        assert entries == [
+            OutboxEntryDTO(
+                id=7,
+                message=EmailMessageDTO(
+                    to_email="a@example.com",
+                    subject="Hi",
+                    content=EmailMessageContent(type="text/plain", body="Hello"),
+                    alternative_contents=(),
+                ),
+                attempts=1,
+            )
+        ]
+        (stmt,) = session.execute.await_args.args
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("UPDATE email_outbox SET")
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "RETURNING" in sql
+        session.commit.assert_awaited_once()
+
+    async def test_remove_exhausted_skips_claimed_rows(self, session_factory: MagicMock) -> None:
+        repository = EmailOutboxRepository(session_factory)
+        session = session_factory()
+        session_factory.side_effect = None
+        session_factory.return_value = session
+        session.execute.return_value.all.return_value = []
+
+        assert await repository.remove_exhausted(limit=10, max_attempts=5) == []
+
+        (stmt,) = session.execute.await_args.args
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("DELETE FROM email_outbox")
+        assert "email_outbox.attempts >= %(attempts_1)s" in sql
+        assert "email_outbox.available_at <=" in sql
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "RETURNING" in sql
+        session.commit.assert_awaited_once()
+
+    async def test_enqueue_serializes_messages(self, session_factory: MagicMock) -> None:
+        repository = EmailOutboxRepository(session_factory)
+        session = session_factory()
+        session_factory.side_effect = None
+        session_factory.return_value = session
+
+        await repository.enqueue(make_message("a@example.com"))
+
+        _, values = session.execute.await_args.args
+        assert values[0]["message"]["to_email"] == "a@example.com"
+        assert values[0]["message"]["alternative_contents"][0]["type"] == "text/html"
+        session.commit.assert_awaited_once()
@@ -1,9 +1,18 @@
+import asyncio
 import io
+import json
+from email.message import EmailMessage
+from pathlib import Path
+from typing import Any
 
+import aiosmtplib
 import pytest
 
-from application.dto.email_message import EmailMessageContent, EmailMessageDTO
+from application.dto.email_message import DeliveryResultDTO, EmailMessageContent, EmailMessageDTO
+from infrastructure.email import smtp
 from infrastructure.email.console import ConsoleEmailSender
+from infrastructure.email.dead_letter import JsonLinesDeadLetterSink
+from infrastructure.email.smtp import SMTPEmailSender
 
 
 @pytest.mark.asyncio
@@ -66,3 +75,251 @@ class TestConsoleEmailSender:
         assert "Content: 2" in text
         lines = [l for l in text.splitlines() if set(l) == {"="}]
         assert len(lines) == 2
+
+
+class FakeSMTP:
+    instances: list["FakeSMTP"] = []
+    replies: dict[str, list[int]] = {}
+    connected = 0
+    max_connected = 0
+
+    def __init__(self, **kwargs: object) -> None:
+        self.kwargs = kwargs
+        self.sessions: list[list[str]] = []
+        self.is_connected = False
+        self.noops = 0
+        self.drop_on_next_send = False
+        self.replies: dict[str, list[int]] = {}
+        FakeSMTP.instances.append(self)
+
+    async def connect(self) -> None:
+        FakeSMTP.connected += 1
+        FakeSMTP.max_connected = max(FakeSMTP.max_connected, FakeSMTP.connected)
+        self.is_connected = True
+        self.sessions.append([])
+
+    async def quit(self) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self.is_connected:
+            FakeSMTP.connected -= 1
+        self.is_connected = False
+
+    async def noop(self) -> None:
+        self.noops += 1
+
+    async def send_message(self, message: EmailMessage) -> None:
+        await asyncio.sleep(0)
+        if self.drop_on_next_send:
+            self.drop_on_next_send = False
+            self.close()
+            raise aiosmtplib.SMTPServerDisconnected("Connection lost")
+        replies = self.replies.get(message["To"]) or FakeSMTP.replies.get(message["To"])
+        if replies:
+            code = replies.pop(0)
+            raise aiosmtplib.SMTPRecipientsRefused([aiosmtplib.SMTPRecipientRefused(code, "Refused", message["To"])])
+        self.sessions[-1].append(message["To"])
+
+
+class RecordingDeadLetterSink:
+    def __init__(self) -> None:
+        self.results: list[DeliveryResultDTO] = []
+
+    async def put(self, result: DeliveryResultDTO) -> None:
+        self.results.append(result)
+
+
+def make_message(to_email: str) -> EmailMessageDTO:
+    return EmailMessageDTO(
+        to_email=to_email,
+        subject="Hi",
+        content=EmailMessageContent(type="text/plain", body="Hello"),
+        alternative_contents=[EmailMessageContent(type="text/html", body="<p>Hello</p>")],
+    )
+
+
+class TestSMTPEmailSender:
+    @pytest.fixture(autouse=True)
+    def fake_smtp(self, monkeypatch: pytest.MonkeyPatch) -> type[FakeSMTP]:
+        FakeSMTP.instances = []
+        FakeSMTP.replies = {}
+        FakeSMTP.connected = FakeSMTP.max_connected = 0
+        monkeypatch.setattr(smtp.aiosmtplib, "SMTP", FakeSMTP)
+        return FakeSMTP
+
+    def make_sender(self, **kwargs: Any) -> SMTPEmailSender:
+        kwargs.setdefault("retry_base_delay", 0)
+        return SMTPEmailSender(
+            host="localhost",
+            port=25,
+            username="user",
+            password="password",
+            use_tls=False,
+            use_ssl=False,
+            from_email="noreply@example.com",
+            **kwargs,
+        )
+
+    async def test_spreads_batch_over_pool(self) -> None:
+        sender = self.make_sender(pool_size=3, max_messages_per_connection=100)
+
+        count = await sender.send_messages(*(make_message(f"user{i}@example.com") for i in range(9)))
+
+        assert count == 9
+        assert FakeSMTP.max_connected == 3
+        assert sorted(len(client.sessions[0]) for client in FakeSMTP.instances) == [3, 3, 3]
+
+    async def test_caps_messages_per_connection(self) -> None:
+        sender = self.make_sender(pool_size=2, max_messages_per_connection=2)
+
+        count = await sender.send_messages(*(make_message(f"user{i}@example.com") for i in range(7)))
+
+        assert count == 7
+        assert FakeSMTP.max_connected == 2
+        sessions = [session for client in FakeSMTP.instances for session in client.sessions]
+        assert all(len(session) <= 2 for session in sessions)
+        assert sum(map(len, sessions)) == 7
+
+    async def test_concurrent_calls_share_the_pool(self) -> None:
+        sender = self.make_sender(pool_size=2)
+
+        counts = await asyncio.gather(*(sender.send_messages(make_message(f"user{i}@example.com")) for i in range(5)))
+
+        assert counts == [1] * 5
+        assert len(FakeSMTP.instances) == 2
+        assert FakeSMTP.max_connected == 2
+
+    async def test_failed_message_is_not_counted(self) -> None:
+        FakeSMTP.replies["fail@example.com"] = [550]
+        sender = self.make_sender()
+
+        count = await sender.send_messages(make_message("a@example.com"), make_message("fail@example.com"))
+
+        assert count == 1
+
+    async def test_retries_transient_reply_with_backoff(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        delays: list[float] = []
+
+        async def sleep(delay: float) -> None:
+            if delay:
+                delays.append(delay)
+
+        monkeypatch.setattr(smtp.asyncio, "sleep", sleep)
+        FakeSMTP.replies["a@example.com"] = [451, 451]
+        sender = self.make_sender(retry_base_delay=1.0, retry_max_delay=1.5)
+
+        (result,) = await sender.deliver(make_message("a@example.com"))
+
+        assert (result.status, result.attempts) == ("sent", 3)
+        assert 0.5 <= delays[0] <= 1.0
+        assert 0.75 <= delays[1] <= 1.5
+
+    async def test_reports_failure_after_last_retry(self) -> None:
+        FakeSMTP.replies["a@example.com"] = [421] * 3
+        sender = self.make_sender(max_retries=2)
+
+        (result,) = await sender.deliver(make_message("a@example.com"))
+
+        assert (result.status, result.attempts, result.code) == ("failed", 3, 421)
+
+    async def test_fails_rest_of_chunk_when_server_is_unreachable(self) -> None:
+        async def refuse(self: FakeSMTP) -> None:
+            raise aiosmtplib.SMTPConnectError("Connection refused")
+
+        sender = self.make_sender(max_retries=1)
+        (client,) = FakeSMTP.instances
+        client.connect = refuse.__get__(client)
+
+        results = await sender.deliver(*(make_message(f"user{i}@example.com") for i in range(3)))
+
+        assert [(result.status, result.attempts) for result in results] == [("failed", 2), ("failed", 0), ("failed", 0)]
+
+    async def test_dead_letters_permanent_rejection(self) -> None:
+        FakeSMTP.replies["bad@example.com"] = [550]
+        dead_letter = RecordingDeadLetterSink()
+        sender = self.make_sender(dead_letter=dead_letter)
+
+        results = await sender.deliver(make_message("bad@example.com"), make_message("b@example.com"))
+
+        assert [(result.status, result.attempts, result.code) for result in results] == [
+            ("rejected", 1, 550),
+            ("sent", 1, None),
+        ]
+        assert dead_letter.results == [results[0]]
+
+    async def test_reconnects_partway_through_a_batch(self) -> None:
+        sender = self.make_sender()
+        await sender.send_messages(make_message("a@example.com"))
+        (client,) = FakeSMTP.instances
+        client.drop_on_next_send = True
+
+        results = await sender.deliver(*(make_message(f"user{i}@example.com") for i in range(3)))
+
+        assert [result.status for result in results] == ["sent"] * 3
+        assert [result.to_email for result in (result.message for result in results)] == [
+            "user0@example.com",
+            "user1@example.com",
+            "user2@example.com",
+        ]
+        assert results[0].attempts == 2
+        assert len(client.sessions) == 2
+
+    async def test_keeps_sessions_open_between_calls(self) -> None:
+        sender = self.make_sender()
+
+        await sender.send_messages(make_message("a@example.com"))
+        await sender.send_messages(make_message("b@example.com"))
+
+        (client,) = FakeSMTP.instances
+        assert client.sessions == [["a@example.com", "b@example.com"]]
+        assert client.is_connected
+        await sender.close()
+        assert not client.is_connected
+
+    async def test_checks_idle_session_with_noop(self) -> None:
+        sender = self.make_sender(health_check_interval=0)
+
+        await sender.send_messages(make_message("a@example.com"))
+        await sender.send_messages(make_message("b@example.com"))
+
+        (client,) = FakeSMTP.instances
+        assert client.noops == 1
+        assert len(client.sessions) == 1
+
+    async def test_closes_idle_session(self) -> None:
+        sender = self.make_sender(idle_timeout=0.01)
+
+        await sender.send_messages(make_message("a@example.com"))
+        await asyncio.sleep(0.05)
+
+        (client,) = FakeSMTP.instances
+        assert not client.is_connected
+        assert await sender.send_messages(make_message("b@example.com")) == 1
+        assert len(client.sessions) == 2
+
+    async def test_reconnects_when_server_drops_the_session(self) -> None:
+        sender = self.make_sender()
+        await sender.send_messages(make_message("a@example.com"))
+        (client,) = FakeSMTP.instances
+        client.drop_on_next_send = True
+
+        assert await sender.send_messages(make_message("b@example.com")) == 1
+        assert client.sessions == [["a@example.com"], ["b@example.com"]]
+
+
+class TestJsonLinesDeadLetterSink:
+    async def test_appends_record(self, tmp_path: Path) -> None:
+        sink = JsonLinesDeadLetterSink(tmp_path / "dead-letter.jsonl")
+        result = DeliveryResultDTO(
+            message=make_message("a@example.com"), status="rejected", attempts=1, code=550, error="Refused"
+        )
+
+        await sink.put(result)
+        await sink.put(result)
+
+        records = [json.loads(line) for line in (tmp_path / "dead-letter.jsonl").read_text().splitlines()]
+        assert len(records) == 2
+        assert records[0]["code"] == 550
+        assert records[0]["message"]["to_email"] == "a@example.com"
+        assert records[0]["message"]["alternative_contents"][0]["type"] == "text/html"
@@ -0,0 +1,128 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from litestar import get
+from litestar.testing import create_test_client
+
+from application.errors import HashingOverloaded
+from core.config import HasherSettings
+from domain.value_objects.hashed_secret import HashedSecret
+from infrastructure.security.admission import AdmissionControlledHasher
+from infrastructure.security.hasher import ExecutorHasher, create_async_hasher
+from interface.http.exception_handlers import hashing_overloaded_handler
+
+HASHED_SECRET = HashedSecret("$argon2id$v=19$m=65536,t=3,p=4$c2FsdGJhc2Ux$ZGF0YWhhc2gx")
+
+
+class BlockingHasher:
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.running = 0
+
+    async def verify(self, raw_secret: str, hashed_secret: HashedSecret) -> bool:
+        self.running += 1
+        await self.release.wait()
+        return True
+
+    async def hash(self, raw_secret: str) -> HashedSecret:
+        await self.verify(raw_secret, HASHED_SECRET)
+        return HASHED_SECRET
+
+
+async def settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestAdmissionControlledHasher:
+    @pytest.fixture
+    def inner(self) -> BlockingHasher:
+        return BlockingHasher()
+
+    @pytest.fixture
+    def hasher(self, inner: BlockingHasher) -> AdmissionControlledHasher:
+        return AdmissionControlledHasher(hasher=inner, max_concurrency=2, max_queue=1, queue_timeout=10)
+
+    async def test_limits_concurrency_and_rejects_when_queue_is_full(
+        self, hasher: AdmissionControlledHasher, inner: BlockingHasher
+    ) -> None:
+        calls = [asyncio.create_task(hasher.verify("secret", HASHED_SECRET)) for _ in range(3)]
+        await settle()
+
+        assert inner.running == 2
+        statistics = hasher.statistics()
+        assert (statistics.in_flight, statistics.queue_depth) == (2, 1)
+
+        with pytest.raises(HashingOverloaded):
+            await hasher.hash("secret")
+
+        inner.release.set()
+        assert await asyncio.gather(*calls) == [True, True, True]
+        statistics = hasher.statistics()
+        assert (statistics.admitted, statistics.rejected, statistics.in_flight) == (3, 1, 0)
+        assert statistics.wait_time_max > 0
+
+    async def test_rejects_after_queue_timeout(self, inner: BlockingHasher) -> None:
+        hasher = AdmissionControlledHasher(hasher=inner, max_concurrency=1, max_queue=5, queue_timeout=0.01)
+        running = asyncio.create_task(hasher.verify("secret", HASHED_SECRET))
+        await settle()
+
+        with pytest.raises(HashingOverloaded):
+            await hasher.verify("secret", HASHED_SECRET)
+
+        assert hasher.statistics().timed_out == 1
+        assert hasher.statistics().queue_depth == 0
+        inner.release.set()
+        await running
+
+    async def test_cancelled_caller_keeps_slot_until_hash_finishes(self, inner: BlockingHasher) -> None:
+        hasher = AdmissionControlledHasher(hasher=inner, max_concurrency=1, max_queue=5, queue_timeout=10)
+        cancelled = asyncio.create_task(hasher.verify("secret", HASHED_SECRET))
+        await settle()
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+
+        waiting = asyncio.create_task(hasher.verify("secret", HASHED_SECRET))
+        await settle()
+
+        assert inner.running == 1
+        statistics = hasher.statistics()
+        assert (statistics.in_flight, statistics.queue_depth) == (1, 1)
+        inner.release.set()
+        assert await waiting is True
+        assert inner.running == 2
+        assert hasher.statistics().in_flight == 0
+
+    async def test_slot_is_released_on_error(self) -> None:
+        inner = MagicMock()
+        inner.verify.side_effect = RuntimeError()
+        hasher = AdmissionControlledHasher(hasher=inner, max_concurrency=1, max_queue=0, queue_timeout=1)
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await hasher.verify("secret", HASHED_SECRET)
+
+        assert hasher.statistics().in_flight == 0
+
+
+def test_create_async_hasher_defaults_concurrency_to_workers() -> None:
+    hasher = create_async_hasher(MagicMock(), MagicMock(), HasherSettings(max_workers=3, max_queue=10))
+
+    assert isinstance(hasher.hasher, ExecutorHasher)
+    assert (hasher.max_concurrency, hasher.max_queue) == (3, 10)
+
+
+def test_overload_is_served_as_503() -> None:
+    @get("login/")
+    async def login() -> None:
+        raise HashingOverloaded()
+
+    with create_test_client(
+        route_handlers=[login], exception_handlers={HashingOverloaded: hashing_overloaded_handler}
+    ) as client:
+        response = client.get("/login/")
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
@@ -0,0 +1,150 @@
+import io
+import json
+import uuid
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from domain.errors import InvalidEmail, InvalidHashedSecret
+from infrastructure.database.importer import ImportRecord, UserCopyImporter, parse_user_record, read_user_records
+from infrastructure.database.mapper import get_mapper
+
+HASHED_PASSWORD = "$argon2id$v=19$m=65536,t=3,p=4$c2FsdGJhc2Ux$ZGF0YWhhc2gx"
+
+
+def build_engine() -> MagicMock:
+    connection = MagicMock()
+    connection.get_raw_connection = AsyncMock()
+    engine = MagicMock()
+    engine.connect.return_value.__aenter__ = AsyncMock(return_value=connection)
+    engine.connect.return_value.__aexit__ = AsyncMock(return_value=False)
+    return engine
+
+
+class TestParseUserRecord:
+    def test_valid_record(self) -> None:
+        user_id = uuid.uuid4()
+
+        user = parse_user_record({
+            "id": str(user_id),
+            "email": " a@b.com ",
+            "hashed_password": HASHED_PASSWORD,
+            "is_active": "yes",
+        })
+
+        assert user.id == user_id
+        assert user.email.value == "a@b.com"
+        assert user.is_active is True
+
+    def test_defaults(self) -> None:
+        user = parse_user_record({"email": "a@b.com", "hashed_password": HASHED_PASSWORD})
+
+        assert isinstance(user.id, uuid.UUID)
+        assert user.is_active is False
+
+    @pytest.mark.parametrize(
+        ("data", "error"),
+        [
+            ({"hashed_password": HASHED_PASSWORD}, ValueError),
+            ({"email": "not-an-email", "hashed_password": HASHED_PASSWORD}, InvalidEmail),
+            ({"email": "a@b.com", "hashed_password": "plain"}, InvalidHashedSecret),
+            ({"email": "a@b.com", "hashed_password": HASHED_PASSWORD, "is_active": "maybe"}, ValueError),
+            ({"id": "42", "email": "a@b.com", "hashed_password": HASHED_PASSWORD}, ValueError),
+        ],
+    )
+    def test_invalid_record(self, data: dict[str, Any], error: type[Exception]) -> None:
+        with pytest.raises(error):
+            parse_user_record(data)
+
+
+class TestReadUserRecords:
+    def test_csv(self, tmp_path: Path) -> None:
+        path = tmp_path / "users.csv"
+        path.write_text(
+            f'email,hashed_password,is_active\na@b.com,"{HASHED_PASSWORD}",true\nb@b.com,{HASHED_PASSWORD},false\n'
+        )
+
+        records = list(read_user_records(path))
+
+        assert records == [
+            ImportRecord(line=2, data={"email": "a@b.com", "hashed_password": HASHED_PASSWORD, "is_active": "true"}),
+            ImportRecord(line=3, data=None, error="Row has more fields than the header"),
+        ]
+
+    def test_jsonl_reports_undecodable_lines(self, tmp_path: Path) -> None:
+        path = tmp_path / "users.jsonl"
+        path.write_text('{"email": "a@b.com"}\n\n{broken\n[1]\n')
+
+        records = list(read_user_records(path))
+
+        assert [record.line for record in records] == [1, 3, 4]
+        assert records[0].data == {"email": "a@b.com"}
+        assert records[1].data is None and records[1].error.startswith("Invalid JSON")
+        assert records[2].error == "Expected a JSON object"
+
+    def test_unsupported_format(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError):
+            read_user_records(tmp_path / "users.xml")
+
+
+class TestUserCopyImporter:
+    async def test_batches_and_rejects(self) -> None:
+        progress = []
+        importer = UserCopyImporter(
+            engine=build_engine(),
+            mapper=get_mapper(),
+            batch_size=2,
+            on_progress=lambda report: progress.append(report.imported),
+        )
+        copied: list[list[dict[str, Any]]] = []
+
+        async def copy(connection: Any, rows: list[dict[str, Any]]) -> set[uuid.UUID]:
+            copied.append(rows)
+            return {row["id"] for row in rows if row["email"] != "taken@b.com"}
+
+        importer._copy = copy  # type: ignore[method-assign]
+        records = [
+            ImportRecord(line=1, data={"email": "a@b.com", "hashed_password": HASHED_PASSWORD}),
+            ImportRecord(line=2, data={"email": "bad", "hashed_password": HASHED_PASSWORD}),
+            ImportRecord(line=3, data={"email": "taken@b.com", "hashed_password": HASHED_PASSWORD}),
+            ImportRecord(line=4, data=None, error="Invalid JSON"),
+            ImportRecord(line=5, data={"email": "c@b.com", "hashed_password": HASHED_PASSWORD}),
+        ]
+        rejects = io.StringIO()
+
+        report = await importer.run(records, rejects)
+
+        assert [len(rows) for rows in copied] == [2, 1]
+        assert progress == [1, 2]
+        assert (report.read, report.imported, report.rejected) == (5, 2, 3)
+        rejected = [json.loads(line) for line in rejects.getvalue().splitlines()]
+        assert [entry["line"] for entry in rejected] == [2, 3, 4]
+        assert rejected[1]["error"] == "User with this id or email already exists"
+
+    async def test_rejects_repeated_id_or_email_within_a_batch(self) -> None:
+        importer = UserCopyImporter(engine=build_engine(), mapper=get_mapper(), batch_size=10)
+        copied: list[list[dict[str, Any]]] = []
+
+        async def copy(connection: Any, rows: list[dict[str, Any]]) -> set[uuid.UUID]:
+            copied.append(rows)
+            return {row["id"] for row in rows}
+
+        importer._copy = copy  # type: ignore[method-assign]
+        user_id = str(uuid.uuid4())
+        records = [
+            ImportRecord(line=1, data={"id": user_id, "email": "a@b.com", "hashed_password": HASHED_PASSWORD}),
+            ImportRecord(line=2, data={"id": user_id, "email": "b@b.com", "hashed_password": HASHED_PASSWORD}),
+            ImportRecord(line=3, data={"email": "a@b.com", "hashed_password": HASHED_PASSWORD}),
+            ImportRecord(line=4, data={"email": "c@b.com", "hashed_password": HASHED_PASSWORD}),
+        ]
+        rejects = io.StringIO()
+
+        report = await importer.run(records, rejects)
+
+        assert [row["email"] for row in copied[0]] == ["a@b.com", "c@b.com"]
+        assert (report.read, report.imported, report.rejected) == (4, 2, 2)
+        rejected = [json.loads(line) for line in rejects.getvalue().splitlines()]
+        assert [entry["line"] for entry in rejected] == [2, 3]
+        assert {entry["error"] for entry in rejected} == {"Duplicate id or email in the same batch"}
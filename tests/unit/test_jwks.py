@@ -0,0 +1,127 @@
+import json
+from typing import Iterator
+from unittest.mock import patch
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from litestar import Litestar
+from litestar.testing import TestClient
+from pydantic import SecretStr
+
+from core.config import EmailConsoleConfig, EmailSettings, JwtKeySettings, JwtSettings, PostgresConnection, Settings
+from infrastructure.security.jwks import JwksDocument
+from infrastructure.security.jwt import SigningKey
+from interface.http.asgi import create_asgi_application
+
+
+@pytest.fixture(scope="module")
+def active_key() -> ed25519.Ed25519PrivateKey:
+    return ed25519.Ed25519PrivateKey.generate()
+
+
+@pytest.fixture(scope="module")
+def next_key() -> rsa.RSAPrivateKey:
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture
+def jwt_settings(active_key: ed25519.Ed25519PrivateKey, next_key: rsa.RSAPrivateKey) -> JwtSettings:
+    active_pem = active_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    )
+    next_public_pem = next_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    return JwtSettings(
+        keys=[
+            JwtKeySettings(kid="active", algorithm="EdDSA", private_key=SecretStr(active_pem.decode())),
+            JwtKeySettings(kid="next", algorithm="RS256", public_key=next_public_pem.decode()),
+            JwtKeySettings(kid="shared", algorithm="HS256", private_key=SecretStr("s" * 32)),
+        ],
+        signing_kid="active",
+        issuer="https://auth.example.com",
+        jwks_max_age=120,
+    )
+
+
+def build_settings(jwt_settings: JwtSettings | None) -> Settings:
+    return Settings(
+        database=PostgresConnection(name="auth", host="localhost", port=5432, username="user", password="password"),
+        email=EmailSettings(config=EmailConsoleConfig(backend="console"), from_email="noreply@example.com"),
+        jwt=jwt_settings,
+    )
+
+
+@pytest.fixture
+def client(jwt_settings: JwtSettings) -> Iterator[TestClient[Litestar]]:
+    with TestClient(app=create_asgi_application(build_settings(jwt_settings))) as client:
+        yield client
+
+
+class TestJwksDocument:
+    def test_publishes_asymmetric_keys_only(
+        self, jwt_settings: JwtSettings, active_key: ed25519.Ed25519PrivateKey
+    ) -> None:
+        document = JwksDocument.from_keys([SigningKey.from_settings(key) for key in jwt_settings.keys], max_age=60)
+
+        keys = json.loads(document.body)["keys"]
+
+        assert [(key["kid"], key["alg"], key["use"]) for key in keys] == [
+            ("active", "EdDSA", "sig"),
+            ("next", "RS256", "sig"),
+        ]
+        assert jwt.PyJWK(keys[0]).key.public_bytes_raw() == active_key.public_key().public_bytes_raw()
+
+    def test_etag_follows_content(self, jwt_settings: JwtSettings) -> None:
+        keys = [SigningKey.from_settings(key) for key in jwt_settings.keys]
+
+        assert JwksDocument.from_keys(keys, max_age=60).etag == JwksDocument.from_keys(reversed(keys), max_age=60).etag
+        assert JwksDocument.from_keys(keys, max_age=60).etag != JwksDocument.from_keys(keys[:1], max_age=60).etag
+
+    @pytest.mark.parametrize(
+        ("if_none_match", "expected"),
+        [(None, False), ('"other"', False), ("*", True), ("{etag}", True), ('"other", W/{etag}', True)],
+    )
+    def test_matches(self, jwt_settings: JwtSettings, if_none_match: str | None, expected: bool) -> None:
+        document = JwksDocument.from_keys([SigningKey.from_settings(jwt_settings.keys[0])], max_age=60)
+
+        header = if_none_match.format(etag=document.etag) if if_none_match else None
+
+        assert document.matches(header) is expected
+
+
+class TestJwksRoute:
+    def test_serves_key_set_with_caching_headers(self, client: TestClient[Litestar]) -> None:
+        response = client.get("/.well-known/jwks.json")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.headers["cache-control"] == "public, max-age=120"
+        assert [key["kid"] for key in response.json()["keys"]] == ["active", "next"]
+
+    def test_not_modified(self, client: TestClient[Litestar]) -> None:
+        etag = client.get("/.well-known/jwks.json").headers["etag"]
+
+        response = client.get("/.well-known/jwks.json", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_not_found_without_jwt_settings(self) -> None:
+        with TestClient(app=create_asgi_application(build_settings(None))) as client:
+            response = client.get("/.well-known/jwks.json")
+
+        assert response.status_code == 404
+
+    def test_settings_are_read_at_startup(self, jwt_settings: JwtSettings) -> None:
+        with patch("interface.http.lifespan.get_settings", return_value=build_settings(jwt_settings)) as get_settings:
+            app = create_asgi_application()
+            get_settings.assert_not_called()
+
+            with TestClient(app=app) as client:
+                assert client.get("/.well-known/jwks.json").status_code == 200
+
+        assert get_settings.called
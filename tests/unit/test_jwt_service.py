@@ -0,0 +1,207 @@
+import datetime
+import json
+import time
+import uuid
+from unittest.mock import patch
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from pydantic import SecretStr
+
+from application.dto.token import TokenClaimsDTO
+from core.config import JwtKeySettings, JwtSettings
+from domain.errors import ExpiredJWTToken, InvalidJWTToken
+from infrastructure.security.hasher import TokenHasher
+from infrastructure.security.jwt import JwtTokenService, VerifiedTokenCache
+
+HS256_SECRET = "s" * 32
+
+
+def pem(private_key: rsa.RSAPrivateKey | ed25519.Ed25519PrivateKey) -> SecretStr:
+    return SecretStr(
+        private_key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+        ).decode()
+    )
+
+
+@pytest.fixture(scope="module")
+def rsa_key() -> rsa.RSAPrivateKey:
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture(scope="module")
+def ed25519_key() -> ed25519.Ed25519PrivateKey:
+    return ed25519.Ed25519PrivateKey.generate()
+
+
+@pytest.fixture
+def key_settings(rsa_key: rsa.RSAPrivateKey, ed25519_key: ed25519.Ed25519PrivateKey) -> list[JwtKeySettings]:
+    return [
+        JwtKeySettings(kid="rsa", algorithm="RS256", private_key=pem(rsa_key)),
+        JwtKeySettings(kid="ed", algorithm="EdDSA", private_key=pem(ed25519_key)),
+        JwtKeySettings(kid="hs", algorithm="HS256", private_key=SecretStr(HS256_SECRET)),
+    ]
+
+
+def build_service(key_settings: list[JwtKeySettings], signing_kid: str, cache_size: int = 100) -> JwtTokenService:
+    settings = JwtSettings(
+        keys=key_settings,
+        signing_kid=signing_kid,
+        issuer="https://auth.example.com",
+        audience="api",
+        verified_cache_size=cache_size,
+    )
+    return JwtTokenService.from_settings(settings, TokenHasher(keys={"k": b"k" * 32}, current_key_id="k"))
+
+
+class TestJwtTokenService:
+    @pytest.mark.parametrize("signing_kid", ["rsa", "ed", "hs"])
+    def test_issue_and_verify(self, key_settings: list[JwtKeySettings], signing_kid: str) -> None:
+        service = build_service(key_settings, signing_kid)
+        user_id = uuid.uuid4()
+
+        pair = service.issue(user_id, role="admin")
+
+        access = service.verify_access_token(pair.access_token.value)
+        refresh = service.verify_refresh_token(pair.refresh_token.value)
+        assert (access.subject, access.token_type, access.extra) == (user_id, "access", {"role": "admin"})
+        assert (refresh.subject, refresh.token_type) == (user_id, "refresh")
+        assert pair.access_token.header_obj["kid"] == signing_kid
+        assert pair.refresh.expires_at == refresh.expires_at
+        assert service.token_hasher.verify(refresh.token_id, pair.refresh.hashed_token)
+
+    def test_tokens_are_standard_jwts(self, key_settings: list[JwtKeySettings], rsa_key: rsa.RSAPrivateKey) -> None:
+        pair = build_service(key_settings, "rsa").issue(uuid.uuid4())
+
+        claims = jwt.decode(
+            pair.access_token.value,
+            rsa_key.public_key(),
+            algorithms=["RS256"],
+            audience="api",
+            issuer="https://auth.example.com",
+        )
+
+        assert claims["typ"] == "access"
+
+    def test_token_types_are_not_interchangeable(self, key_settings: list[JwtKeySettings]) -> None:
+        service = build_service(key_settings, "ed")
+        pair = service.issue(uuid.uuid4())
+
+        with pytest.raises(InvalidJWTToken):
+            service.verify_access_token(pair.refresh_token.value)
+        with pytest.raises(InvalidJWTToken):
+            service.verify_refresh_token(pair.access_token.value)
+
+    def test_tampered_token_is_rejected(self, key_settings: list[JwtKeySettings]) -> None:
+        service = build_service(key_settings, "rsa")
+        header, payload, signature = service.issue(uuid.uuid4()).access_token.value.split(".")
+        forged_payload = jwt.utils.base64url_encode(b'{"sub":"00000000-0000-0000-0000-000000000000"}').decode()
+
+        with pytest.raises(InvalidJWTToken):
+            service.verify_access_token(f"{header}.{forged_payload}.{signature}")
+
+    def test_algorithm_must_match_key(self, key_settings: list[JwtKeySettings]) -> None:
+        service = build_service(key_settings, "rsa")
+        forged = jwt.encode({"typ": "access"}, HS256_SECRET, algorithm="HS256", headers={"kid": "rsa", "typ": "JWT"})
+
+        with pytest.raises(InvalidJWTToken, match="algorithm"):
+            service.verify_access_token(forged)
+
+    @pytest.mark.parametrize("kid", [["rsa"], {"kid": "rsa"}, 1])
+    def test_non_string_kid_is_rejected(self, key_settings: list[JwtKeySettings], kid: object) -> None:
+        service = build_service(key_settings, "hs")
+        _, payload, signature = service.issue(uuid.uuid4()).access_token.value.split(".")
+        header = jwt.utils.base64url_encode(json.dumps({"alg": "HS256", "typ": "JWT", "kid": kid}).encode()).decode()
+        forged = f"{header}.{payload}.{signature}"
+
+        with pytest.raises(InvalidJWTToken, match="kid"):
+            service.verify_access_token(forged)
+
+    @pytest.mark.parametrize("subject", [123, ["00000000-0000-0000-0000-000000000000"], None])
+    def test_non_string_subject_is_rejected(self, key_settings: list[JwtKeySettings], subject: object) -> None:
+        service = build_service(key_settings, "hs")
+        now = int(time.time())
+        claims = {
+            "iss": "https://auth.example.com",
+            "aud": "api",
+            "sub": subject,
+            "iat": now,
+            "exp": now + 60,
+            "jti": "id",
+            "typ": "access",
+        }
+        token = jwt.encode(claims, HS256_SECRET, algorithm="HS256", headers={"kid": "hs", "typ": "JWT"})
+
+        with pytest.raises(InvalidJWTToken, match="malformed claim"):
+            service.verify_access_token(token)
+
+    def test_tokens_of_rotated_out_signing_key_stay_valid(self, key_settings: list[JwtKeySettings]) -> None:
+        pair = build_service(key_settings, "rsa").issue(uuid.uuid4())
+
+        assert build_service(key_settings, "ed").verify_access_token(pair.access_token.value)
+
+    def test_expired_token(self, key_settings: list[JwtKeySettings]) -> None:
+        service = build_service(key_settings, "hs")
+        pair = service.issue(uuid.uuid4())
+
+        with patch("infrastructure.security.jwt.time.time", return_value=pair.refresh.expires_at.timestamp()):
+            with pytest.raises(ExpiredJWTToken):
+                service.verify_refresh_token(pair.refresh_token.value)
+
+    def test_verified_access_tokens_are_cached_until_expiry(self, key_settings: list[JwtKeySettings]) -> None:
+        service = build_service(key_settings, "rsa")
+        token = service.issue(uuid.uuid4()).access_token.value
+        claims = service.verify_access_token(token)
+
+        with patch.object(service.signing_key.algorithm, "verify", side_effect=AssertionError) as verify:
+            assert service.verify_access_token(token) is claims
+            verify.assert_not_called()
+        assert service.cache.hits == 1
+
+        with patch("infrastructure.security.jwt.time.time", return_value=claims.expires_at.timestamp()):
+            with pytest.raises(ExpiredJWTToken):
+                service.verify_access_token(token)
+
+    def test_signing_key_needs_private_key(
+        self, key_settings: list[JwtKeySettings], rsa_key: rsa.RSAPrivateKey
+    ) -> None:
+        public_pem = rsa_key.public_key().public_bytes(
+            serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+        )
+        verification_only = JwtKeySettings(kid="next", algorithm="RS256", public_key=public_pem.decode())
+
+        with pytest.raises(ValueError):
+            build_service([*key_settings, verification_only], "next")
+
+
+class TestVerifiedTokenCache:
+    def claims(self, expires_at: float) -> TokenClaimsDTO:
+        now = datetime.datetime.now(datetime.UTC)
+        return TokenClaimsDTO(
+            subject=uuid.uuid4(),
+            token_id="id",
+            token_type="access",
+            issued_at=now,
+            expires_at=datetime.datetime.fromtimestamp(expires_at, datetime.UTC),
+        )
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        cache = VerifiedTokenCache(maxsize=2)
+        cache.put(b"a", self.claims(100))
+        cache.put(b"b", self.claims(100))
+
+        assert cache.get(b"a", now=0) is not None
+        cache.put(b"c", self.claims(100))
+
+        assert cache.get(b"b", now=0) is None
+        assert len(cache) == 2
+
+    def test_entry_expires_with_token(self) -> None:
+        cache = VerifiedTokenCache(maxsize=2)
+        cache.put(b"a", self.claims(100))
+
+        assert cache.get(b"a", now=100) is None
+        assert len(cache) == 0
@@ -0,0 +1,56 @@
+import uuid
+
+import pytest
+
+from domain.entities.user import User
+from domain.errors import InvalidEmail
+from domain.value_objects.email import Email
+from domain.value_objects.hashed_secret import HashedSecret
+from infrastructure.database.mapper import EntityMapper, get_mapper
+from infrastructure.database.models import UserModel
+
+HASHED_PASSWORD = "$argon2id$v=19$m=65536,t=3,p=4$c2FsdGJhc2Ux$ZGF0YWhhc2gx"
+
+
+class TestEntityMapper:
+    @pytest.fixture
+    def mapper(self) -> EntityMapper:
+        return get_mapper()
+
+    def test_load_user(self, mapper: EntityMapper) -> None:
+        model = UserModel(id=uuid.uuid4(), email="user@example.com", hashed_password=HASHED_PASSWORD, is_active=True)
+
+        user = mapper.load(model, User)
+
+        assert user == User(
+            id=model.id,
+            email=Email("user@example.com"),
+            hashed_password=HashedSecret(HASHED_PASSWORD),
+            is_active=True,
+        )
+
+    def test_dump_user(self, mapper: EntityMapper) -> None:
+        user = User.create(email=Email("user@example.com"), hashed_password=HashedSecret(HASHED_PASSWORD))
+
+        values = mapper.dump(user)
+
+        assert values == {
+            "id": user.id,
+            "email": "user@example.com",
+            "hashed_password": HASHED_PASSWORD,
+            "is_active": False,
+        }
+        assert mapper.load(UserModel(**values), User) == user
+
+    def test_load_validates_value_objects(self, mapper: EntityMapper) -> None:
+        model = UserModel(id=uuid.uuid4(), email="invalid", hashed_password=HASHED_PASSWORD, is_active=True)
+
+        with pytest.raises(InvalidEmail):
+            mapper.load(model, User)
+
+    def test_unregistered_pair_is_compiled_on_first_use(self) -> None:
+        mapper = EntityMapper()
+        model = UserModel(id=uuid.uuid4(), email="user@example.com", hashed_password=HASHED_PASSWORD, is_active=False)
+
+        assert mapper.load(model, User).id == model.id
+        assert mapper.load(model, User).id == model.id
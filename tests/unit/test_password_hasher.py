@@ -1,6 +1,18 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
-from infrastructure.security.hasher import PasswordHasher
+from core.config import HasherSettings, TokenHasherSettings
+from infrastructure.security.hasher import (
+    Argon2Hasher,
+    ExecutorHasher,
+    PasswordHasher,
+    TokenHasher,
+    create_async_hasher,
+    create_hasher_executor,
+    generate_token,
+)
 
 
 @pytest.fixture(scope="session")
@@ -15,3 +27,144 @@ def test_password_hasher(password_hasher: PasswordHasher) -> None:
 
     assert hashed_password != raw_password
     assert password_hasher.verify(raw_password, hashed_password) is True
+
+
+class TestExecutorHasher:
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    async def test_hash_and_verify(self, password_hasher: PasswordHasher, executor: str) -> None:
+        hasher = ExecutorHasher(
+            hasher=password_hasher,
+            executor=create_hasher_executor(HasherSettings(executor=executor, max_workers=2)),
+        )
+        try:
+            hashed_password = await hasher.hash("Password")
+
+            assert await hasher.verify("Password", hashed_password) is True
+            assert await hasher.verify("Wrong", hashed_password) is False
+        finally:
+            hasher.shutdown()
+
+    async def test_event_loop_keeps_running_while_hashing(self, password_hasher: PasswordHasher) -> None:
+        hasher = ExecutorHasher(hasher=password_hasher, executor=create_hasher_executor(HasherSettings()))
+        ticks = 0
+
+        async def tick() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        ticker = asyncio.create_task(tick())
+        try:
+            await hasher.hash("Password")
+        finally:
+            ticker.cancel()
+            hasher.shutdown()
+
+        assert ticks > 1
+
+
+def test_executor_defaults_to_cpu_count(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("infrastructure.security.hasher.os.cpu_count", lambda: 3)
+
+    executor = create_hasher_executor(HasherSettings())
+
+    assert isinstance(executor, ThreadPoolExecutor)
+    assert executor._max_workers == 3
+    executor.shutdown()
+
+
+class TestTokenHasher:
+    OLD_KEY = b"o" * 32
+    NEW_KEY = b"n" * 32
+
+    @pytest.fixture
+    def token_hasher(self) -> TokenHasher:
+        return TokenHasher(keys={"old": self.OLD_KEY, "new": self.NEW_KEY}, current_key_id="new")
+
+    def test_hash_is_deterministic_and_verifiable(self, token_hasher: TokenHasher) -> None:
+        token = generate_token()
+
+        hashed_token = token_hasher.hash(token)
+
+        assert hashed_token == token_hasher.hash(token)
+        assert hashed_token.algorithm == "hmac-sha256"
+        assert hashed_token.salt == "new"
+        assert token_hasher.verify(token, hashed_token) is True
+        assert token_hasher.verify(generate_token(), hashed_token) is False
+
+    def test_tokens_hashed_before_rotation_are_verified(self) -> None:
+        token = generate_token()
+        hashed_token = TokenHasher(keys={"old": self.OLD_KEY}, current_key_id="old").hash(token)
+        rotated = TokenHasher(keys={"old": self.OLD_KEY, "new": self.NEW_KEY}, current_key_id="new")
+
+        assert rotated.verify(token, hashed_token) is True
+        assert rotated.lookup_hashes(token)[1] == hashed_token
+        assert rotated.lookup_hashes(token)[0] == rotated.hash(token)
+
+    def test_retired_key_and_foreign_hashes_are_rejected(
+        self, token_hasher: TokenHasher, password_hasher: PasswordHasher
+    ) -> None:
+        token = generate_token()
+        hashed_token = TokenHasher(keys={"retired": self.OLD_KEY}, current_key_id="retired").hash(token)
+
+        assert token_hasher.verify(token, hashed_token) is False
+        assert token_hasher.verify(token, password_hasher.hash(token)) is False
+
+    @pytest.mark.parametrize(
+        ("keys", "current_key_id"),
+        [({"a": b"k" * 32}, "b"), ({"a": b"short"}, "a"), ({"a$b": b"k" * 32}, "a$b")],
+    )
+    def test_invalid_configuration(self, keys: dict[str, bytes], current_key_id: str) -> None:
+        with pytest.raises(ValueError):
+            TokenHasher(keys=keys, current_key_id=current_key_id)
+
+    def test_verify_and_update_rehashes_under_current_key(self) -> None:
+        token = generate_token()
+        hashed_token = TokenHasher(keys={"old": self.OLD_KEY}, current_key_id="old").hash(token)
+        rotated = TokenHasher(keys={"old": self.OLD_KEY, "new": self.NEW_KEY}, current_key_id="new")
+
+        assert rotated.verify_and_update(token, hashed_token) == (True, rotated.hash(token))
+        assert rotated.verify_and_update(token, rotated.hash(token)) == (True, None)
+        assert rotated.verify_and_update(generate_token(), hashed_token) == (False, None)
+
+    def test_from_settings(self) -> None:
+        settings = TokenHasherSettings(keys={"a": "k" * 32}, current_key_id="a")
+
+        assert TokenHasher.from_settings(settings).keys == {"a": b"k" * 32}
+
+
+def test_argon2_hasher_uses_configured_cost() -> None:
+    hasher = Argon2Hasher.from_settings(HasherSettings(time_cost=1, memory_cost=8192, parallelism=2))
+
+    hashed_password = hasher.hash("Password")
+
+    assert hashed_password.options == "v=19$m=8192,t=1,p=2"
+    assert hasher.verify("Password", hashed_password) is True
+
+
+class TestVerifyAndUpdate:
+    async def test_outdated_parameters_are_rehashed(self) -> None:
+        old = Argon2Hasher(time_cost=1, memory_cost=8192, parallelism=1)
+        current = Argon2Hasher(time_cost=2, memory_cost=8192, parallelism=1)
+        hashed_password = old.hash("Password")
+
+        verified, updated = current.verify_and_update("Password", hashed_password)
+
+        assert verified is True
+        assert updated is not None and updated.options == "v=19$m=8192,t=2,p=1"
+        assert current.verify_and_update("Password", updated) == (True, None)
+        assert current.verify_and_update("Wrong", hashed_password) == (False, None)
+
+    async def test_async_hasher_passes_through(self) -> None:
+        hasher = create_async_hasher(
+            Argon2Hasher(time_cost=2, memory_cost=8192, parallelism=1),
+            ThreadPoolExecutor(max_workers=1),
+            HasherSettings(),
+        )
+        hashed_password = Argon2Hasher(time_cost=1, memory_cost=8192, parallelism=1).hash("Password")
+
+        verified, updated = await hasher.verify_and_update("Password", hashed_password)
+
+        assert verified is True and updated is not None
+        assert hasher.statistics().admitted == 1
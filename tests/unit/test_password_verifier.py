@@ -0,0 +1,61 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from application.services.password import PasswordVerifier
+from domain.entities.user import User
+from domain.value_objects.email import Email
+from domain.value_objects.hashed_secret import HashedSecret
+
+OLD_HASH = HashedSecret("$argon2id$v=19$m=8192,t=1,p=1$c2FsdA$b2xk")
+NEW_HASH = HashedSecret("$argon2id$v=19$m=8192,t=2,p=1$c2FsdA$bmV3")
+
+
+@pytest.fixture
+def user() -> User:
+    return User.create(email=Email("a@b.com"), hashed_password=OLD_HASH)
+
+
+@pytest.fixture
+def users() -> MagicMock:
+    users = MagicMock()
+    users.update_hashed_password = AsyncMock(return_value=True)
+    return users
+
+
+def build_verifier(users: MagicMock, result: tuple[bool, HashedSecret | None]) -> PasswordVerifier:
+    hasher = MagicMock()
+    hasher.verify_and_update = AsyncMock(return_value=result)
+    return PasswordVerifier(hasher=hasher, users=users)
+
+
+class TestPasswordVerifier:
+    async def test_outdated_hash_is_stored(self, user: User, users: MagicMock) -> None:
+        verifier = build_verifier(users, (True, NEW_HASH))
+
+        assert await verifier.verify(user, "Password") is True
+
+        users.update_hashed_password.assert_awaited_once_with(user, NEW_HASH)
+        assert user.hashed_password == NEW_HASH
+
+    async def test_current_hash_is_left_alone(self, user: User, users: MagicMock) -> None:
+        assert await build_verifier(users, (True, None)).verify(user, "Password") is True
+
+        users.update_hashed_password.assert_not_awaited()
+
+    async def test_wrong_password(self, user: User, users: MagicMock) -> None:
+        assert await build_verifier(users, (False, None)).verify(user, "Wrong") is False
+
+        users.update_hashed_password.assert_not_awaited()
+
+    async def test_concurrent_change_keeps_loaded_hash(self, user: User, users: MagicMock) -> None:
+        users.update_hashed_password.return_value = False
+
+        assert await build_verifier(users, (True, NEW_HASH)).verify(user, "Password") is True
+        assert user.hashed_password == OLD_HASH
+
+    async def test_failed_upgrade_does_not_fail_login(self, user: User, users: MagicMock) -> None:
+        users.update_hashed_password.side_effect = ConnectionError()
+
+        assert await build_verifier(users, (True, NEW_HASH)).verify(user, "Password") is True
+        assert user.hashed_password == OLD_HASH
@@ -0,0 +1,188 @@
+import uuid
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from domain.entities.user import User
+from domain.value_objects.email import Email
+from domain.value_objects.hashed_secret import HashedSecret
+from infrastructure.database.models import UserModel
+from infrastructure.database.repository.user import UserRepository
+from infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
+
+
+class TestBaseSQLAlchemyRepository:
+    async def test_add_many_uses_single_insert_returning(self, session_factory: MagicMock) -> None:
+        mapper = MagicMock()
+        mapper.dump.side_effect = lambda entity: {"email": entity, "hashed_password": "hash"}
+        mapper.load.side_effect = lambda model, entity_type: model
+        repository = UserRepository(session_factory, UserModel, MagicMock(), mapper)
+        returned = [UserModel(email="a@b.com"), UserModel(email="c@d.com")]
+
+        session = session_factory()
+        session_factory.side_effect = None
+        session_factory.return_value = session
+        session.scalars.return_value.all.return_value = returned
+
+        result = await repository.add_many(["a@b.com", "c@d.com"])
+
+        assert result == returned
+        session.scalars.assert_awaited_once()
+        stmt, values = session.scalars.await_args.args
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("INSERT INTO users")
+        assert "RETURNING" in sql
+        assert values == [
+            {"email": "a@b.com", "hashed_password": "hash"},
+            {"email": "c@d.com", "hashed_password": "hash"},
+        ]
+        session.refresh.assert_not_called()
+
+    async def test_add_many_empty(self, session_factory: MagicMock) -> None:
+        repository = UserRepository(session_factory, UserModel, MagicMock(), MagicMock())
+
+        assert await repository.add_many([]) == []
+        session_factory.assert_not_called()
+
+    async def test_iter_many_paginates_by_primary_key(self, session_factory: MagicMock) -> None:
+        mapper = MagicMock()
+        mapper.load.side_effect = lambda model, entity_type: model.email
+        repository = UserRepository(session_factory, UserModel, MagicMock(), mapper)
+        batches = [
+            [UserModel(id=uuid.UUID(int=1), email="a@b.com"), UserModel(id=uuid.UUID(int=2), email="c@d.com")],
+            [UserModel(id=uuid.UUID(int=3), email="e@f.com")],
+        ]
+        statements = []
+
+        async def execute(stmt, params):
+            statements.append(stmt)
+            result = MagicMock()
+            result.scalars.return_value.all.return_value = batches[len(statements) - 1]
+            return result
+
+        session = session_factory()
+        session_factory.side_effect = None
+        session_factory.return_value = session
+        session.execute.side_effect = execute
+
+        async with SQLAlchemyUnitOfWork(session_factory):
+            emails = [email async for email in repository.iter_many(batch_size=2, is_active=True)]
+
+        assert emails == ["a@b.com", "c@d.com", "e@f.com"]
+        assert len(statements) == 2
+        first, second = (stmt.compile(dialect=postgresql.dialect()) for stmt in statements)
+        assert "ORDER BY users.id" in str(first)
+        assert "users.id >" not in str(first)
+        assert "users.id >" in str(second)
+        assert second.params["id_1"] == uuid.UUID(int=2)
+        assert second.params["param_1"] == 2
+        assert session.expunge.call_count == 3
+
+    async def test_iter_many_keeps_objects_the_unit_of_work_already_held(self) -> None:
+        session = AsyncSession()
+        session.commit = AsyncMock()  # type: ignore[method-assign]
+        session.close = AsyncMock()  # type: ignore[method-assign]
+        changed = UserModel(id=uuid.UUID(int=1), email="old@b.com", hashed_password="hash", is_active=True)
+        loaded = UserModel(id=uuid.UUID(int=2), email="c@d.com", hashed_password="hash", is_active=True)
+        make_transient_to_detached(changed)
+        session.add(changed)
+
+        async def execute(stmt: Any, params: Any) -> MagicMock:
+            make_transient_to_detached(loaded)
+            session.add(loaded)
+            result = MagicMock()
+            result.scalars.return_value.all.return_value = [changed, loaded]
+            return result
+
+        session.execute = execute  # type: ignore[method-assign,assignment]
+        mapper = MagicMock()
+        mapper.load.side_effect = lambda model, entity_type: model.email
+        repository = UserRepository(MagicMock(return_value=session), UserModel, MagicMock(), mapper)
+
+        async with SQLAlchemyUnitOfWork(MagicMock(return_value=session)):
+            changed.email = "new@b.com"
+            emails = [email async for email in repository.iter_many(batch_size=10)]
+
+            assert emails == ["new@b.com", "c@d.com"]
+            assert changed in session
+            assert session.is_modified(changed)
+            assert loaded not in session
+
+    async def test_iter_many_rejects_invalid_batch_size(self, session_factory: MagicMock) -> None:
+        repository = UserRepository(session_factory, UserModel, MagicMock(), MagicMock())
+
+        with pytest.raises(ValueError):
+            _ = [entity async for entity in repository.iter_many(batch_size=0)]
+
+    async def test_lookup_statements_are_reused(self, session_factory: MagicMock) -> None:
+        repository = UserRepository(session_factory, UserModel, MagicMock(), MagicMock())
+
+        await repository.exists(email="a@b.com")
+        await repository.exists(email="c@d.com")
+        await repository.exists(email=None)
+
+        first, second, third = (session.execute.await_args for session in session_factory.sessions)
+        assert first.args[0] is second.args[0]
+        assert first.args[1] == {"email": "a@b.com"}
+        assert second.args[1] == {"email": "c@d.com"}
+        assert third.args[0] is not first.args[0]
+        assert "IS NULL" in str(third.args[0].compile(dialect=postgresql.dialect()))
+
+    async def test_upsert_many_counts_inserted_and_updated(self, session_factory: MagicMock) -> None:
+        mapper = MagicMock()
+        mapper.dump.side_effect = lambda email: {"id": uuid.uuid4(), "email": email, "hashed_password": "hash"}
+        repository = UserRepository(session_factory, UserModel, MagicMock(), mapper)
+        returned = [
+            [(uuid.UUID(int=1), True), (uuid.UUID(int=2), False)],
+            [(uuid.UUID(int=3), True)],
+        ]
+
+        session = session_factory()
+        session_factory.side_effect = None
+        session_factory.return_value = session
+        session.execute.return_value.tuples.side_effect = returned
+
+        result = await repository.upsert_many(["a@b.com", "c@d.com", "e@f.com"], ["email"], batch_size=2)
+
+        assert (result.inserted, result.updated) == (2, 1)
+        assert result.ids == [uuid.UUID(int=1), uuid.UUID(int=2), uuid.UUID(int=3)]
+        assert session.execute.await_count == 2
+        session.commit.assert_awaited_once()
+        stmt, values = session.execute.await_args_list[0].args
+        assert len(values) == 2
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (email) DO UPDATE SET hashed_password = excluded.hashed_password" in sql
+        assert "id = excluded.id" not in sql
+        assert "RETURNING users.id, xmax = 0" in sql
+
+    async def test_upsert_many_do_nothing(self, session_factory: MagicMock) -> None:
+        repository = UserRepository(session_factory, UserModel, MagicMock(), MagicMock())
+
+        stmt = repository._upsert_statement(["id", "email", "hashed_password"], ["email"], [])
+
+        assert "ON CONFLICT (email) DO NOTHING" in str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class TestUserRepository:
+    async def test_update_hashed_password_only_replaces_the_loaded_hash(self, session_factory: MagicMock) -> None:
+        repository = UserRepository(session_factory, UserModel, MagicMock(), MagicMock())
+        user = User.create(
+            email=Email("a@b.com"), hashed_password=HashedSecret("$argon2id$v=19$m=8,t=1,p=1$c2FsdA$b2xk")
+        )
+        new_hash = HashedSecret("$argon2id$v=19$m=16,t=2,p=1$c2FsdA$bmV3")
+        session = session_factory()
+        session_factory.side_effect = None
+        session_factory.return_value = session
+        session.execute.return_value.rowcount = 1
+
+        assert await repository.update_hashed_password(user, new_hash) is True
+
+        stmt = session.execute.await_args.args[0]
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        assert "AND users.hashed_password = %(hashed_password_1)s" in str(compiled)
+        assert compiled.params["hashed_password_1"] == user.hashed_password.value
+        assert compiled.params["hashed_password"] == new_hash.value
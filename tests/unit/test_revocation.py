@@ -0,0 +1,148 @@
+import datetime
+
+import pytest
+
+from domain.value_objects.hashed_secret import HashedSecret
+from infrastructure.security.revocation import BloomFilter, RevocationFilter
+
+EXPIRES_AT = datetime.datetime(2100, 1, 1, tzinfo=datetime.UTC)
+
+
+def digest(index: int) -> HashedSecret:
+    return HashedSecret(f"$hmac-sha256$v=1$k1$token{index:08d}")
+
+
+class FakeRevokedTokenRepository:
+    def __init__(self) -> None:
+        self.rows: dict[str, datetime.datetime] = {}
+        self.exists_calls = 0
+        self.now = datetime.datetime(2025, 6, 14, 12, 0)
+
+    async def add(self, hashed_token: HashedSecret, expires_at: datetime.datetime) -> None:
+        self.now += datetime.timedelta(seconds=1)
+        self.rows.setdefault(hashed_token.as_generic_type(), self.now)
+
+    async def exists(self, hashed_token: HashedSecret) -> bool:
+        self.exists_calls += 1
+        return hashed_token.as_generic_type() in self.rows
+
+    async def get_revoked_after(
+        self, revoked_at: datetime.datetime, hashed_token: str = "", *, limit: int = 10_000
+    ) -> list[tuple[str, datetime.datetime]]:
+        rows = sorted((at, token) for token, at in self.rows.items() if (at, token) > (revoked_at, hashed_token))
+        return [(token, at) for at, token in rows[:limit]]
+
+
+class TestBloomFilter:
+    def test_has_no_false_negatives(self) -> None:
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for index in range(1000):
+            bloom.add(f"key-{index}")
+
+        assert all(f"key-{index}" in bloom for index in range(1000))
+        # A new key whose bits are all set already is indistinguishable from a repeat.
+        assert 990 <= bloom.count <= 1000
+
+    def test_false_positive_rate_stays_near_target(self) -> None:
+        bloom = BloomFilter(capacity=2000, error_rate=0.01)
+        for index in range(2000):
+            bloom.add(f"key-{index}")
+
+        false_positives = sum(f"other-{index}" in bloom for index in range(20_000))
+
+        assert false_positives / 20_000 < 0.02
+        assert bloom.estimated_false_positive_rate == pytest.approx(0.01, rel=0.2)
+
+    def test_adding_a_key_twice_counts_once(self) -> None:
+        bloom = BloomFilter(capacity=100, error_rate=0.01)
+        bloom.add("key")
+        bloom.add("key")
+
+        assert bloom.count == 1
+
+
+class TestRevocationFilter:
+    @pytest.fixture
+    def repository(self) -> FakeRevokedTokenRepository:
+        return FakeRevokedTokenRepository()
+
+    @pytest.fixture
+    def revocations(self, repository: FakeRevokedTokenRepository) -> RevocationFilter:
+        return RevocationFilter(repository=repository, capacity=1000, error_rate=0.001)  # type: ignore[arg-type]
+
+    async def test_queries_the_database_until_loaded(
+        self, revocations: RevocationFilter, repository: FakeRevokedTokenRepository
+    ) -> None:
+        await repository.add(digest(1), EXPIRES_AT)
+
+        assert await revocations.is_revoked(digest(1))
+        assert not await revocations.is_revoked(digest(2))
+        assert repository.exists_calls == 2
+
+    async def test_definite_miss_skips_the_database(
+        self, revocations: RevocationFilter, repository: FakeRevokedTokenRepository
+    ) -> None:
+        await repository.add(digest(1), EXPIRES_AT)
+        assert await revocations.rebuild() == 1
+
+        assert not await revocations.is_revoked(digest(2))
+        assert await revocations.is_revoked(digest(1))
+
+        assert repository.exists_calls == 1
+        statistics = revocations.statistics()
+        assert (statistics.lookups, statistics.definite_misses, statistics.false_positives) == (2, 1, 0)
+        assert statistics.entries == 1
+        assert statistics.size_bytes > 0
+
+    async def test_sync_loads_only_new_revocations(
+        self, revocations: RevocationFilter, repository: FakeRevokedTokenRepository
+    ) -> None:
+        await repository.add(digest(1), EXPIRES_AT)
+        repository.now += datetime.timedelta(minutes=5)
+        await repository.add(digest(2), EXPIRES_AT)
+        await revocations.rebuild()
+
+        repository.now += datetime.timedelta(minutes=5)
+        await repository.add(digest(3), EXPIRES_AT)
+
+        # The overlap re-reads digest(2), but not the older digest(1).
+        assert await revocations.sync() == 2
+        assert await revocations.is_revoked(digest(3))
+
+    async def test_first_sync_loads_everything(
+        self, revocations: RevocationFilter, repository: FakeRevokedTokenRepository
+    ) -> None:
+        await repository.add(digest(1), EXPIRES_AT)
+
+        assert await revocations.sync() == 1
+        assert not await revocations.is_revoked(digest(2))
+        assert repository.exists_calls == 0
+
+    async def test_load_pages_through_revocations(
+        self, revocations: RevocationFilter, repository: FakeRevokedTokenRepository, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("infrastructure.security.revocation.SYNC_BATCH_SIZE", 2)
+        for index in range(5):
+            await repository.add(digest(index), EXPIRES_AT)
+
+        assert await revocations.rebuild() == 5
+        assert all([await revocations.is_revoked(digest(index)) for index in range(5)])
+
+    async def test_local_revocation_is_visible_at_once(
+        self, revocations: RevocationFilter, repository: FakeRevokedTokenRepository
+    ) -> None:
+        await revocations.rebuild()
+
+        await revocations.revoke(digest(3), EXPIRES_AT)
+
+        assert await revocations.is_revoked(digest(3))
+
+    async def test_sync_rebuilds_an_overfull_filter(
+        self, revocations: RevocationFilter, repository: FakeRevokedTokenRepository
+    ) -> None:
+        await revocations.rebuild()
+        for index in range(1001):
+            await revocations.revoke(digest(index), EXPIRES_AT)
+
+        assert await revocations.sync() == 1001
+        assert revocations.statistics().estimated_false_positive_rate < 0.001
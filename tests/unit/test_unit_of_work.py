@@ -0,0 +1,76 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from infrastructure.database.models import UserModel
+from infrastructure.database.repository.revoked_token import RevokedTokenRepository
+from infrastructure.database.repository.user import UserRepository
+from infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork, get_current_session
+
+
+class TestSQLAlchemyUnitOfWork:
+    @pytest.fixture
+    def repository(self, session_factory: MagicMock) -> UserRepository:
+        return UserRepository(session_factory, UserModel, MagicMock(), MagicMock())
+
+    async def test_repository_without_unit_of_work_commits_each_call(
+        self, session_factory: MagicMock, repository: UserRepository
+    ) -> None:
+        await repository.update({"email": "a@b.com"}, {"is_active": True})
+        await repository.delete(email="a@b.com")
+
+        assert session_factory.call_count == 2
+        for session in session_factory.sessions:
+            session.commit.assert_awaited_once()
+            session.flush.assert_not_awaited()
+
+    async def test_repositories_share_session_and_commit_once(
+        self, session_factory: MagicMock, repository: UserRepository
+    ) -> None:
+        async with SQLAlchemyUnitOfWork(session_factory) as uow:
+            session = uow.session
+            assert get_current_session() is session
+            await repository.exists(email="a@b.com")
+            await repository.update({"email": "a@b.com"}, {"is_active": True})
+            await repository.delete(email="c@d.com")
+
+        assert session_factory.call_count == 1
+        assert session.execute.await_count == 3
+        assert session.flush.await_count == 2
+        session.commit.assert_awaited_once()
+        session.rollback.assert_not_awaited()
+        session.close.assert_awaited_once()
+        assert get_current_session() is None
+
+    async def test_other_repositories_join_the_unit_of_work(self, session_factory: MagicMock) -> None:
+        revoked_tokens = RevokedTokenRepository(session_factory)
+
+        async with SQLAlchemyUnitOfWork(session_factory) as uow:
+            session = uow.session
+            await revoked_tokens.delete_expired()
+
+        assert session_factory.call_count == 1
+        session.flush.assert_awaited_once()
+        session.commit.assert_awaited_once()
+
+    async def test_rollback_on_error(self, session_factory: MagicMock, repository: UserRepository) -> None:
+        with pytest.raises(ValueError):
+            async with SQLAlchemyUnitOfWork(session_factory) as uow:
+                session = uow.session
+                await repository.delete(email="a@b.com")
+                raise ValueError()
+
+        session.commit.assert_not_awaited()
+        session.rollback.assert_awaited_once()
+        session.close.assert_awaited_once()
+        assert get_current_session() is None
+
+    async def test_nested_unit_of_work_is_rejected(self, session_factory: MagicMock) -> None:
+        async with SQLAlchemyUnitOfWork(session_factory):
+            with pytest.raises(RuntimeError):
+                async with SQLAlchemyUnitOfWork(session_factory):
+                    pass
+
+    def test_session_is_unavailable_outside_of_block(self, session_factory: MagicMock) -> None:
+        with pytest.raises(RuntimeError):
+            _ = SQLAlchemyUnitOfWork(session_factory).session
@@ -0,0 +1,260 @@
+import asyncio
+import contextvars
+import dataclasses
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from redis.exceptions import ConnectionError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from application.dto.upsert_result import UpsertResultDTO
+from domain.entities.user import User
+from domain.value_objects.email import Email
+from domain.value_objects.hashed_secret import HashedSecret
+from infrastructure.cache.user import CachedUserRepository, dump_user, load_user
+from infrastructure.database.replicas import is_primary_read_forced
+from infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+        self.expirations: dict[str, int] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: bytes, ex: int) -> None:
+        self.data[key] = value
+        self.expirations[key] = ex
+
+    async def delete(self, *keys: str) -> int:
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis: FakeRedis) -> None:
+        self.redis = redis
+        self.commands: list[tuple[str, bytes, int]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+    def set(self, key: str, value: bytes, ex: int) -> None:
+        self.commands.append((key, value, ex))
+
+    async def execute(self) -> None:
+        for command in self.commands:
+            await self.redis.set(*command)
+
+
+@pytest.fixture
+def user() -> User:
+    return User.create(
+        email=Email("User@Example.com"),
+        hashed_password=HashedSecret("$argon2id$v=19$m=65536,t=3,p=4$c2FsdGJhc2Ux$ZGF0YWhhc2gx"),
+        is_active=True,
+    )
+
+
+@pytest.fixture
+def redis() -> FakeRedis:
+    return FakeRedis()
+
+
+@pytest.fixture
+def repository(user: User) -> MagicMock:
+    repository = MagicMock()
+    repository.get = AsyncMock(return_value=user)
+    repository.get_many = AsyncMock(return_value=[user])
+    repository.update = AsyncMock(return_value=1)
+    repository.delete = AsyncMock(return_value=1)
+    repository.count = AsyncMock(return_value=1)
+    return repository
+
+
+@pytest.fixture
+def cached_repository(repository: MagicMock, redis: FakeRedis) -> CachedUserRepository:
+    return CachedUserRepository(repository=repository, redis=redis, ttl=300, negative_ttl=30)
+
+
+def test_serialization_round_trip(user: User) -> None:
+    assert load_user(dump_user(user)) == user
+
+
+class TestCachedUserRepository:
+    async def test_get_by_id_is_read_through(
+        self, cached_repository: CachedUserRepository, repository: MagicMock, user: User
+    ) -> None:
+        assert await cached_repository.get(id=user.id) == user
+        assert await cached_repository.get(id=user.id) == user
+        assert await cached_repository.get(email="user@example.com") == user
+
+        repository.get.assert_awaited_once_with(id=user.id)
+
+    async def test_cache_is_filled_from_primary(
+        self, cached_repository: CachedUserRepository, repository: MagicMock, user: User
+    ) -> None:
+        primary_reads: list[bool] = []
+
+        async def get(**filters: Any) -> User:
+            primary_reads.append(is_primary_read_forced())
+            return user
+
+        repository.get.side_effect = get
+
+        await cached_repository.get(id=user.id)
+        await cached_repository.get(email=user.email, is_active=True)
+
+        assert primary_reads == [True, False]
+
+    @pytest.mark.parametrize("write", ["update", "delete"])
+    async def test_writes_find_affected_users_on_primary(
+        self, cached_repository: CachedUserRepository, repository: MagicMock, redis: FakeRedis, user: User, write: str
+    ) -> None:
+        await cached_repository.get(id=user.id)
+
+        async def get_many(**filters: Any) -> list[User]:
+            # The lagging replica does not see the user yet.
+            return [user] if is_primary_read_forced() else []
+
+        repository.get_many.side_effect = get_many
+
+        if write == "update":
+            await cached_repository.update({"is_active": True}, {"is_active": False})
+        else:
+            await cached_repository.delete(is_active=True)
+
+        assert redis.data == {}
+
+    async def test_negative_caching(
+        self, cached_repository: CachedUserRepository, repository: MagicMock, redis: FakeRedis
+    ) -> None:
+        repository.get.return_value = None
+
+        assert await cached_repository.get(email="missing@example.com") is None
+        assert await cached_repository.get(email="missing@example.com") is None
+
+        repository.get.assert_awaited_once()
+        assert redis.expirations["user:email:missing@example.com"] == 30
+
+    async def test_other_filters_bypass_cache(
+        self, cached_repository: CachedUserRepository, repository: MagicMock, redis: FakeRedis, user: User
+    ) -> None:
+        await cached_repository.get(email=user.email, is_active=True)
+        await cached_repository.get(email=user.email, is_active=True)
+
+        assert repository.get.await_count == 2
+        assert redis.data == {}
+
+    async def test_update_invalidates_old_and_new_email(
+        self, cached_repository: CachedUserRepository, redis: FakeRedis, user: User
+    ) -> None:
+        await cached_repository.get(id=user.id)
+        redis.data["user:email:new@example.com"] = b""
+
+        await cached_repository.update({"id": user.id}, {"email": "new@example.com"})
+
+        assert redis.data == {}
+
+    async def test_delete_invalidates(
+        self, cached_repository: CachedUserRepository, redis: FakeRedis, user: User
+    ) -> None:
+        await cached_repository.get(id=user.id)
+
+        assert await cached_repository.delete(id=user.id) == 1
+        assert redis.data == {}
+
+    async def test_add_drops_negative_entry(
+        self, cached_repository: CachedUserRepository, repository: MagicMock, redis: FakeRedis, user: User
+    ) -> None:
+        repository.get.return_value = None
+        await cached_repository.get(email=user.email)
+        repository.add = AsyncMock(return_value=user)
+
+        await cached_repository.add(user)
+
+        assert redis.data == {}
+
+    async def test_redis_errors_fall_back_to_repository(
+        self, cached_repository: CachedUserRepository, repository: MagicMock, redis: FakeRedis, user: User
+    ) -> None:
+        redis.get = AsyncMock(side_effect=ConnectionError())
+
+        assert await cached_repository.get(id=user.id) == user
+        repository.get.assert_awaited_once_with(id=user.id)
+
+    async def test_upsert_many_invalidates_ids_and_emails(
+        self, cached_repository: CachedUserRepository, repository: MagicMock, redis: FakeRedis, user: User
+    ) -> None:
+        await cached_repository.get(id=user.id)
+        repository.upsert_many = AsyncMock(return_value=UpsertResultDTO(inserted=0, updated=1, ids=[user.id]))
+
+        result = await cached_repository.upsert_many([user], ["email"])
+
+        assert result.updated == 1
+        assert redis.data == {}
+
+    async def test_upsert_many_on_id_invalidates_previous_email(
+        self, cached_repository: CachedUserRepository, repository: MagicMock, redis: FakeRedis, user: User
+    ) -> None:
+        await cached_repository.get(id=user.id)
+        renamed = dataclasses.replace(user, email=Email("renamed@example.com"))
+        repository.upsert_many = AsyncMock(return_value=UpsertResultDTO(inserted=0, updated=1, ids=[user.id]))
+
+        async def get_emails(ids: list[Any]) -> list[str]:
+            assert is_primary_read_forced()
+            return [str(user.email)] if ids == [user.id] else []
+
+        repository.get_emails = AsyncMock(side_effect=get_emails)
+
+        await cached_repository.upsert_many([renamed], ["id"])
+
+        assert redis.data == {}
+
+    async def test_update_hashed_password_invalidates(
+        self, cached_repository: CachedUserRepository, repository: MagicMock, redis: FakeRedis, user: User
+    ) -> None:
+        await cached_repository.get(id=user.id)
+        repository.update_hashed_password = AsyncMock(return_value=True)
+
+        assert await cached_repository.update_hashed_password(user, user.hashed_password) is True
+        assert redis.data == {}
+
+    async def test_unit_of_work_invalidates_after_commit(
+        self, cached_repository: CachedUserRepository, repository: MagicMock, redis: FakeRedis, user: User
+    ) -> None:
+        async def concurrent_get() -> User | None:
+            # Another request, outside the unit of work, still sees the committed row.
+            task = asyncio.create_task(cached_repository.get(id=user.id), context=contextvars.Context())
+            return await task
+
+        async with SQLAlchemyUnitOfWork(async_sessionmaker()):
+            await cached_repository.update({"id": user.id}, {"is_active": False})
+            assert await concurrent_get() == user
+            assert "user:id:" + user.id.hex in redis.data
+
+        assert redis.data == {}
+        deactivated = dataclasses.replace(user, is_active=False)
+        repository.get.return_value = deactivated
+        assert await cached_repository.get(id=user.id) == deactivated
+
+    async def test_unit_of_work_rollback_keeps_cache(
+        self, cached_repository: CachedUserRepository, redis: FakeRedis, user: User
+    ) -> None:
+        await cached_repository.get(id=user.id)
+        cached = dict(redis.data)
+
+        with pytest.raises(RuntimeError):
+            async with SQLAlchemyUnitOfWork(async_sessionmaker()):
+                await cached_repository.delete(id=user.id)
+                raise RuntimeError
+
+        assert redis.data == cached